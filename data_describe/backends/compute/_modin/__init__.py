@@ -1,3 +1,6 @@
+from data_describe.core.correlation import (  # noqa: F401
+    _modin_compute_correlation_matrix as compute_correlation_matrix,
+)
 from data_describe.core.summary import (  # noqa: F401
     _modin_compute_data_summary as compute_data_summary,
 )
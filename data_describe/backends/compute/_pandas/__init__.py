@@ -30,4 +30,5 @@ from data_describe.core.distributions import (  # noqa: F401
 )
 from data_describe.core.correlation import (  # noqa: F401
     _pandas_compute_correlation_matrix as compute_correlation_matrix,
+    _pandas_compute_correlated_pairs as compute_correlated_pairs,
 )
@@ -7,11 +7,30 @@ import pandas as pd
 
 _global_config: Dict = {
     "backends": {"compute": "pandas", "viz": "seaborn"},
+    "compute": {"n_jobs": 1},
+    "correlation": {
+        "chunksize": 100000,
+        "block_size": 1024,
+        "bins": 10,
+        "bootstrap": False,
+        "bootstrap_replicates": 100,
+        "bootstrap_blocks": 20,
+        "confidence": 0.95,
+    },
+    "heatmap": {"bins": 1000},
     "display": {
         "matplotlib": {"fig_height": 10, "fig_width": 10},
         "plotly": {"fig_height": 750, "fig_width": 750, "title_size": 25},
     },
     "sensitive_data": {"score_threshold": 0.2, "sample_size": 100},
+    "summary": {
+        "chunksize": 100000,
+        "approximate": False,
+        "distinct_error": 0.01,
+        "heavy_hitters_capacity": 1000,
+        "memory_sample_size": 1000,
+        "modin_exact": False,
+    },
 }
 
 
@@ -3,7 +3,10 @@
 This subpackage contains commonly used (core) features of data-describe.
 """
 from data_describe.core.clustering import cluster  # noqa: F401
-from data_describe.core.correlation import correlation_matrix  # noqa: F401
+from data_describe.core.correlation import (  # noqa: F401
+    correlation_matrix,
+    correlated_pairs,
+)
 from data_describe.core.heatmap import data_heatmap  # noqa: F401
 from data_describe.core.summary import data_summary  # noqa: F401
 from data_describe.core.distributions import distribution  # noqa: F401
@@ -1,10 +1,15 @@
+import os
 import warnings
+from collections.abc import Iterable
+from typing import List, Optional
 
 import pandas as pd
+from pandas.api.types import is_bool_dtype, is_numeric_dtype
 import numpy as np
 from scipy.cluster import hierarchy
-from sklearn.metrics import matthews_corrcoef
-from scipy.stats import chi2_contingency
+from scipy import sparse
+from scipy.sparse.linalg import eigsh
+from scipy.stats import kendalltau, norm
 import seaborn as sns
 import matplotlib.pyplot as plt
 import plotly.graph_objs as go
@@ -12,8 +17,10 @@ import plotly.offline as po
 
 from data_describe.config._config import get_option
 from data_describe.misc.colors import get_p_RdBl_cmap, mpl_to_plotly_cmap
+from data_describe.misc.load_data import _read_file_chunks
+from data_describe.misc.parallel import _map_blocks
 from data_describe._widget import BaseWidget
-from data_describe.compat import _is_dataframe, _in_notebook, _requires
+from data_describe.compat import _compat, _is_dataframe, _in_notebook, _requires
 from data_describe.backends import _get_viz_backend, _get_compute_backend
 
 
@@ -28,7 +35,28 @@ class CorrelationWidget(BaseWidget):
             categorical-numeric or categorical-categorical associations.
         cluster_matrix: The clustered association matrix.
         categorical (bool): True if association matrix contains categorical values.
-        viz_data: The final data to be visualized.
+        viz_data: The final data to be visualized. This is the cluster matrix (or
+            association matrix) itself, not a copy.
+        accumulator: The accumulated co-moments of the numeric columns, if the
+            (Pearson) correlations were computed from chunks of data.
+        input_data: The data frame the (Pearson) correlations were computed from
+            (or the sample of its rows), kept so that in-memory correlations can
+            be updated or merged. This is the caller's data frame itself, not a
+            copy, so it should not be modified while the widget may be updated.
+            Not kept if ``keep_input`` is False or the matrix was written to a
+            file.
+        pair_counts: The number of rows where both columns are present, for each
+            pair of numeric columns, e.g. to hide correlations with low support.
+            Not computed for categorical associations.
+        linkage (str): The linkage method used to cluster the columns.
+        optimal_ordering (bool): True if the clustered columns were reordered with
+            optimal leaf ordering.
+        confidence_interval: The (lower, upper) bounds of the confidence interval
+            of each correlation, if the correlations were computed from a sample of
+            rows.
+        sampled (bool): True if the correlations were computed from a sample of
+            rows. Sampled correlations cannot be updated or merged.
+        dtype (str): The floating point type of the association matrix.
     """
 
     def __init__(
@@ -37,6 +65,14 @@ class CorrelationWidget(BaseWidget):
         cluster_matrix=None,
         categorical=None,
         viz_data=None,
+        accumulator=None,
+        input_data=None,
+        pair_counts=None,
+        linkage="single",
+        optimal_ordering=False,
+        confidence_interval=None,
+        sampled=False,
+        dtype="float64",
         **kwargs,
     ):
         """Correlation matrix.
@@ -47,6 +83,14 @@ class CorrelationWidget(BaseWidget):
             cluster_matrix: The clustered association matrix.
             categorical (bool): True if association matrix contains categorical values.
             viz_data: The final data to be visualized.
+            accumulator: The accumulated co-moments of the numeric columns.
+            input_data: The data the correlations were computed from.
+            pair_counts: The number of pairwise complete observations.
+            linkage (str): The linkage method used to cluster the columns.
+            optimal_ordering (bool): True if optimal leaf ordering was used.
+            confidence_interval: The (lower, upper) bounds of the correlations.
+            sampled (bool): True if computed from a sample of rows.
+            dtype (str): The floating point type of the association matrix.
             **kwargs: Keyword arguments.
         """
         super(CorrelationWidget, self).__init__(**kwargs)
@@ -54,6 +98,14 @@ class CorrelationWidget(BaseWidget):
         self.cluster_matrix = cluster_matrix
         self.viz_data = viz_data
         self.categorical = categorical
+        self.accumulator = accumulator
+        self.input_data = input_data
+        self.pair_counts = pair_counts
+        self.linkage = linkage
+        self.optimal_ordering = optimal_ordering
+        self.confidence_interval = confidence_interval
+        self.sampled = sampled
+        self.dtype = dtype
 
     def __str__(self):
         return "data-describe Correlation Matrix Widget"
@@ -80,11 +132,94 @@ class CorrelationWidget(BaseWidget):
 
         return _get_viz_backend(backend).viz_correlation_matrix(self.viz_data, **kwargs)
 
+    @classmethod
+    def from_file(cls, filepath, columns, **kwargs) -> "CorrelationWidget":
+        """Wrap a correlation matrix written by ``correlation_matrix(..., out=...)``.
+
+        The file is memory-mapped read-only, so the matrix is paged in from disk
+        as it is accessed rather than loaded into memory.
+
+        Args:
+            filepath: The path of the float32 correlation matrix file
+            columns: The column names, in the order of the matrix
+            **kwargs: Keyword arguments.
+
+        Returns:
+            CorrelationWidget
+        """
+        association_matrix = _open_correlation_file(filepath, columns)
+        return cls(
+            association_matrix=association_matrix,
+            categorical=False,
+            viz_data=association_matrix,
+            **kwargs,
+        )
+
+    def update(self, data):
+        """Update the (Pearson) correlations with new rows.
+
+        The new rows are folded into the accumulated co-moments, in time
+        proportional to the size of the new data. ``input_data`` is cleared, as it
+        no longer contains all rows.
+
+        Args:
+            data: The new rows, as a Pandas dataframe or an iterator of dataframe
+                chunks
+        """
+        accumulator = _CorrelationAccumulator()
+        _accumulate(accumulator, [data] if _is_dataframe(data) else data)
+        self._merge_accumulator(accumulator)
+
+    def merge(self, other: "CorrelationWidget"):
+        """Combine with the correlations of another partition of the data.
+
+        Args:
+            other: The other correlation widget
+        """
+        self._merge_accumulator(other._get_accumulator())
+
+    def _get_accumulator(self):
+        if self.categorical:
+            raise ValueError("Categorical associations cannot be updated or merged.")
+        if self.sampled:
+            # The new rows would be mixed with the sample at their full rate
+            raise ValueError("Sampled correlations cannot be updated or merged.")
+        if self.accumulator is None:
+            if self.input_data is None:
+                raise ValueError("Could not find statistics or data to update.")
+            self.accumulator = _CorrelationAccumulator()
+            self.accumulator.update(self.input_data.select_dtypes(["number"]))
+        return self.accumulator
+
+    def _merge_accumulator(self, accumulator):
+        self._get_accumulator().merge(accumulator)
+        self.association_matrix = (
+            self.accumulator.correlation().fillna(0).astype(self.dtype, copy=False)
+        )
+        self.pair_counts = self.accumulator.pair_counts()
+        if self.cluster_matrix is not None:
+            self.cluster_matrix = _reorder_by_cluster(
+                self.association_matrix, self.linkage, self.optimal_ordering
+            )
+            self.viz_data = self.cluster_matrix
+        else:
+            self.viz_data = self.association_matrix
+        self.input_data = None
+
 
 def correlation_matrix(
     data,
     cluster=False,
     categorical=False,
+    method: str = "pearson",
+    n_jobs: Optional[int] = None,
+    out=None,
+    linkage: str = "single",
+    optimal_ordering: bool = False,
+    sample=None,
+    stratify=None,
+    dtype: str = "float64",
+    keep_input: bool = True,
     compute_backend=None,
     viz_backend=None,
     **kwargs,
@@ -92,34 +227,111 @@ def correlation_matrix(
     """Computes correlations (associations) and visualizes as a heatmap.
 
     This feature combines measures of association for pairs of variables:
-        * Numeric-numeric pairs: Pearson correlation
+        * Numeric-numeric pairs: Pearson (or Spearman, Kendall) correlation
         * Categorical-numeric pairs: Correlation ratio
         * Categorical-categorical pairs
             * More than 2 levels: Cramer's V
             * Only 2 levels for both variables: Point-biserial coefficient
 
+    Pearson correlations of data that does not fit in memory may be computed by
+    passing an iterator of data frame chunks (e.g. ``pd.read_csv(...,
+    chunksize=...)``) or a file path. The co-moments of each chunk are merged into
+    an accumulator, so the widget can also be updated with more rows or merged with
+    the widget of another partition.
+
+    For very large data, the correlations may instead be estimated from a random
+    sample of rows. The uncertainty of Pearson (and Spearman) correlations is then
+    given as a confidence interval on Fisher's z-transform of the correlations, at
+    the level of the ``correlation.confidence`` option. By default the standard
+    error is ``1 / sqrt(n - 3)`` (``sqrt(1.06 / (n - 3))`` for Spearman), where
+    ``n`` is the number of pairwise complete rows, which costs nothing beyond the
+    correlations. If the ``correlation.bootstrap`` option is set, it is instead
+    estimated with a bootstrap: the sample is split into blocks (see the
+    ``correlation.bootstrap_blocks`` option), the co-moments of each block are
+    computed once, and each bootstrap replicate merges a resampling of the blocks'
+    co-moments rather than recomputing the correlations from the rows.
+
     Args:
-        data (DataFrame): A data frame
+        data: A data frame, an iterator of data frame chunks, or a file path
         cluster (bool): If True, use clustering to reorder similar columns together
         categorical (bool): If True, include categorical associations using Cramer's
             V, Correlation Ratio, and Point-biserial coefficient (a.k.a. Matthews
             correlation coefficient). All associations (including Pearson correlation)
-            are scaled to be in the range [0, 1].
+            are scaled to be in the range [0, 1]. Not supported for chunked data.
+        method (str): The correlation of numeric pairs: "pearson", "spearman" (the
+            Pearson correlation of the ranks of each column) or "kendall" (Kendall's
+            tau-b). Alternatively, "mutual_info" measures all pairs (including
+            categorical columns, if ``categorical`` is True) with their normalized
+            mutual information, after binning numeric columns into quantiles (see
+            the ``correlation.bins`` option). Only "pearson" is supported for
+            chunked data.
+        n_jobs (int, optional): The number of threads used to compute blocks of the
+            correlation matrix in parallel. -1 uses all CPUs. Defaults to the
+            ``compute.n_jobs`` option.
+        out: A file path. If given, the correlation matrix is written to
+            this file as a float32 memory-mapped array, and the widget wraps the
+            file instead of holding the matrix in memory. Not supported with
+            ``categorical``.
+        linkage (str): The method used to cluster the columns, if ``cluster`` is
+            True: a hierarchical linkage method of ``scipy.cluster.hierarchy``
+            ("single", "complete", "average", "weighted", "centroid", "median" or
+            "ward"), or "spectral" for a fast approximate seriation of very large
+            matrices, which orders the columns along the Fiedler vector of the
+            association (similarity) matrix.
+        optimal_ordering (bool): If True, reorder the leaves of the hierarchical
+            clustering so that the distance between successive columns is minimal.
+            This is slow for large matrices.
+        sample (int or float, optional): If given, compute the correlations from a
+            random sample of this many rows (int) or of this fraction of the rows
+            (float). Chunked data can only be sampled by a fraction. The widget's
+            ``confidence_interval`` then holds the confidence interval of each
+            correlation (except for Kendall, mutual information or
+            categorical associations). Sampled correlations cannot be updated or
+            merged.
+        stratify (str, optional): The column to stratify the sample by. Each level
+            (including nulls) is sampled in proportion to its number of rows.
+        dtype (str): The floating point type of the association (and cluster)
+            matrix: "float64" or "float32". "float32" halves the memory of large
+            matrices. Pearson correlations are then computed with float32 matrix
+            products of columns standardized in float64, which are accurate to
+            about 1e-6.
+        keep_input (bool): If True, the widget keeps a reference to the input data
+            frame (as ``input_data``, without copying it), so that in-memory
+            Pearson correlations can later be updated or merged. Set to False to
+            release the data. The input is never kept if the matrix is written to
+            a file (``out``).
         compute_backend: The compute backend.
         viz_backend: The visualization backend.
         **kwargs: Keyword arguments.
 
     Raises:
-        ValueError: Invalid data input type.
+        ValueError: Invalid data input type, or dtype is not a float type.
 
     Returns:
         CorrelationWidget
     """
-    if not _is_dataframe(data):
+    if isinstance(data, (str, os.PathLike)):
+        if not os.path.isfile(data):
+            raise ValueError("Data frame or file path required")
+    elif not _is_dataframe(data) and not isinstance(data, Iterable):
         raise ValueError("Data frame required")
+    if dtype not in ["float64", "float32", np.float64, np.float32]:
+        raise ValueError(f"dtype must be 'float64' or 'float32', not {dtype}")
 
     corrwidget = _get_compute_backend(compute_backend, data).compute_correlation_matrix(
-        data, cluster=cluster, categorical=categorical, **kwargs
+        data,
+        cluster=cluster,
+        categorical=categorical,
+        method=method,
+        n_jobs=n_jobs,
+        out=out,
+        linkage=linkage,
+        optimal_ordering=optimal_ordering,
+        sample=sample,
+        stratify=stratify,
+        dtype=dtype,
+        keep_input=keep_input,
+        **kwargs,
     )
 
     corrwidget.viz_backend = viz_backend
@@ -127,16 +339,181 @@ def correlation_matrix(
     return corrwidget
 
 
-def _pandas_compute_correlation_matrix(data, cluster=False, categorical=False):
+def correlated_pairs(
+    data,
+    threshold: Optional[float] = None,
+    top_k: Optional[int] = None,
+    categorical: bool = False,
+    method: str = "pearson",
+    n_jobs: Optional[int] = None,
+    compute_backend=None,
+):
+    """Finds the most strongly correlated (associated) pairs of columns.
+
+    The association matrix is computed in blocks of columns (see the
+    ``correlation.block_size`` option), and only the qualifying pairs of each block
+    are kept, so memory grows with the number of pairs found rather than with the
+    square of the number of columns.
+
+    Args:
+        data (DataFrame): A data frame
+        threshold (float, optional): Only keep pairs with an absolute correlation
+            (association) of at least this value
+        top_k (int, optional): Only keep the ``top_k`` strongest partners of each
+            column. Each pair is then listed once for each of its two columns.
+        categorical (bool): If True, include categorical associations, as in
+            ``correlation_matrix``
+        method (str): The correlation of numeric pairs: "pearson", "spearman",
+            "kendall" or "mutual_info"
+        n_jobs (int, optional): The number of threads used to compute blocks in
+            parallel. -1 uses all CPUs. Defaults to the ``compute.n_jobs`` option.
+        compute_backend: The compute backend.
+
+    Raises:
+        ValueError: Invalid data input type, or neither threshold nor top_k given.
+
+    Returns:
+        A data frame of pairs, with columns "Column 1", "Column 2" and
+        "Correlation", ordered by the first column and then by decreasing strength
+    """
+    if not _is_dataframe(data):
+        raise ValueError("Data frame required")
+    if threshold is None and top_k is None:
+        raise ValueError("A threshold or top_k is required")
+
+    return _get_compute_backend(compute_backend, data).compute_correlated_pairs(
+        data,
+        threshold=threshold,
+        top_k=top_k,
+        categorical=categorical,
+        method=method,
+        n_jobs=n_jobs,
+    )
+
+
+def _pandas_compute_correlation_matrix(
+    data,
+    cluster=False,
+    categorical=False,
+    method: str = "pearson",
+    n_jobs: Optional[int] = None,
+    out=None,
+    linkage: str = "single",
+    optimal_ordering: bool = False,
+    sample=None,
+    stratify=None,
+    dtype: str = "float64",
+    keep_input: bool = True,
+):
     """Correlation matrix of numeric variables.
 
     Args:
-        data (DataFrame): The data frame
+        data: The data frame, an iterator of data frame chunks, or a file path
         cluster (bool): If True, use clustering to reorder similar columns together
         categorical (bool): If True, calculate categorical associations using Cramer's V,
             Correlation Ratio, and Point-biserial coefficient (aka Matthews correlation
             coefficient). All associations (including Pearson correlation) are in the
             range [0, 1].
+        method (str): The correlation of numeric pairs: "pearson", "spearman",
+            "kendall" or "mutual_info"
+        n_jobs (int, optional): The number of threads. Defaults to the
+            ``compute.n_jobs`` option.
+        out: A file path to write the correlation matrix to, as float32
+        linkage (str): The method used to cluster the columns
+        optimal_ordering (bool): If True, use optimal leaf ordering
+        sample (int or float, optional): The number (int) or fraction (float) of
+            rows to sample
+        stratify (str, optional): The column to stratify the sample by
+        dtype (str): The floating point type of the association matrix
+        keep_input (bool): If True, keep a reference to the data frame on the
+            widget, unless the matrix is written to a file
+
+    Raises:
+        ValueError: Missing numeric data to compute correlations.
+
+    Returns:
+        CorrelationWidget
+    """
+    if out is not None and categorical:
+        raise ValueError("Categorical associations cannot be written to a file")
+
+    if isinstance(data, (str, os.PathLike)):
+        data = _read_file_chunks(data, chunksize=get_option("correlation.chunksize"))
+
+    if sample is not None:
+        if _is_dataframe(data):
+            data = _sample_rows(data, sample, stratify)
+        elif isinstance(sample, float):
+            # Sample each chunk, sharing the random generator across chunks
+            rng = np.random.default_rng(0)
+            data = pd.concat(
+                [_sample_rows(chunk, sample, stratify, rng) for chunk in data]
+            )
+        else:
+            raise ValueError("Chunked data can only be sampled by a fraction of rows")
+
+    if not _is_dataframe(data) and isinstance(data, Iterable):
+        if categorical:
+            raise ValueError(
+                "Categorical associations are not supported for chunked data"
+            )
+        if method != "pearson":
+            raise ValueError("Only Pearson correlation is supported for chunked data")
+        return _pandas_compute_chunked_correlation_matrix(
+            data,
+            cluster=cluster,
+            out=out,
+            linkage=linkage,
+            optimal_ordering=optimal_ordering,
+            dtype=dtype,
+        )
+
+    return _in_memory_correlation_matrix(
+        data,
+        cluster=cluster,
+        categorical=categorical,
+        method=method,
+        n_jobs=n_jobs,
+        out=out,
+        linkage=linkage,
+        optimal_ordering=optimal_ordering,
+        sampled=sample is not None,
+        dtype=dtype,
+        keep_input=keep_input,
+    )
+
+
+def _in_memory_correlation_matrix(
+    data,
+    cluster=False,
+    categorical=False,
+    method: str = "pearson",
+    n_jobs: Optional[int] = None,
+    out=None,
+    linkage: str = "single",
+    optimal_ordering: bool = False,
+    sampled: bool = False,
+    dtype: str = "float64",
+    keep_input: bool = True,
+):
+    """Correlation matrix of an in-memory Pandas data frame.
+
+    Args:
+        data: The data frame
+        cluster (bool): If True, use clustering to reorder similar columns together
+        categorical (bool): If True, calculate categorical associations
+        method (str): The correlation of numeric pairs: "pearson", "spearman",
+            "kendall" or "mutual_info"
+        n_jobs (int, optional): The number of threads. Defaults to the
+            ``compute.n_jobs`` option.
+        out: A file path to write the correlation matrix to, as float32
+        linkage (str): The method used to cluster the columns
+        optimal_ordering (bool): If True, use optimal leaf ordering
+        sampled (bool): True if the data is a sample of rows, in which case the
+            confidence intervals of the correlations are computed
+        dtype (str): The floating point type of the association matrix
+        keep_input (bool): If True, keep a reference to the data frame on the
+            widget, unless the matrix is written to a file
 
     Raises:
         ValueError: Missing numeric data to compute correlations.
@@ -160,240 +537,1722 @@ def _pandas_compute_correlation_matrix(data, cluster=False, categorical=False):
         categorical = False
 
     if categorical:
-        if has_numeric:
-            association_numeric = np.abs(numeric.corr())
-            association_cramers = _cramers_v_matrix(categoric)
-            association_cr = _correlation_ratio_matrix(numeric, categoric)
-
-            association_matrix = pd.concat(
-                [
-                    pd.concat([association_numeric, association_cr], axis=1),
-                    pd.concat([association_cr.T, association_cramers], axis=1),
-                ],
-                axis=0,
-            )
-        else:
-            association_matrix = _cramers_v_matrix(categoric)
-
-        association_matrix.fillna(0, inplace=True)
+        association_matrix = _association_matrix(
+            numeric, categoric, method, n_jobs
+        ).astype(dtype, copy=False)
 
         if cluster:
-            cluster_matrix = _reorder_by_cluster(association_matrix)
+            cluster_matrix = _reorder_by_cluster(
+                association_matrix, linkage, optimal_ordering
+            )
         else:
             association_matrix = _reorder_by_original(association_matrix, data)
 
     else:
         if has_numeric:
-            association_matrix = numeric.corr()
+            association_matrix = _numeric_correlation(
+                numeric, method, n_jobs, out=out, dtype=dtype
+            )
         else:
             raise ValueError(
                 "No numerical features were found. Could not compute correlation."
             )
 
-        association_matrix.fillna(0, inplace=True)
-
         if cluster:
-            cluster_matrix = _reorder_by_cluster(association_matrix)
+            cluster_matrix = _reorder_by_cluster(
+                association_matrix, linkage, optimal_ordering
+            )
         else:
             pass  # Pearson Correlation does not need reordering
 
+    pair_counts = None if categorical else _pair_counts(numeric, out, n_jobs)
+    # The input only serves to update (or merge) in-memory Pearson correlations
+    keep_input = keep_input and out is None and method == "pearson" and not categorical
+    confidence_interval = None
+    if sampled and not categorical and method in ["pearson", "spearman"]:
+        if get_option("correlation.bootstrap"):
+            confidence_interval = _bootstrap_confidence_interval(
+                numeric if method == "pearson" else numeric.rank()
+            )
+        else:
+            confidence_interval = _fisher_confidence_interval(
+                association_matrix, pair_counts, 1.06 if method == "spearman" else 1
+            )
+
     return CorrelationWidget(
         association_matrix=association_matrix,
         cluster_matrix=cluster_matrix if cluster else None,
+        categorical=categorical,
         viz_data=cluster_matrix if cluster else association_matrix,
+        input_data=data if keep_input else None,
+        pair_counts=pair_counts,
+        linkage=linkage,
+        optimal_ordering=optimal_ordering,
+        confidence_interval=confidence_interval,
+        sampled=sampled,
+        dtype=dtype,
     )
 
 
-def _cramers_v_matrix(df):
-    """Computes Cramer's V for all column pairs.
+def _association_matrix(
+    numeric, categoric, method: str = "pearson", n_jobs: Optional[int] = None
+):
+    """Combined association matrix of numeric and categorical columns.
 
-    Adapted from https://github.com/shakedzy/dython/blob/master/dython/nominal.py
+    Args:
+        numeric (DataFrame): The numeric columns
+        categoric (DataFrame): The categorical columns
+        method (str): The correlation of numeric pairs
+        n_jobs (int, optional): The number of threads. Defaults to the
+            ``compute.n_jobs`` option.
+
+    Returns:
+        A Pandas data frame, with the numeric columns first
+    """
+    if method == "mutual_info":
+        return _mutual_info_matrix(pd.concat([numeric, categoric], axis=1), n_jobs)
+    if numeric.shape[1] == 0:
+        return _combine_associations(None, _cramers_v_matrix(categoric), None)
+    elif categoric.shape[1] == 0:
+        return np.abs(_numeric_correlation(numeric, method, n_jobs))
+    else:
+        return _combine_associations(
+            np.abs(_numeric_correlation(numeric, method, n_jobs)),
+            _cramers_v_matrix(categoric),
+            _correlation_ratio_matrix(numeric, categoric),
+        )
+
+
+def _combine_associations(association_numeric, association_cramers, association_cr):
+    """Combine the blocks of an association matrix.
 
     Args:
-        df (DataFrame): A data frame containing only categorical features
+        association_numeric: The (absolute) correlations of the numeric columns, or
+            None if there are no numeric columns
+        association_cramers: Cramer's V of the categorical columns
+        association_cr: The correlation ratios of the numeric (rows) and
+            categorical (columns) columns
 
     Returns:
-        A pandas data frame
+        A Pandas data frame, with the numeric columns first
     """
-    index = df.columns.values
-    cramers_matrix = pd.DataFrame(
-        [[_cramers_v(df[x], df[y]) for x in index] for y in index]
-    )
+    if association_numeric is None:
+        association_matrix = association_cramers
+    else:
+        association_matrix = pd.concat(
+            [
+                pd.concat([association_numeric, association_cr], axis=1),
+                pd.concat([association_cr.T, association_cramers], axis=1),
+            ],
+            axis=0,
+        )
 
-    # Cramer's V can be NaN when there are not enough instances in a category
-    cramers_matrix.fillna(0)
+    association_matrix.fillna(0, inplace=True)
+    return association_matrix
+
+
+def _pandas_compute_correlated_pairs(
+    data,
+    threshold: Optional[float] = None,
+    top_k: Optional[int] = None,
+    categorical: bool = False,
+    method: str = "pearson",
+    n_jobs: Optional[int] = None,
+):
+    """Find the most strongly correlated pairs of columns, block by block.
 
-    # Assign column and row labels
-    cramers_matrix.columns = index
-    cramers_matrix.set_index(index, inplace=True)
+    Tiles of the upper triangle of the association matrix are computed for one
+    block of rows (columns of the data) at a time, in parallel threads. Each tile
+    is immediately reduced to its qualifying pairs; with ``top_k``, the pairs of
+    the mirrored tile are taken from the same tile, and the strongest partners of
+    each column are kept as the blocks are processed.
 
-    return cramers_matrix
+    Pearson (and Spearman) tiles are matrix products of the two blocks of
+    prepared columns. Other associations are computed for the union of the two
+    blocks of columns.
 
+    Args:
+        data (DataFrame): The data frame
+        threshold (float, optional): The minimum absolute correlation
+        top_k (int, optional): The number of partners to keep per column
+        categorical (bool): If True, include categorical associations
+        method (str): The correlation of numeric pairs
+        n_jobs (int, optional): The number of threads. Defaults to the
+            ``compute.n_jobs`` option.
 
-def _cramers_v(x, y):
-    """Calculates Cramer's V statistic for categorical-categorical association.
+    Raises:
+        ValueError: Missing numeric data to compute correlations.
+
+    Returns:
+        A Pandas data frame of pairs
+    """
+    numeric = data.select_dtypes(["number"])
+    if categorical:
+        categoric = data[[col for col in data.columns if col not in numeric.columns]]
+        data = pd.concat([numeric, categoric], axis=1)
+    elif numeric.shape[1] == 0:
+        raise ValueError(
+            "No numerical features were found. Could not compute correlation."
+        )
+    else:
+        data = numeric
+    is_numeric = np.arange(data.shape[1]) < numeric.shape[1]
+
+    if not categorical and method in ["pearson", "spearman"]:
+        tile_correlation = _tile_correlation(
+            (data if method == "pearson" else data.rank()).to_numpy(dtype=np.float64)
+        )
+
+        def _associations(rows, cols):
+            return tile_correlation(
+                slice(rows[0], rows[-1] + 1), slice(cols[0], cols[-1] + 1)
+            )
+
+    else:
+
+        def _associations(rows, cols):
+            # Associations between two blocks of columns, using their union
+            union = np.union1d(rows, cols)
+            subset = data.iloc[:, union]
+            if categorical:
+                association = _association_matrix(
+                    subset.loc[:, is_numeric[union]],
+                    subset.loc[:, ~is_numeric[union]],
+                    method,
+                    n_jobs=1,
+                ).to_numpy()
+            else:
+                association = _numeric_correlation(subset, method, n_jobs=1).to_numpy()
+            return association[
+                np.ix_(np.searchsorted(union, rows), np.searchsorted(union, cols))
+            ]
+
+    def _tile(rows, cols):
+        tile = _associations(rows, cols)
+        keep = rows[:, None] < cols[None, :]
+        if threshold is not None:
+            keep &= np.abs(tile) >= threshold
+        if top_k is None:
+            row, col = np.nonzero(keep)
+            return _strongest(rows[row], cols[col], tile[row, col])
+
+        # Each pair is a partner of both of its columns
+        strength = np.where(keep, np.abs(tile), -1)
+        row, col = _largest_per_row(strength, top_k)
+        col_t, row_t = _largest_per_row(strength.T, top_k)
+        return _strongest(
+            np.append(rows[row], cols[col_t]),
+            np.append(cols[col], rows[row_t]),
+            np.append(tile[row, col], tile[row_t, col_t]),
+            top_k,
+        )
+
+    block_size = get_option("correlation.block_size")
+    k = data.shape[1]
+    blocks = [
+        np.arange(start, min(start + block_size, k))
+        for start in range(0, k, block_size)
+    ]
+    results = []
+    for i, rows in enumerate(blocks):
+        tiles = _map_blocks(
+            lambda block: [_tile(rows, blocks[i + j]) for j in block],
+            len(blocks) - i,
+            n_jobs=n_jobs,
+        )
+        results.append(_strongest(*map(np.concatenate, zip(*tiles)), top_k))
+        if top_k is not None:
+            # Partners of later columns may still be found in later blocks
+            results = [_strongest(*map(np.concatenate, zip(*results)), top_k)]
+
+    first, second, value = map(np.concatenate, zip(*results))
+    return pd.DataFrame(
+        {
+            "Column 1": data.columns[first],
+            "Column 2": data.columns[second],
+            "Correlation": value,
+        }
+    )
 
-    Adapted from https://github.com/shakedzy/dython/blob/master/dython/nominal.py
+
+def _largest_per_row(strength, k: int):
+    """Find the (at most) k largest non-negative entries of each row.
 
     Args:
-        x: A list, numpy array, or pandas series of categorical measurements
-        y: A list, numpy array, or pandas series of categorical measurements
+        strength: 2-D array, negative (or null) where entries are excluded
+        k (int): The number of entries per row
 
     Returns:
-        Cramer's V value (float)
+        (row, col) tuple of the positions of the entries, in no particular order
     """
-    confusion_matrix = pd.crosstab(x, y)
-    if confusion_matrix.shape[0] == 2 and confusion_matrix.shape[1] == 2:
-        # phi coefficient
-        return matthews_corrcoef(x.astype(str), y.astype(str))
+    if strength.shape[1] > k:
+        col = np.argpartition(-strength, k - 1, axis=1)[:, :k]
     else:
-        # Cramer's V
-        n = confusion_matrix.sum().sum()
-        r, k = confusion_matrix.shape
-        if n == k or n == r:
-            return 1.0
-        else:
-            chi2 = chi2_contingency(confusion_matrix)[0]
-            phi2 = chi2 / n
-            phi2corr = max(0, phi2 - ((k - 1) * (r - 1)) / (n - 1))
-            rcorr = r - ((r - 1) ** 2) / (n - 1)
-            kcorr = k - ((k - 1) ** 2) / (n - 1)
-            return np.sqrt(phi2corr / min((kcorr - 1), (rcorr - 1)))
+        col = np.broadcast_to(np.arange(strength.shape[1]), strength.shape)
+    row = np.broadcast_to(np.arange(strength.shape[0])[:, None], col.shape)
+    keep = strength[row, col] >= 0
+    return row[keep], col[keep]
 
 
-def _correlation_ratio_matrix(num_df, cat_df):
-    """Computes correlation ratio for all numeric-categoric pairs of columns.
+def _strongest(first, second, value, top_k: Optional[int] = None):
+    """Order pairs by the first column and decreasing strength, keeping the top k.
 
     Args:
-        num_df (DataFrame): A dataframe containing only numeric features
-        cat_df (DataFrame): A dataframe containing only categorical features
+        first: Array of positions of the first column of each pair
+        second: Array of positions of the second column of each pair
+        value: Array of correlations
+        top_k (int, optional): The number of pairs to keep per first column
 
     Returns:
-        A pandas data frame
+        (first, second, value) tuple of arrays
     """
-    num_index = num_df.columns.values
-    cat_index = cat_df.columns.values
-    corr_ratio_mat = pd.DataFrame(
-        [
-            [_correlation_ratio(cat_df[x], num_df[y]) for x in cat_index]
-            for y in num_index
-        ]
+    order = np.lexsort((-np.abs(value), first))
+    first, second, value = first[order], second[order], value[order]
+    if top_k is not None:
+        start = np.searchsorted(first, first, side="left")
+        keep = np.arange(first.size) - start < top_k
+        first, second, value = first[keep], second[keep], value[keep]
+    return first, second, value
+
+
+def _pandas_compute_chunked_correlation_matrix(
+    chunks,
+    cluster=False,
+    out=None,
+    linkage: str = "single",
+    optimal_ordering: bool = False,
+    dtype: str = "float64",
+):
+    """Pearson correlation matrix over chunks of data.
+
+    Args:
+        chunks: An iterator of Pandas dataframes
+        cluster (bool): If True, use clustering to reorder similar columns together
+        out: A file path to write the correlation matrix to, as float32
+        linkage (str): The method used to cluster the columns
+        optimal_ordering (bool): If True, use optimal leaf ordering
+        dtype (str): The floating point type of the correlation matrix
+
+    Returns:
+        CorrelationWidget
+    """
+    accumulator = _CorrelationAccumulator()
+    _accumulate(accumulator, chunks)
+    return _accumulator_correlation_matrix(
+        accumulator,
+        cluster=cluster,
+        out=out,
+        linkage=linkage,
+        optimal_ordering=optimal_ordering,
+        dtype=dtype,
+    )
+
+
+def _accumulator_correlation_matrix(
+    accumulator,
+    cluster=False,
+    out=None,
+    linkage: str = "single",
+    optimal_ordering: bool = False,
+    dtype: str = "float64",
+):
+    """Pearson correlation matrix from accumulated co-moments.
+
+    Args:
+        accumulator: The ``_CorrelationAccumulator``
+        cluster (bool): If True, use clustering to reorder similar columns together
+        out: A file path to write the correlation matrix to, as float32
+        linkage (str): The method used to cluster the columns
+        optimal_ordering (bool): If True, use optimal leaf ordering
+        dtype (str): The floating point type of the correlation matrix
+
+    Raises:
+        ValueError: Missing numeric data to compute correlations.
+
+    Returns:
+        CorrelationWidget
+    """
+    if len(accumulator.columns) == 0:
+        raise ValueError(
+            "No numerical features were found. Could not compute correlation."
+        )
+
+    association_matrix = accumulator.correlation().fillna(0)
+    if out is None:
+        association_matrix = association_matrix.astype(dtype, copy=False)
+    else:
+        _create_correlation_file(out, len(accumulator.columns))[:] = association_matrix
+        association_matrix = _open_correlation_file(out, accumulator.columns)
+    cluster_matrix = (
+        _reorder_by_cluster(association_matrix, linkage, optimal_ordering)
+        if cluster
+        else None
+    )
+
+    return CorrelationWidget(
+        association_matrix=association_matrix,
+        cluster_matrix=cluster_matrix,
+        categorical=False,
+        viz_data=cluster_matrix if cluster else association_matrix,
+        accumulator=accumulator,
+        pair_counts=accumulator.pair_counts(),
+        linkage=linkage,
+        optimal_ordering=optimal_ordering,
+        dtype=dtype,
     )
 
-    # Assign column and row labels
-    corr_ratio_mat.columns = cat_index
-    corr_ratio_mat.set_index(num_index, inplace=True)
-    return corr_ratio_mat
 
+@_requires("modin")
+def _modin_compute_correlation_matrix(
+    data,
+    cluster=False,
+    categorical=False,
+    method: str = "pearson",
+    n_jobs: Optional[int] = None,
+    out=None,
+    linkage: str = "single",
+    optimal_ordering: bool = False,
+    sample=None,
+    stratify=None,
+    dtype: str = "float64",
+    keep_input: bool = True,
+):
+    """Correlation matrix of a Modin dataframe.
 
-def _correlation_ratio(categorical, numeric):
-    """Computes correlation ratio between a categorical column and numeric column.
+    Pearson correlations (and categorical associations) are computed in a single
+    map-reduce job: each row partition is scanned once into mergeable statistics,
+    i.e. the co-moments of the numeric columns and, for categorical associations,
+    the contingency counts of the categorical columns and the per-category sums of
+    the numeric columns. Only the merged statistics are gathered on the driver.
+    Rank correlations, mutual information and sampling need whole columns (or a
+    sample of rows), so the data is converted to Pandas for them. Rows are sampled
+    on Modin, so that only the sample is converted.
 
     Args:
-        categorical (Series): A Series of categorical values
-        numeric (Series): A Series of numeric values
+        data: The Modin dataframe
+        cluster (bool): If True, use clustering to reorder similar columns together
+        categorical (bool): If True, calculate categorical associations
+        method (str): The correlation of numeric pairs: "pearson", "spearman",
+            "kendall" or "mutual_info"
+        n_jobs (int, optional): The number of threads, if the data is converted to
+            Pandas. Otherwise Modin parallelizes over partitions using its own engine.
+        out: A file path to write the correlation matrix to, as float32
+        linkage (str): The method used to cluster the columns
+        optimal_ordering (bool): If True, use optimal leaf ordering
+        sample (int or float, optional): The number (int) or fraction (float) of
+            rows to sample
+        stratify (str, optional): The column to stratify the sample by
+        dtype (str): The floating point type of the association matrix
+        keep_input (bool): If True, keep a reference to the (converted) data on
+            the widget, if the data is converted to Pandas. Otherwise the widget
+            keeps the accumulated co-moments instead.
+
+    Raises:
+        ValueError: Missing numeric data to compute correlations.
 
     Returns:
-        Correlation Ratio value (float)
+        CorrelationWidget
     """
-    df = pd.concat([categorical, numeric], axis=1)
-    n = numeric.shape[0]
-    ybar = np.mean(numeric)
+    if out is not None and categorical:
+        raise ValueError("Categorical associations cannot be written to a file")
+
+    if method != "pearson" or sample is not None:
+        if sample is not None:
+            data = _sample_rows(data, sample, stratify)
+        return _in_memory_correlation_matrix(
+            _compat["modin.utils"].to_pandas(data),
+            cluster=cluster,
+            categorical=categorical,
+            method=method,
+            n_jobs=n_jobs,
+            out=out,
+            linkage=linkage,
+            optimal_ordering=optimal_ordering,
+            sampled=sample is not None,
+            dtype=dtype,
+            keep_input=keep_input,
+        )
+
+    numeric = list(data.select_dtypes(["number"]).columns)
+    categoric = [col for col in data.columns if col not in numeric]
+
+    if categorical and len(categoric) == 0:
+        warnings.warn(
+            UserWarning(
+                "Categorical associations were requested, but no categorical features were found. "
+                "Defaulting to Pearson Correlation."
+            )
+        )
+        categorical = False
 
-    # Get average and count for each category level
-    agg = df.groupby(categorical.name).agg(["count", "mean"])
+    if not categorical:
+        accumulator = _modin_reduce_row_partitions(data[numeric], _chunk_comoments)
+        return _accumulator_correlation_matrix(
+            accumulator,
+            cluster=cluster,
+            out=out,
+            linkage=linkage,
+            optimal_ordering=optimal_ordering,
+            dtype=dtype,
+        )
 
-    # Remove the Multilevel Index
-    agg.columns = agg.columns.droplevel(0)
+    def _associations(partition):
+        accumulator = _AssociationAccumulator()
+        accumulator.update(partition[numeric], partition[categoric])
+        return accumulator
 
-    category_variance = (agg["mean"] - ybar) ** 2
-    weighted_category_variance = (
-        np.sum(np.multiply(agg["count"], category_variance)) / n
+    association_matrix = (
+        _modin_reduce_row_partitions(data, _associations)
+        .association_matrix()
+        .astype(dtype, copy=False)
     )
+    if cluster:
+        cluster_matrix = _reorder_by_cluster(
+            association_matrix, linkage, optimal_ordering
+        )
+    else:
+        association_matrix = _reorder_by_original(association_matrix, data)
 
-    total_variance = np.sum((numeric - ybar) ** 2) / n
-
-    eta = np.sqrt(weighted_category_variance / total_variance)
+    return CorrelationWidget(
+        association_matrix=association_matrix,
+        cluster_matrix=cluster_matrix if cluster else None,
+        categorical=True,
+        viz_data=cluster_matrix if cluster else association_matrix,
+        linkage=linkage,
+        optimal_ordering=optimal_ordering,
+        dtype=dtype,
+    )
 
-    return eta
 
+@_requires("modin")
+def _modin_reduce_row_partitions(data, map_func):
+    """Map each row partition of a Modin dataframe to a mergeable object, then merge.
 
-def _reorder_by_cluster(association_matrix):
-    """Reorder an association matrix by cluster distances.
+    Unlike ``_modin_reduce_partitions`` in the summary, which maps each column
+    separately, every row partition is mapped with all of its columns, so that
+    statistics of pairs of columns (e.g. cross products) can be computed. The map
+    and reduce steps run on the Modin engine, and only the merged result is
+    gathered on the driver.
 
     Args:
-        association_matrix: A matrix of associations (similarity)
+        data: The Modin dataframe
+        map_func: Function that takes a Pandas dataframe (a row partition) and
+            returns an object with a ``merge`` method
 
     Returns:
-        A Pandas data frame
+        The merged object
     """
-    distance = 1 - association_matrix
+    TreeReduce = _compat["modin.core.dataframe.algebra"].TreeReduce
 
-    # Determine padding dimensions, if non-square
-    max_dim = max(distance.shape[0], distance.shape[1])
-    pad_distance = np.pad(
-        distance,
-        (
-            (0, min(1, max_dim - distance.shape[0])),
-            (0, min(1, max_dim - distance.shape[1])),
-        ),
-        mode="constant",
-        constant_values=0,
+    def _map(partition):
+        return pd.DataFrame(
+            {"__reduced__": [map_func(partition)]}, index=["__reduced__"]
+        )
+
+    def _reduce(partials):
+        result, *others = partials.iloc[:, 0]
+        for other in others:
+            result.merge(other)
+        return pd.DataFrame({"__reduced__": [result]}, index=["__reduced__"])
+
+    query_compiler = data._query_compiler
+    mapped = query_compiler.__constructor__(
+        query_compiler._modin_frame.apply_full_axis(
+            1, _map, new_columns=["__reduced__"]
+        )
     )
+    reduced = TreeReduce.register(_reduce, _reduce)(mapped)
+    return (
+        _compat["modin.utils"]
+        .to_pandas(_compat["modin.pandas"].DataFrame(query_compiler=reduced))
+        .iloc[0, 0]
+    )
+
+
+def _numeric_correlation(
+    numeric,
+    method: str = "pearson",
+    n_jobs: Optional[int] = None,
+    out=None,
+    dtype: str = "float64",
+):
+    """Correlation matrix of in-memory numeric data.
+
+    Args:
+        numeric (DataFrame): The numeric columns
+        method (str): "pearson", "spearman", "kendall" or "mutual_info"
+        n_jobs (int, optional): The number of threads. Defaults to the
+            ``compute.n_jobs`` option.
+        out: A file path to write the correlation matrix to, as float32
+        dtype (str): The floating point type of the correlation matrix
 
-    if distance.shape[0] == distance.shape[1]:
-        y = np.array(pad_distance)[np.triu_indices_from(pad_distance, 1)]
+    Raises:
+        ValueError: Invalid correlation method.
+
+    Returns:
+        A Pandas data frame, without null values
+    """
+    if method == "pearson":
+        return _pearson_correlation(numeric, n_jobs, out=out, dtype=dtype)
+    elif method == "spearman":
+        # Ranks are computed per column, ignoring nulls
+        return _pearson_correlation(numeric.rank(), n_jobs, out=out, dtype=dtype)
+    elif method in ["kendall", "mutual_info"]:
+        if method == "kendall":
+            corr = _kendall_correlation(numeric, n_jobs)
+        else:
+            corr = _mutual_info_matrix(numeric, n_jobs).to_numpy()
+        if out is None:
+            return pd.DataFrame(
+                corr.astype(dtype, copy=False),
+                index=numeric.columns,
+                columns=numeric.columns,
+            )
+        _create_correlation_file(out, corr.shape[0])[:] = corr
+        return _open_correlation_file(out, numeric.columns)
     else:
-        # Non-square matrix
-        y = np.array(pad_distance)[np.tril_indices_from(pad_distance, 1)]
+        raise ValueError(
+            "Correlation method must be 'pearson', 'spearman', 'kendall' or "
+            f"'mutual_info', not {method}"
+        )
 
-    # Use hierarchical clustering to get order
-    link = hierarchy.linkage(y)
-    dendrogram = hierarchy.dendrogram(link, get_leaves=True, no_plot=True)
-    new_order = [x for x in dendrogram["leaves"] if x < max_dim]
 
-    reorder_corr = pd.DataFrame(
-        [row[new_order] for row in association_matrix.values[new_order]]
-    )
+def _kendall_correlation(numeric, n_jobs: Optional[int] = None):
+    """Kendall's tau-b correlation matrix.
 
-    # Assign column and row labels
-    reorder_corr.columns = [association_matrix.columns.values[i] for i in new_order]
-    reorder_corr.set_index(
-        np.array([association_matrix.columns.values[i] for i in new_order]),
-        inplace=True,
+    Each column is converted to integer ranks once. The pairs of columns are then
+    distributed across threads, and each tau is computed from the pairwise
+    complete ranks with Knight's O(n log n) merge sort algorithm (as implemented
+    by ``scipy.stats.kendalltau``), rather than by comparing all pairs of rows.
+    Pairs are presorted by the order of their first column, which is computed once
+    and shared by consecutive pairs, so that only one full sort remains per pair.
+
+    Args:
+        numeric (DataFrame): The numeric columns
+        n_jobs (int, optional): The number of threads. Defaults to the
+            ``compute.n_jobs`` option.
+
+    Returns:
+        The correlation matrix, as a numpy array without null values
+    """
+    k = numeric.shape[1]
+    ranks = [pd.factorize(numeric.iloc[:, i], sort=True)[0] for i in range(k)]
+    observed = [r >= 0 for r in ranks]
+    complete = [o.all() for o in observed]
+    first, second = np.triu_indices(k, 1)
+
+    def _taus(block):
+        taus = []
+        column, order = None, None
+        for i, j in zip(first[block], second[block]):
+            if complete[i] and complete[j]:
+                if i != column:
+                    column, order = i, np.argsort(ranks[i], kind="stable")
+                x, y = ranks[j][order], ranks[i][order]
+            else:
+                valid = observed[i] & observed[j]
+                x, y = ranks[j][valid], ranks[i][valid]
+            taus.append(kendalltau(x, y)[0] if x.size > 1 else np.nan)
+        return taus
+
+    taus = _map_blocks(_taus, first.size, n_jobs=n_jobs)
+    corr = np.diag([float(o.any()) for o in observed])
+    corr[first, second] = taus
+    corr[second, first] = taus
+    return np.nan_to_num(corr)
+
+
+def _mutual_info_matrix(df, n_jobs: Optional[int] = None):
+    """Normalized mutual information for all column pairs.
+
+    Every column is discretized to integer codes once: numeric columns are binned
+    into quantiles, other columns are factorized. The mutual information of each
+    pair is then computed from the 2-D histogram of their codes (a single
+    ``bincount``), over the rows where both are present. Pairs of the upper
+    triangle are distributed across threads. The mutual information is
+    normalized by the geometric mean of the two entropies, so that it is in the
+    range [0, 1].
+
+    Args:
+        df (DataFrame): A data frame
+        n_jobs (int, optional): The number of threads. Defaults to the
+            ``compute.n_jobs`` option.
+
+    Returns:
+        A Pandas data frame, without null values
+    """
+    k = df.shape[1]
+    discretized = [_discretize(df.iloc[:, i]) for i in range(k)]
+    codes = [c for c, _ in discretized]
+    levels = [n_levels for _, n_levels in discretized]
+    observed = [c >= 0 for c in codes]
+    complete = [o.all() for o in observed]
+    first, second = np.triu_indices(k, 1)
+
+    def _mutual_info(i, j):
+        if complete[i] and complete[j]:
+            x, y = codes[i], codes[j]
+        else:
+            valid = observed[i] & observed[j]
+            x, y = codes[i][valid], codes[j][valid]
+        if x.size == 0:
+            return np.nan
+
+        keys = x * levels[j] + y
+        if levels[i] * levels[j] <= 4 * x.size:
+            joint = np.bincount(keys, minlength=levels[i] * levels[j])
+            keys = np.flatnonzero(joint)
+            joint = joint[keys]
+        else:
+            # Sparse 2-D histogram for high cardinality pairs
+            keys, joint = np.unique(keys, return_counts=True)
+        px = np.bincount(x, minlength=levels[i])
+        py = np.bincount(y, minlength=levels[j])
+
+        n = x.size
+        info = (
+            np.sum(
+                joint
+                * np.log(joint * n / (px[keys // levels[j]] * py[keys % levels[j]]))
+            )
+            / n
+        )
+        entropy = _entropy(px, n) * _entropy(py, n)
+        return info / np.sqrt(entropy) if entropy > 0 else np.nan
+
+    info = _map_blocks(
+        lambda block: [_mutual_info(first[p], second[p]) for p in block],
+        first.size,
+        n_jobs=n_jobs,
+    )
+    corr = np.diag([float(np.unique(c[c >= 0]).size > 1) for c in codes])
+    corr[first, second] = info
+    corr[second, first] = info
+    return pd.DataFrame(
+        np.clip(np.nan_to_num(corr), 0, 1), index=df.columns, columns=df.columns
     )
 
-    return reorder_corr
 
+def _discretize(series):
+    """Encode a column as integer codes.
 
-def _reorder_by_original(association_matrix, original_df):
-    """Reorder the matrix to the original order.
+    Numeric columns with more distinct values than the ``correlation.bins`` option
+    are binned into (approximately) equal-frequency quantile bins.
 
     Args:
-        association_matrix (DataFrame): The square matrix of correlations/associations
-        original_df (DataFrame): The original data frame
+        series: A pandas series
 
     Returns:
-        A Pandas Data frame
+        (codes, levels) tuple of the codes (-1 for nulls) and the number of codes
     """
-    # Get the original column order
-    order = [
-        np.where(association_matrix.columns.values == label)[0][0]
-        for label in original_df.columns.values
-        if label in association_matrix.columns.values
-    ]
+    bins = get_option("correlation.bins")
+    if is_numeric_dtype(series.dtype) and not is_bool_dtype(series.dtype):
+        values = series.to_numpy(dtype=np.float64)
+        if pd.unique(values[~np.isnan(values)]).size > bins:
+            edges = np.unique(np.nanquantile(values, np.linspace(0, 1, bins + 1)[1:-1]))
+            codes = np.searchsorted(edges, values, side="right")
+            codes[np.isnan(values)] = -1
+            return codes, edges.size + 1
+    codes, uniques = _factorize_sorted(series)
+    return codes, max(len(uniques), 1)
 
-    reorder_matrix = pd.DataFrame(
-        [row[order] for row in association_matrix.values[order]]
-    )
 
-    # Assign column and row labels
-    reorder_matrix.columns = [association_matrix.columns.values[i] for i in order]
-    reorder_matrix.set_index(
-        np.array([association_matrix.columns.values[i] for i in order]), inplace=True
-    )
+def _entropy(counts, n: int) -> float:
+    """Entropy of a distribution of counts.
+
+    Args:
+        counts: Array of counts
+        n (int): The total count
+
+    Returns:
+        The entropy (in nats)
+    """
+    p = counts[counts > 0] / n
+    return -np.sum(p * np.log(p))
 
-    return reorder_matrix
+
+def _pearson_correlation(
+    numeric, n_jobs: Optional[int] = None, out=None, dtype: str = "float64"
+):
+    """Pearson correlation matrix of in-memory numeric data.
+
+    Args:
+        numeric (DataFrame): The numeric columns
+        n_jobs (int, optional): The number of threads. Defaults to the
+            ``compute.n_jobs`` option.
+        out: A file path to write the correlation matrix to, as float32
+        dtype (str): The floating point type of the correlation matrix
+
+    Returns:
+        A Pandas data frame, without null values
+    """
+    values = numeric.to_numpy(dtype=np.float64)
+    k = values.shape[1]
+    if out is None:
+        corr = np.empty((k, k), dtype=dtype)
+    else:
+        corr = _create_correlation_file(out, k)
+    _blocked_correlation(values, corr, n_jobs=n_jobs)
+
+    if out is None:
+        return pd.DataFrame(corr, index=numeric.columns, columns=numeric.columns)
+    corr.flush()
+    return _open_correlation_file(out, numeric.columns)
+
+
+def _blocked_correlation(values, out, n_jobs: Optional[int] = None):
+    """Pearson correlation matrix, computed tile by tile.
+
+    For complete data, the columns are standardized once, so that every tile of
+    the correlation matrix is a single matrix product of two blocks of columns.
+    With missing values, correlations are computed over the pairwise complete
+    observations (as in ``DataFrame.corr``) from the products of the centered,
+    zero-filled values, their squares and the indicator matrices of observed
+    values. Only the tiles of the upper triangle are computed, in parallel threads
+    (the BLAS kernels release the GIL), and mirrored into the lower triangle.
+    Tiles are written directly to ``out``, which may be a memory-mapped array.
+
+    If ``out`` is float32, complete data is standardized in float64 (so that large
+    means do not cancel) and only the standardized values, and thus the matrix
+    products, are float32.
+
+    Args:
+        values: The 2-D array of values
+        out: The (k, k) array to write the correlation matrix to
+        n_jobs (int, optional): The number of threads. Defaults to the
+            ``compute.n_jobs`` option.
+    """
+    block_size = get_option("correlation.block_size")
+    tile_correlation = _tile_correlation(values, out.dtype)
+
+    starts = range(0, values.shape[1], block_size)
+    tiles = [(i, j) for i in starts for j in starts if i <= j]
+
+    def _tile(i, j):
+        left, right = slice(i, i + block_size), slice(j, j + block_size)
+        tile = tile_correlation(left, right)
+        out[i : i + block_size, j : j + block_size] = tile
+        out[j : j + block_size, i : i + block_size] = tile.T
+
+    _map_blocks(
+        lambda block: [_tile(*tiles[t]) for t in block], len(tiles), n_jobs=n_jobs
+    )
+
+
+def _tile_correlation(values, dtype="float64"):
+    """Prepare the columns for computing tiles of the Pearson correlation matrix.
+
+    For complete data, the columns are standardized once. Otherwise they are
+    centered and zero-filled, and the indicator matrix of observed values is kept.
+
+    Args:
+        values: The 2-D array of values
+        dtype: The floating point type of the standardized values
+
+    Returns:
+        Function taking two slices of columns and returning their tile of the
+        correlation matrix, without null values
+    """
+    observed = ~np.isnan(values)
+    block_size = get_option("correlation.block_size")
+    if observed.all():
+        # Standardize block by block, into the precision of the output
+        standardized = np.empty(values.shape, dtype=dtype)
+        for start in range(0, values.shape[1], block_size):
+            block = values[:, start : start + block_size]
+            block = block - block.mean(axis=0)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                block /= np.sqrt(np.einsum("ij,ij->j", block, block))
+            standardized[:, start : start + block_size] = block
+
+        def tile_correlation(left, right):
+            tile = _standardized_tile(standardized, left, right)
+            return np.clip(np.nan_to_num(tile), -1, 1)
+
+    else:
+        count = observed.sum(axis=0)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            center = np.where(count > 0, np.nansum(values, axis=0) / count, 0)
+        centered = np.where(observed, values - center, 0)
+        indicator = observed.astype(np.float64)
+        squares = centered ** 2
+
+        def tile_correlation(left, right):
+            tile = _masked_tile(centered, squares, indicator, left, right)
+            return np.clip(np.nan_to_num(tile), -1, 1)
+
+    return tile_correlation
+
+
+def _standardized_tile(values, left, right):
+    """Correlations between two blocks of standardized columns.
+
+    Args:
+        values: The 2-D array of standardized values
+        left (slice): The first block of columns
+        right (slice): The second block of columns
+
+    Returns:
+        The tile of the correlation matrix
+    """
+    return values[:, left].T @ values[:, right]
+
+
+def _masked_tile(values, squares, indicator, left, right):
+    """Pairwise complete correlations between two blocks of columns.
+
+    Args:
+        values: The 2-D array of centered values, with nulls as zero
+        squares: The squares of ``values``
+        indicator: The 2-D array of ones where values are observed, else zeros
+        left (slice): The first block of columns
+        right (slice): The second block of columns
+
+    Returns:
+        The tile of the correlation matrix
+    """
+    x, y = values[:, left], values[:, right]
+    x_observed, y_observed = indicator[:, left], indicator[:, right]
+
+    # Sums over the rows where both columns are observed
+    count = x_observed.T @ y_observed
+    sum_x = x.T @ y_observed
+    sum_y = x_observed.T @ y
+    with np.errstate(divide="ignore", invalid="ignore"):
+        comoment = x.T @ y - sum_x * sum_y / count
+        m2_x = squares[:, left].T @ y_observed - sum_x ** 2 / count
+        m2_y = x_observed.T @ squares[:, right] - sum_y ** 2 / count
+        return comoment / np.sqrt(m2_x * m2_y)
+
+
+def _pair_counts(numeric, out=None, n_jobs: Optional[int] = None):
+    """Number of pairwise complete observations for all pairs of columns.
+
+    For complete data, every count is the number of rows. Otherwise the counts
+    are computed tile by tile (of the ``correlation.block_size`` option), from
+    blocks of rows, so that only small indicator matrices of observed values are
+    held in memory at a time.
+
+    Args:
+        numeric (DataFrame): The numeric columns
+        out: The file path the correlation matrix is written to, if any. The counts
+            are then kept as float32 (as the correlations), which is exact up to
+            2 ** 24 rows.
+        n_jobs (int, optional): The number of threads. Defaults to the
+            ``compute.n_jobs`` option.
+
+    Returns:
+        A Pandas data frame of counts. For complete data, it is a read-only view of
+        a single count.
+    """
+    missing = numeric.isnull().to_numpy()
+    k = numeric.shape[1]
+    if not missing.any():
+        counts = np.broadcast_to(np.int64(numeric.shape[0]), (k, k))
+        return pd.DataFrame(counts, index=numeric.columns, columns=numeric.columns)
+
+    counts = np.empty((k, k), dtype=np.int64 if out is None else np.float32)
+    block_size = get_option("correlation.block_size")
+    starts = range(0, k, block_size)
+    tiles = [(i, j) for i in starts for j in starts if i <= j]
+
+    def _tile(i, j):
+        # Rows are also taken by blocks, so that float32 products count exactly
+        tile = 0
+        for start in range(0, missing.shape[0], block_size):
+            rows = missing[start : start + block_size]
+            left = ~rows[:, i : i + block_size]
+            right = ~rows[:, j : j + block_size]
+            product = left.T.astype(np.float32) @ right.astype(np.float32)
+            tile = tile + product.astype(np.int64)
+        counts[i : i + block_size, j : j + block_size] = tile
+        counts[j : j + block_size, i : i + block_size] = tile.T
+
+    _map_blocks(
+        lambda block: [_tile(*tiles[t]) for t in block], len(tiles), n_jobs=n_jobs
+    )
+    return pd.DataFrame(counts, index=numeric.columns, columns=numeric.columns)
+
+
+def _create_correlation_file(filepath, k: int):
+    """Create a float32 memory-mapped file for a (k, k) correlation matrix.
+
+    Args:
+        filepath: The file path
+        k (int): The number of columns
+
+    Returns:
+        The writable memory-mapped array
+    """
+    return np.memmap(filepath, dtype=np.float32, mode="w+", shape=(k, k))
+
+
+def _open_correlation_file(filepath, columns):
+    """Open a float32 correlation matrix file as a read-only data frame.
+
+    Args:
+        filepath: The file path
+        columns: The column names, in the order of the matrix
+
+    Returns:
+        A Pandas data frame backed by the memory-mapped file
+    """
+    k = len(columns)
+    corr = np.memmap(filepath, dtype=np.float32, mode="r", shape=(k, k))
+    return pd.DataFrame(corr, index=columns, columns=columns, copy=False)
+
+
+def _accumulate(accumulator, chunks):
+    """Accumulate the numeric columns of chunks of data.
+
+    Args:
+        accumulator: The ``_CorrelationAccumulator``
+        chunks: An iterator of Pandas dataframes
+
+    Raises:
+        ValueError: Invalid input data type.
+    """
+    for chunk in chunks:
+        if not _is_dataframe(chunk):
+            raise ValueError("Chunks must be Pandas DataFrames")
+        accumulator.update(chunk.select_dtypes(["number"]))
+
+
+class _CorrelationAccumulator:
+    """Mergeable co-moments for the Pearson correlation of numeric columns.
+
+    For every pair of columns, the statistics are accumulated over the rows where
+    both values are present (pairwise complete observations, as in
+    ``DataFrame.corr``). Chunks are centered on their column means before the
+    cross products are taken, and combined using the parallel form of Welford's
+    algorithm, so chunks may be accumulated (or merged) in any order without
+    catastrophic cancellation.
+
+    Attributes:
+        columns (list): The column names
+        count: Matrix of the number of rows where both columns are present
+        mean: Matrix of the mean of the row column, over the rows where both
+            columns are present. The mean of the other column is ``mean.T``.
+        m2: Matrix of the sum of squared differences from ``mean``
+        comoment: Matrix of the sum of products of differences from the means
+    """
+
+    def __init__(self):
+        self.columns: List = []
+        self.count = np.zeros((0, 0))
+        self.mean = np.zeros((0, 0))
+        self.m2 = np.zeros((0, 0))
+        self.comoment = np.zeros((0, 0))
+
+    def update(self, data):
+        """Accumulate a chunk of data.
+
+        Args:
+            data: The Pandas dataframe of numeric columns
+        """
+        self.merge(_chunk_comoments(data))
+
+    def merge(self, other: "_CorrelationAccumulator"):
+        """Merge another accumulator into this accumulator.
+
+        Args:
+            other: The accumulator to merge
+        """
+        columns = self.columns + [c for c in other.columns if c not in self.columns]
+        self._reindex(columns)
+        position = pd.Index(columns).get_indexer(other.columns)
+        block = np.ix_(position, position)
+
+        count_b = other.count
+        count = self.count[block] + count_b
+        with np.errstate(divide="ignore", invalid="ignore"):
+            weight = np.where(count > 0, count_b / count, 0)
+        delta = other.mean - self.mean[block]
+        scaled = self.count[block] * weight
+        self.mean[block] += delta * weight
+        self.m2[block] += other.m2 + delta ** 2 * scaled
+        self.comoment[block] += other.comoment + delta * delta.T * scaled
+        self.count[block] = count
+
+    def correlation(self):
+        """The Pearson correlation matrix.
+
+        Returns:
+            A Pandas data frame
+        """
+        with np.errstate(divide="ignore", invalid="ignore"):
+            corr = self.comoment / np.sqrt(self.m2 * self.m2.T)
+        corr = np.clip(np.where(np.isfinite(corr), corr, np.nan), -1, 1)
+        return pd.DataFrame(corr, index=self.columns, columns=self.columns)
+
+    def pair_counts(self):
+        """The number of pairwise complete observations.
+
+        Returns:
+            A Pandas data frame
+        """
+        return pd.DataFrame(
+            self.count.astype(np.int64), index=self.columns, columns=self.columns
+        )
+
+    def _reindex(self, columns: list):
+        if len(columns) == len(self.columns):
+            return
+        k = len(self.columns)
+        for name in ["count", "mean", "m2", "comoment"]:
+            expanded = np.zeros((len(columns), len(columns)))
+            expanded[:k, :k] = getattr(self, name)
+            setattr(self, name, expanded)
+        self.columns = columns
+
+
+def _chunk_comoments(data):
+    """Compute the co-moments of a chunk of numeric data.
+
+    Missing values are handled with indicator matrices: every statistic is a
+    matrix product of the (centered, zero-filled) values and the indicators.
+
+    Args:
+        data: The Pandas dataframe of numeric columns
+
+    Returns:
+        _CorrelationAccumulator
+    """
+    values = data.to_numpy(dtype=np.float64)
+    observed = ~np.isnan(values)
+    count = observed.sum(axis=0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        center = np.where(count > 0, np.nansum(values, axis=0) / count, 0)
+    values = np.where(observed, values - center, 0)
+
+    accumulator = _CorrelationAccumulator()
+    accumulator.columns = list(data.columns)
+    accumulator.comoment = values.T @ values
+    if observed.all():
+        # The values are centered on the complete columns' means
+        accumulator.count = np.full((data.shape[1], data.shape[1]), data.shape[0])
+        accumulator.mean = np.broadcast_to(center[:, None], count.shape * 2).copy()
+        accumulator.m2 = np.broadcast_to(
+            np.sum(values ** 2, axis=0)[:, None], count.shape * 2
+        ).copy()
+        return accumulator
+
+    indicator = observed.astype(np.float64)
+    pair_count = indicator.T @ indicator
+    total = values.T @ indicator
+    with np.errstate(divide="ignore", invalid="ignore"):
+        shift = np.where(pair_count > 0, total / pair_count, 0)
+    accumulator.count = pair_count
+    accumulator.mean = center[:, None] + shift
+    accumulator.m2 = (values ** 2).T @ indicator - total * shift
+    accumulator.comoment -= total * shift.T
+    return accumulator
+
+
+class _AssociationAccumulator:
+    """Mergeable statistics for the associations of numeric and categorical columns.
+
+    In addition to the co-moments of the numeric columns, the contingency counts
+    of all pairs of categorical levels (for Cramer's V) and the count and sum of
+    each numeric column per categorical level (for the correlation ratio) are
+    accumulated. Levels are matched by value when accumulators are merged, so
+    chunks need not contain the same levels.
+
+    Attributes:
+        numeric: The ``_CorrelationAccumulator`` of the numeric columns
+        columns (list): The categorical column names
+        levels: MultiIndex of the (column, value) of each categorical level
+        counts: Sparse matrix of the number of rows where each pair of levels
+            co-occur
+        level_counts: Matrix of the number of non-null values of each numeric
+            column (columns), per level (rows)
+        level_sums: Matrix of the sum of each numeric column, per level
+    """
+
+    def __init__(self):
+        self.numeric = _CorrelationAccumulator()
+        self.columns: List = []
+        self.levels = pd.MultiIndex.from_arrays([[], []])
+        self.counts = sparse.csr_matrix((0, 0))
+        self.level_counts = np.zeros((0, 0))
+        self.level_sums = np.zeros((0, 0))
+
+    def update(self, numeric, categoric):
+        """Accumulate a chunk of data.
+
+        Args:
+            numeric: The Pandas dataframe of numeric columns
+            categoric: The Pandas dataframe of categorical columns
+        """
+        values = numeric.to_numpy(dtype=np.float64)
+        observed = ~np.isnan(values)
+        indicator, uniques, owner = _one_hot(categoric)
+
+        other = _AssociationAccumulator()
+        other.numeric = _chunk_comoments(numeric)
+        other.columns = list(categoric.columns)
+        other.levels = pd.MultiIndex.from_arrays(
+            [
+                categoric.columns[owner],
+                np.concatenate([np.asarray(u, dtype=object) for u in uniques] + [[]]),
+            ]
+        )
+        other.counts = indicator.T @ indicator
+        other.level_counts = indicator.T @ observed.astype(np.float64)
+        other.level_sums = indicator.T @ np.where(observed, values, 0)
+        self.merge(other)
+
+    def merge(self, other: "_AssociationAccumulator"):
+        """Merge another accumulator into this accumulator.
+
+        Args:
+            other: The accumulator to merge
+        """
+        numeric = pd.Index(self.numeric.columns + other.numeric.columns).unique()
+        levels = self.levels.append(other.levels).unique()
+        counts = sparse.csr_matrix((len(levels), len(levels)))
+        level_counts = np.zeros((len(levels), len(numeric)))
+        level_sums = np.zeros((len(levels), len(numeric)))
+        for accumulator in [self, other]:
+            position = levels.get_indexer(accumulator.levels)
+            block = np.ix_(position, numeric.get_indexer(accumulator.numeric.columns))
+            level_counts[block] += accumulator.level_counts
+            level_sums[block] += accumulator.level_sums
+            coo = accumulator.counts.tocoo()
+            counts = counts + sparse.csr_matrix(
+                (coo.data, (position[coo.row], position[coo.col])), shape=counts.shape
+            )
+
+        self.numeric.merge(other.numeric)
+        self.columns = self.columns + [
+            c for c in other.columns if c not in self.columns
+        ]
+        self.levels = levels
+        self.counts = counts
+        self.level_counts = level_counts
+        self.level_sums = level_sums
+
+    def association_matrix(self):
+        """The combined association matrix, as for in-memory data.
+
+        Returns:
+            A Pandas data frame, with the numeric columns first
+        """
+        # Sort the levels of each categorical column, as when one-hot encoding
+        owner = pd.Index(self.columns).get_indexer(self.levels.get_level_values(0))
+        rank = np.empty(owner.size, dtype=np.int64)
+        for i in range(len(self.columns)):
+            position = np.flatnonzero(owner == i)
+            rank[position] = _factorize_sorted(
+                pd.Series(self.levels.get_level_values(1)[position])
+            )[0]
+        order = np.lexsort((rank, owner))
+        owner = owner[order]
+
+        association_cramers = _cramers_v_from_counts(
+            self.counts[order][:, order], owner, np.asarray(self.columns)
+        )
+        if len(self.numeric.columns) == 0:
+            return _combine_associations(None, association_cramers, None)
+
+        # The statistics of each numeric column over its non-null values
+        association_cr = _correlation_ratio_from_sums(
+            self.level_counts[order],
+            self.level_sums[order],
+            owner,
+            np.diag(self.numeric.mean),
+            np.diag(self.numeric.m2),
+            np.asarray(self.numeric.columns),
+            np.asarray(self.columns),
+        )
+        return _combine_associations(
+            np.abs(self.numeric.correlation().fillna(0)),
+            association_cramers,
+            association_cr,
+        )
+
+
+def _sample_rows(data, sample, stratify=None, rng=None):
+    """Sample rows uniformly at random, or stratified by a column.
+
+    Each stratum is sampled in proportion to its number of rows, rounded up or down
+    at random, so that small strata are still sampled at the expected rate (e.g.
+    across many chunks). The sampled rows keep their original order.
+
+    Args:
+        data (DataFrame): A Pandas (or Modin) data frame
+        sample (int or float): The number (int) or fraction (float) of rows
+        stratify (str, optional): The column to stratify by. Nulls form a stratum.
+        rng: A numpy random generator. Defaults to a fixed seed, so that samples
+            are reproducible.
+
+    Raises:
+        ValueError: Invalid sample size.
+
+    Returns:
+        The sampled data frame
+    """
+    if isinstance(sample, float) and 0 < sample <= 1:
+        fraction = sample
+    elif isinstance(sample, (int, np.integer)) and sample > 0:
+        fraction = min(sample / max(data.shape[0], 1), 1)
+    else:
+        raise ValueError(
+            "sample must be a number of rows (int) or a fraction of rows (float), "
+            f"not {sample}"
+        )
+    rng = np.random.default_rng(0) if rng is None else rng
+
+    if data.shape[0] == 0:
+        return data
+    if stratify is None:
+        if isinstance(sample, float):
+            sample = int(np.floor(data.shape[0] * fraction + rng.random()))
+        positions = rng.choice(data.shape[0], min(sample, data.shape[0]), False)
+        return data.iloc[np.sort(positions)]
+
+    strata = pd.factorize(data[stratify])[0] + 1
+    sizes = np.bincount(strata)
+    targets = np.floor(sizes * fraction + rng.random(sizes.size)).astype(np.int64)
+    order = np.argsort(strata, kind="stable")
+    starts = np.cumsum(sizes) - sizes
+    positions = np.concatenate(
+        [
+            order[start + rng.choice(size, target, False)]
+            for start, size, target in zip(starts, sizes, targets)
+        ]
+    )
+    return data.iloc[np.sort(positions)]
+
+
+def _fisher_confidence_interval(correlation, pair_counts, variance: float = 1):
+    """Confidence intervals of correlations, from Fisher's z-transform.
+
+    The z-transformed correlations are approximately normal, with a standard error
+    of ``sqrt(variance / (n - 3))`` for ``n`` pairwise complete observations.
+
+    Args:
+        correlation (DataFrame): The correlation matrix
+        pair_counts (DataFrame): The number of pairwise complete observations
+        variance (float): The variance factor, i.e. 1 for Pearson correlations, or
+            1.06 for Spearman correlations (Fieller, Hartley and Pearson, 1957)
+
+    Returns:
+        (lower, upper) tuple of Pandas data frames, null where there are too few
+        observations
+    """
+    count = pair_counts.to_numpy(dtype=np.float64)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        error = np.where(count > 3, np.sqrt(variance / (count - 3)), np.nan)
+    z = np.arctanh(
+        np.clip(correlation.to_numpy(dtype=np.float64), -1 + 1e-12, 1 - 1e-12)
+    )
+    margin = norm.ppf((1 + get_option("correlation.confidence")) / 2) * error
+    return tuple(
+        pd.DataFrame(
+            np.tanh(bound), index=correlation.index, columns=correlation.columns
+        )
+        for bound in [z - margin, z + margin]
+    )
+
+
+def _bootstrap_confidence_interval(numeric):
+    """Bootstrap confidence intervals of the Pearson correlations of a sample.
+
+    The rows are randomly split into blocks, and the co-moments of each block are
+    computed once. Each bootstrap replicate resamples the blocks with replacement
+    and merges their co-moments, weighted by the number of times each block was
+    drawn, without revisiting the rows. The merge is linear in the weights, so all
+    replicates are merged at once by matrix products of the replicate weights and
+    the block statistics, for batches of the pairs in the upper triangle. The
+    standard error of the (Fisher z-transformed) correlations across replicates
+    gives a normal interval around the correlations of the whole sample.
+
+    Args:
+        numeric (DataFrame): The sampled numeric columns
+
+    Returns:
+        (lower, upper) tuple of Pandas data frames, null where the correlation is
+        undefined
+    """
+    rng = np.random.default_rng(0)
+    n_blocks = max(min(get_option("correlation.bootstrap_blocks"), numeric.shape[0]), 1)
+    blocks = [
+        _chunk_comoments(numeric.iloc[positions])
+        for positions in np.array_split(rng.permutation(numeric.shape[0]), n_blocks)
+    ]
+    k = numeric.shape[1]
+    rows, cols = np.triu_indices(k)
+
+    # The first row of weights merges every block once, i.e. the whole sample
+    replicates = get_option("correlation.bootstrap_replicates")
+    weights = np.vstack(
+        [
+            np.ones(n_blocks),
+            rng.multinomial(n_blocks, np.full(n_blocks, 1 / n_blocks), replicates),
+        ]
+    )
+    z = np.empty((replicates + 1, rows.size))
+    batch = max(2 ** 20 // (replicates + 1), 1)
+    for start in range(0, rows.size, batch):
+        pairs = slice(start, start + batch)
+        first, second = rows[pairs], cols[pairs]
+        count, mean, mean_t, m2, m2_t, comoment = (
+            np.stack([statistic(block) for block in blocks])
+            for statistic in [
+                lambda block: block.count[first, second],
+                lambda block: block.mean[first, second],
+                lambda block: block.mean[second, first],
+                lambda block: block.m2[first, second],
+                lambda block: block.m2[second, first],
+                lambda block: block.comoment[first, second],
+            ]
+        )
+        # Center the block means on the sample means, to avoid cancellation
+        total = count.sum(axis=0)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            mean -= np.where(total > 0, np.sum(count * mean, axis=0) / total, 0)
+            mean_t -= np.where(total > 0, np.sum(count * mean_t, axis=0) / total, 0)
+            merged = weights @ count
+            shift = weights @ (count * mean) / merged
+            shift_t = weights @ (count * mean_t) / merged
+            merged_m2 = weights @ (m2 + count * mean ** 2) - merged * shift ** 2
+            merged_m2_t = weights @ (m2_t + count * mean_t ** 2) - merged * shift_t ** 2
+            merged_comoment = (
+                weights @ (comoment + count * mean * mean_t) - merged * shift * shift_t
+            )
+            corr = merged_comoment / np.sqrt(merged_m2 * merged_m2_t)
+        z[:, pairs] = np.arctanh(np.clip(corr, -1 + 1e-12, 1 - 1e-12))
+
+    estimate = z[0]
+    error = np.std(z[1:], axis=0, ddof=1) if replicates > 1 else np.zeros(rows.size)
+    margin = norm.ppf((1 + get_option("correlation.confidence")) / 2) * error
+    bounds = []
+    for bound in [estimate - margin, estimate + margin]:
+        matrix = np.empty((k, k))
+        matrix[rows, cols] = matrix[cols, rows] = np.tanh(bound)
+        bounds.append(
+            pd.DataFrame(matrix, index=numeric.columns, columns=numeric.columns)
+        )
+    return tuple(bounds)
+
+
+def _cramers_v_matrix(df):
+    """Computes Cramer's V for all column pairs.
+
+    Each column is one-hot encoded once into a sparse indicator matrix. The
+    contingency tables of all column pairs are then the blocks of its Gram matrix,
+    from which the chi-squared statistics and the bias-corrected Cramer's V (or,
+    for 2x2 tables, the phi coefficient) are computed in bulk. Only the upper
+    triangle of pairs is computed. As with ``pd.crosstab``, rows with nulls are
+    excluded pairwise.
+
+    Adapted from https://github.com/shakedzy/dython/blob/master/dython/nominal.py
+
+    Args:
+        df (DataFrame): A data frame containing only categorical features
+
+    Returns:
+        A pandas data frame
+    """
+    indicator, _, owner = _one_hot(df)
+    return _cramers_v_from_counts(indicator.T @ indicator, owner, df.columns.values)
+
+
+def _one_hot(df):
+    """One-hot encode all columns into a single sparse indicator matrix.
+
+    Args:
+        df (DataFrame): A data frame
+
+    Returns:
+        (indicator, uniques, owner) tuple of the sparse (rows x levels) indicator
+        matrix, the sorted levels of each column, and the column of each level
+    """
+    rows, levels, owner, uniques = [], [], [], []
+    offset = 0
+    for i in range(df.shape[1]):
+        codes, column_uniques = _factorize_sorted(df.iloc[:, i])
+        valid = np.flatnonzero(codes >= 0)
+        rows.append(valid)
+        levels.append(codes[valid] + offset)
+        owner.append(np.full(len(column_uniques), i, dtype=np.int64))
+        uniques.append(column_uniques)
+        offset += len(column_uniques)
+    rows = np.concatenate(rows + [np.empty(0, dtype=np.int64)])
+    levels = np.concatenate(levels + [np.empty(0, dtype=np.int64)])
+    indicator = sparse.csr_matrix(
+        (np.ones(rows.size), (rows, levels)), shape=(df.shape[0], offset)
+    )
+    return indicator, uniques, np.concatenate(owner + [np.empty(0, dtype=np.int64)])
+
+
+def _cramers_v_from_counts(counts, owner, index):
+    """Computes Cramer's V for all column pairs from co-occurrence counts.
+
+    Args:
+        counts: Sparse matrix of the number of rows where each pair of levels
+            co-occur. The levels of each column must be contiguous and sorted.
+        owner: The column of each level
+        index: The column names
+
+    Returns:
+        A pandas data frame
+    """
+    k = len(index)
+    offset = counts.shape[0]
+
+    # Co-occurrence counts of all pairs of levels
+    counts = counts.tocoo()
+    u, v, c = counts.row.astype(np.int64), counts.col.astype(np.int64), counts.data
+    owner_u, owner_v = owner[u], owner[v]
+
+    # Margins: count of level u among the rows where the other column is not null
+    margin_keys, inverse = np.unique(u * k + owner_v, return_inverse=True)
+    margins = np.bincount(inverse, weights=c)
+    margin_u = margins[inverse]
+    margin_v = margins[np.searchsorted(margin_keys, v * k + owner_u)]
+
+    upper = owner_u <= owner_v
+    pairs = owner_u[upper] * k + owner_v[upper]
+    n = np.bincount(pairs, weights=c[upper], minlength=k * k).reshape(k, k)
+    phi2 = (
+        np.bincount(
+            pairs,
+            weights=(c ** 2 / (margin_u * margin_v))[upper],
+            minlength=k * k,
+        ).reshape(k, k)
+        - 1
+    )
+    # Number of levels of column a observed alongside column b (table shape)
+    margin_levels = margin_keys // k
+    margin_pairs = owner[margin_levels] * k + margin_keys % k
+    r = np.bincount(margin_pairs, minlength=k * k).reshape(k, k)
+    q = r.T
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        phi2corr = np.maximum(0, phi2 - ((q - 1) * (r - 1)) / (n - 1))
+        rcorr = r - ((r - 1) ** 2) / (n - 1)
+        qcorr = q - ((q - 1) ** 2) / (n - 1)
+        cramers = np.sqrt(phi2corr / np.minimum(qcorr - 1, rcorr - 1))
+    cramers[(n == r) | (n == q)] = 1.0
+
+    # 2x2 tables: the (signed) phi coefficient, i.e. Matthews correlation
+    a, b = np.nonzero(np.triu((r == 2) & (q == 2)))
+    if a.size > 0:
+        # The second (larger) level of each column, among rows observed in the pair
+        second = np.full(k * k, -1, dtype=np.int64)
+        np.maximum.at(second, margin_pairs, margin_levels)
+        second = second.reshape(k, k)
+        u1, v1 = second[a, b], second[b, a]
+        count_keys = u * offset + v
+        order = np.argsort(count_keys)
+        c11 = _lookup(count_keys[order], c[order], u1 * offset + v1)
+        det = n[a, b] * c11 - (
+            _lookup(margin_keys, margins, u1 * k + b)
+            * _lookup(margin_keys, margins, v1 * k + a)
+        )
+        cramers[a, b] = np.sign(det) * np.sqrt(np.maximum(phi2[a, b], 0))
+
+    cramers[n == 0] = np.nan
+    cramers = np.triu(cramers) + np.triu(cramers, 1).T
+
+    # Cramer's V can be NaN when there are not enough instances in a category
+    return pd.DataFrame(np.nan_to_num(cramers), index=index, columns=index)
+
+
+def _factorize_sorted(values):
+    """Encode values as integer codes, in sorted order of the values.
+
+    Args:
+        values: A pandas series
+
+    Returns:
+        (codes, uniques) tuple, with -1 codes for nulls
+    """
+    try:
+        return pd.factorize(values, sort=True)
+    except TypeError:
+        # Unorderable (e.g. mixed type) or unhashable values
+        return pd.factorize(values.astype(str).where(values.notnull()), sort=True)
+
+
+def _lookup(keys, values, query):
+    """Look up values by sorted keys, with zero for missing keys.
+
+    Args:
+        keys: Sorted array of keys
+        values: Array of values
+        query: Array of keys to look up
+
+    Returns:
+        Array of values
+    """
+    position = np.minimum(np.searchsorted(keys, query), keys.size - 1)
+    return np.where(keys[position] == query, values[position], 0)
+
+
+def _correlation_ratio_matrix(num_df, cat_df):
+    """Computes correlation ratio for all numeric-categoric pairs of columns.
+
+    All categorical columns are one-hot encoded once, and the per-category counts
+    and sums of all numeric columns are computed together with one sparse matrix
+    product.
+
+    Args:
+        num_df (DataFrame): A dataframe containing only numeric features
+        cat_df (DataFrame): A dataframe containing only categorical features
+
+    Returns:
+        A pandas data frame
+    """
+    num_index = num_df.columns.values
+    cat_index = cat_df.columns.values
+
+    values = num_df.to_numpy(dtype=np.float64)
+    observed = ~np.isnan(values)
+    values = np.where(observed, values, 0)
+    count = observed.sum(axis=0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ybar = values.sum(axis=0) / count
+        total_variance = np.sum(np.where(observed, values - ybar, 0) ** 2, axis=0)
+
+    indicator, _, owner = _one_hot(cat_df)
+    return _correlation_ratio_from_sums(
+        indicator.T @ observed.astype(np.float64),
+        indicator.T @ values,
+        owner,
+        ybar,
+        total_variance,
+        num_index,
+        cat_index,
+    )
+
+
+def _correlation_ratio_from_sums(
+    count, total, owner, ybar, total_variance, num_index, cat_index
+):
+    """Computes correlation ratios from the per-category sums of numeric columns.
+
+    Args:
+        count (ndarray): The number of non-null values of each numeric column
+            (columns), per category level (rows)
+        total (ndarray): The sum of each numeric column, per category level
+        owner (ndarray): The categorical column of each level
+        ybar (ndarray): The mean of each numeric column
+        total_variance (ndarray): The sum of squared deviations from the mean
+            of each numeric column
+        num_index: The numeric column names
+        cat_index: The categorical column names
+
+    Returns:
+        A pandas data frame
+    """
+    with np.errstate(divide="ignore", invalid="ignore"):
+        category_variance = np.where(count > 0, total / count - ybar, 0) ** 2
+    # Sum the weighted variance of the levels of each categorical column
+    levels = sparse.csr_matrix(
+        (np.ones(owner.size), (owner, np.arange(owner.size))),
+        shape=(len(cat_index), owner.size),
+    )
+    weighted_category_variance = levels @ (count * category_variance)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        eta = np.sqrt(weighted_category_variance / total_variance)
+
+    return pd.DataFrame(eta.T, index=num_index, columns=cat_index)
+
+
+def _reorder_by_cluster(
+    association_matrix, linkage: str = "single", optimal_ordering: bool = False
+):
+    """Reorder an association matrix by cluster distances.
+
+    Args:
+        association_matrix: A square matrix of associations (similarity)
+        linkage (str): A hierarchical linkage method, or "spectral"
+        optimal_ordering (bool): If True, use optimal leaf ordering
+
+    Returns:
+        A Pandas data frame
+    """
+    values = association_matrix.to_numpy()
+    k = values.shape[0]
+    if k < 3:
+        order = np.arange(k)
+    elif linkage == "spectral":
+        order = _spectral_order(values)
+    else:
+        # Use hierarchical clustering to get order
+        distance = 1 - values[np.triu_indices(k, 1)]
+        link = hierarchy.linkage(
+            distance, method=linkage, optimal_ordering=optimal_ordering
+        )
+        order = hierarchy.leaves_list(link)
+
+    return _reorder(association_matrix, order)
+
+
+def _spectral_order(values):
+    """Approximate seriation of a similarity matrix.
+
+    The columns are ordered along the Fiedler vector, i.e. the eigenvector of the
+    second largest eigenvalue of the normalized similarity matrix. Only a few
+    matrix-vector products are required, rather than a full clustering.
+
+    Args:
+        values: A square matrix of associations in [-1, 1]
+
+    Returns:
+        Array of column positions
+    """
+    similarity = (1 + values) / 2
+    scale = 1 / np.sqrt(similarity.sum(axis=1))
+    similarity *= scale[:, None]
+    similarity *= scale[None, :]
+    start = np.random.default_rng(0).random(values.shape[0])
+    _, vectors = eigsh(similarity, k=2, which="LA", v0=start)
+    fiedler = vectors[:, 0] * scale
+    # Fix the sign (direction) of the eigenvector
+    if fiedler[np.argmax(np.abs(fiedler))] < 0:
+        fiedler = -fiedler
+    return np.argsort(fiedler, kind="stable")
+
+
+def _reorder_by_original(association_matrix, original_df):
+    """Reorder the matrix to the original order.
+
+    Args:
+        association_matrix (DataFrame): The square matrix of correlations/associations
+        original_df (DataFrame): The original data frame
+
+    Returns:
+        A Pandas Data frame
+    """
+    # Get the original column order
+    order = association_matrix.columns.get_indexer(original_df.columns)
+    return _reorder(association_matrix, order[order >= 0])
+
+
+def _reorder(association_matrix, order):
+    """Reorder the rows and columns of a square matrix in one indexing step.
+
+    If the order is unchanged, the matrix itself is returned rather than a copy.
+
+    Args:
+        association_matrix (DataFrame): The square matrix
+        order: Array of positions
+
+    Returns:
+        A Pandas data frame
+    """
+    if np.array_equal(order, np.arange(association_matrix.shape[0])):
+        return association_matrix
+    labels = association_matrix.columns[order]
+    return pd.DataFrame(
+        association_matrix.to_numpy()[np.ix_(order, order)],
+        index=labels,
+        columns=labels,
+    )
 
 
 @_requires("plotly")
@@ -406,11 +2265,9 @@ def _plotly_viz_correlation_matrix(association_matrix):
     Returns:
         The plotly figure
     """
-    # Plot lower left triangle
-    x_ind, y_ind = np.triu_indices(association_matrix.shape[0])
+    # Plot lower left triangle, on a copy as the matrix may be read-only
     corr = association_matrix.to_numpy()
-    for x, y in zip(x_ind, y_ind):
-        corr[x, y] = None
+    corr = np.where(np.triu(np.ones(corr.shape, dtype=bool)), np.nan, corr)
 
     # Set up the color scale
     cscale = mpl_to_plotly_cmap(get_p_RdBl_cmap())
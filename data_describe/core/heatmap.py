@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Optional
 
 import pandas as pd
 import numpy as np
@@ -24,10 +24,15 @@ class HeatmapWidget(BaseWidget):
     Attributes:
         input_data: The input data.
         colnames: Names of numeric columns.
-        std_data: The transposed, standardized data after scaling.
+        std_data: The transposed, standardized data after scaling. If the data has
+            more rows than heatmap columns, the rows are aggregated into bins.
         missing: If True, the heatmap shows missing values as indicators
             instead of standardized values.
-        missing_data: The missing value indicator data.
+        missing_data: The missing value indicator data, aggregated into bins
+            like ``std_data``.
+        records: The record number of the first row of each heatmap column, if
+            rows were aggregated into bins. With the "minmax" aggregation, the
+            maximum of each bin is placed halfway through the bin.
     """
 
     def __init__(
@@ -37,6 +42,7 @@ class HeatmapWidget(BaseWidget):
         std_data=None,
         missing=False,
         missing_data=None,
+        records=None,
         **kwargs,
     ):
         """Data heatmap.
@@ -48,6 +54,7 @@ class HeatmapWidget(BaseWidget):
             missing (bool): If True, the heatmap shows missing values as indicators
                 instead of standardized values.
             missing_data: The missing value indicator data.
+            records: The record number of the first row of each heatmap column.
         """
         super(HeatmapWidget, self).__init__(**kwargs)
         self.input_data = input_data
@@ -55,6 +62,7 @@ class HeatmapWidget(BaseWidget):
         self.std_data = std_data
         self.missing = missing
         self.missing_data = missing_data
+        self.records = records
         self.viz_data = missing_data if missing else std_data
 
     def __str__(self):
@@ -85,12 +93,22 @@ class HeatmapWidget(BaseWidget):
             raise ValueError("Could not find data to visualize.")
 
         return _get_viz_backend(backend).viz_data_heatmap(
-            self.viz_data, colnames=self.colnames, missing=self.missing, **kwargs
+            self.viz_data,
+            colnames=self.colnames,
+            missing=self.missing,
+            records=self.records,
+            **kwargs,
         )
 
 
 def data_heatmap(
-    data, missing=False, compute_backend=None, viz_backend=None, **kwargs
+    data,
+    missing=False,
+    bins: Optional[int] = None,
+    aggregate: str = "mean",
+    compute_backend=None,
+    viz_backend=None,
+    **kwargs,
 ) -> HeatmapWidget:
     """Visualizes data patterns in the entire dataset by visualizing as a heatmap.
 
@@ -102,9 +120,20 @@ def data_heatmap(
 
     Missing: Visualize only missing values.
 
+    Data with more rows than ``bins`` is aggregated into (at most) ``bins``
+    heatmap columns of consecutive records, so that the figure does not grow
+    with the number of rows.
+
     Args:
         data: A pandas data frame
         missing (bool): If True, show only missing values
+        bins (int, optional): The maximum number of heatmap columns. Defaults to
+            the ``heatmap.bins`` option.
+        aggregate (str): How the rows of each bin are aggregated: "mean",
+            "minmax" (the envelope of the bin, as two columns for its minimum and
+            maximum) or "maxabs" (the value of largest magnitude, which keeps
+            outliers visible). With ``missing``, "mean" shows the fraction of
+            missing values in each bin.
         compute_backend: The compute backend.
         viz_backend: The visualization backend.
         **kwargs: Keyword arguments
@@ -113,23 +142,31 @@ def data_heatmap(
         The data heatmap.
     """
     hwidget = _get_compute_backend(compute_backend, data).compute_data_heatmap(
-        data, missing=missing, **kwargs
+        data, missing=missing, bins=bins, aggregate=aggregate, **kwargs
     )
     hwidget.viz_backend = viz_backend
     return hwidget
 
 
 def _pandas_compute_data_heatmap(
-    data, missing: bool = False, **kwargs
+    data,
+    missing: bool = False,
+    bins: Optional[int] = None,
+    aggregate: str = "mean",
+    **kwargs,
 ) -> HeatmapWidget:
     """Pre-processes data for the data heatmap.
 
     Values are standardized (removing the mean and scaling to unit variance).
     If `missing` is set to True, the dataframe flags missing records using 1/0.
+    Rows are then aggregated into bins if there are more rows than ``bins``.
 
     Args:
         data: The dataframe
         missing (bool): If True, uses missing values instead
+        bins (int, optional): The maximum number of heatmap columns. Defaults to
+            the ``heatmap.bins`` option.
+        aggregate (str): "mean", "minmax" or "maxabs"
         **kwargs: Keyword arguments.
 
     Raises:
@@ -140,29 +177,91 @@ def _pandas_compute_data_heatmap(
     """
     if not _is_dataframe(data):
         raise ValueError("Unsupported input data type")
+    if bins is None:
+        bins = get_option("heatmap.bins")
 
     if missing:
         missing_data = data.isna().astype(int)
         colnames = data.columns.values
+        missing_data, records = _bin_records(missing_data, bins, aggregate)
         return HeatmapWidget(
             input_data=data,
             colnames=colnames,
             missing=True,
             missing_data=missing_data.transpose(),
+            records=records,
         )
     else:
         data = data.select_dtypes(["number"])
         colnames = data.columns.values
         scaler = StandardScaler()
         std_data = pd.DataFrame(scaler.fit_transform(data), columns=data.columns)
+        std_data, records = _bin_records(std_data, bins, aggregate)
         return HeatmapWidget(
-            input_data=data, colnames=colnames, std_data=std_data.transpose()
+            input_data=data,
+            colnames=colnames,
+            std_data=std_data.transpose(),
+            records=records,
+        )
+
+
+def _bin_records(data, bins: int, aggregate: str = "mean"):
+    """Aggregate consecutive rows into bins.
+
+    Each bin is reduced in a single vectorized pass (``reduceat``) over the rows,
+    ignoring nulls. Bins of only nulls are null.
+
+    Args:
+        data: The dataframe
+        bins (int): The maximum number of rows of the result
+        aggregate (str): "mean", "minmax" (the minimum and maximum of each bin, as
+            two consecutive rows) or "maxabs" (the value of largest magnitude)
+
+    Raises:
+        ValueError: Invalid aggregation or number of bins.
+
+    Returns:
+        (binned, records) tuple of the binned dataframe and the record number of
+        the first row of each of its rows (for "minmax", the maximum is placed
+        halfway through the bin, so that positions are distinct), or the data
+        itself and None if it has no more than ``bins`` rows
+    """
+    if aggregate not in ["mean", "minmax", "maxabs"]:
+        raise ValueError(
+            f"aggregate must be 'mean', 'minmax' or 'maxabs', not {aggregate}"
         )
+    if bins < (2 if aggregate == "minmax" else 1):
+        raise ValueError(f"Invalid number of heatmap bins: {bins}")
+    n = data.shape[0]
+    if n <= bins:
+        return data, None
+
+    values = data.to_numpy(dtype=np.float64)
+    n_bins = bins // 2 if aggregate == "minmax" else bins
+    starts = np.arange(n_bins) * n // n_bins
+    if aggregate == "mean":
+        observed = ~np.isnan(values)
+        total = np.add.reduceat(np.where(observed, values, 0), starts, axis=0)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            binned = total / np.add.reduceat(observed, starts, axis=0)
+        records = starts
+    else:
+        low = np.fmin.reduceat(values, starts, axis=0)
+        high = np.fmax.reduceat(values, starts, axis=0)
+        if aggregate == "minmax":
+            # Interleave the minimum and maximum of each bin
+            binned = np.stack([low, high], axis=1).reshape(-1, values.shape[1])
+            middles = starts + np.diff(np.append(starts, n)) / 2
+            records = np.stack([starts, middles], axis=1).ravel()
+        else:
+            binned = np.where(np.abs(low) > np.abs(high), low, high)
+            records = starts
+    return pd.DataFrame(binned, index=records, columns=data.columns), records
 
 
 @_requires("plotly")
 def _plotly_viz_data_heatmap(
-    data, colnames: List[str], missing: bool = False, **kwargs
+    data, colnames: List[str], missing: bool = False, records=None, **kwargs
 ):
     """Plots the data heatmap.
 
@@ -170,6 +269,8 @@ def _plotly_viz_data_heatmap(
         data: The dataframe
         colnames (List[str]): The column names, used for tick labels
         missing (bool): If True, plots missing values instead
+        records: The record number of each column of the heatmap. Defaults to
+            consecutive record numbers.
         **kwargs: Keyword arguments.
 
     Returns:
@@ -177,7 +278,7 @@ def _plotly_viz_data_heatmap(
     """
     data_fig = go.Heatmap(
         z=np.flip(data.values, axis=0),
-        x=list(range(data.shape[0])),
+        x=list(range(data.shape[0])) if records is None else list(records),
         y=list(colnames[::-1]),
         ygap=1,
         zmin=-3 if not missing else 0,
@@ -213,7 +314,7 @@ def _plotly_viz_data_heatmap(
 
 
 def _seaborn_viz_data_heatmap(
-    data, colnames: List[str], missing: bool = False, **kwargs
+    data, colnames: List[str], missing: bool = False, records=None, **kwargs
 ):
     """Plots the data heatmap.
 
@@ -221,6 +322,7 @@ def _seaborn_viz_data_heatmap(
         data: The dataframe
         colnames: The column names, used for tick labels
         missing: If True, plots missing values instead
+        records: Unused, as records are not labeled
         kwargs: Keyword arguments passed to seaborn.heatmap
 
     Returns:
@@ -1,14 +1,42 @@
-from typing import Dict, Callable, Optional
-import warnings
+import copy
+import os
+import sys
+from collections.abc import Iterable
+from typing import Dict, Optional
 
 import pandas as pd
 from pandas.core.dtypes.common import is_float
+from pandas.api.types import (
+    is_bool_dtype,
+    is_float_dtype,
+    is_numeric_dtype,
+    is_datetime64_any_dtype,
+)
 import numpy as np
 
 from data_describe._widget import BaseWidget
+from data_describe.config._config import get_option
+from data_describe.metrics.sketch import HyperLogLog, QuantileSketch, SpaceSaving
+from data_describe.misc.load_data import _read_file_chunks
+from data_describe.misc.parallel import _map_blocks
 from data_describe.compat import _requires, _compat, _is_series, _is_dataframe
 from data_describe.backends._backends import _get_compute_backend
 
+_SUMMARY_COLUMNS = [
+    "Data Type",
+    "Nulls",
+    "Zeros",
+    "Min",
+    "Median",
+    "Max",
+    "Mean",
+    "Standard Deviation",
+    "Unique",
+    "Top Frequency",
+]
+_PERCENTILES = [1, 5, 25, 75, 95, 99]
+_PERCENTILE_COLUMNS = ["p{}".format(p) for p in _PERCENTILES]
+
 
 class SummaryWidget(BaseWidget):
     """Container for data summary.
@@ -16,10 +44,26 @@ class SummaryWidget(BaseWidget):
     This class (object) is returned from the ``data_summary`` function. The
     attributes documented below can be accessed or extracted.
 
+    The summary can be updated with new rows (``update``) or combined with the
+    summary of another partition of the data (``merge``) without recomputing
+    statistics over the full data.
+
     Attributes:
         input_data: The input data.
         info_data: Information about the data shape and size.
         summary_data (DataFrame): The summary statistics.
+        top_values (DataFrame): The most frequent values and their counts for each
+            column, if requested.
+        top_k (int): The number of most frequent values in ``top_values``.
+        percentiles (bool): If True, ``summary_data`` includes the percentiles
+            of numeric columns.
+        accumulator: The mergeable statistics (moments, counters and sketches)
+            used to update the summary.
+        group_sizes (Series): The number of rows in each group, for a grouped
+            summary (``summary_data`` is then indexed by group and column).
+        memory_data (DataFrame): The estimated (deep) memory usage of each column
+            of ``input_data``, with a 95% confidence bound, and the savings from
+            converting it to a suggested dtype.
         as_percentage (bool): If True, display counts as percentage over total
         auto_float (bool): If True, apply formatting to float values
     """
@@ -29,6 +73,12 @@ class SummaryWidget(BaseWidget):
         input_data=None,
         info_data=None,
         summary_data=None,
+        top_values=None,
+        top_k: int = 0,
+        percentiles: bool = False,
+        accumulator=None,
+        group_sizes=None,
+        memory_data=None,
         as_percentage: Optional[bool] = False,
         auto_float: Optional[bool] = True,
         **kwargs,
@@ -39,6 +89,12 @@ class SummaryWidget(BaseWidget):
             input_data: The input data.
             info_data: Information about the data shape and size.
             summary_data: The summary statistics.
+            top_values: The most frequent values and their counts for each column.
+            top_k (int): The number of most frequent values in ``top_values``.
+            percentiles (bool): If True, ``summary_data`` includes percentiles.
+            accumulator: The mergeable statistics used to update the summary.
+            group_sizes: The number of rows in each group, for a grouped summary.
+            memory_data: The estimated memory usage of each column.
             as_percentage (bool): If True, display counts as percentage over total
             auto_float (bool): If True, apply formatting to float values
         """
@@ -46,6 +102,12 @@ class SummaryWidget(BaseWidget):
         self.input_data = input_data
         self.info_data = info_data
         self.summary_data = summary_data
+        self.top_values = top_values
+        self.top_k = top_k
+        self.percentiles = percentiles
+        self.accumulator = accumulator
+        self.group_sizes = group_sizes
+        self.memory_data = memory_data
         self.as_percentage = as_percentage
         self.auto_float = auto_float
 
@@ -64,7 +126,8 @@ class SummaryWidget(BaseWidget):
     ):
         """The default display for this output.
 
-        Displays the summary information.
+        Displays the summary information. Values are formatted as strings one
+        column at a time; ``summary_data`` is not modified.
 
         Args:
             viz_backend: The visualization backend.
@@ -83,69 +146,156 @@ class SummaryWidget(BaseWidget):
             view = print
 
         view(self.info_data)
+        if self.group_sizes is None:
+            rows = self.info_data.loc["Rows", "Info"]
+        else:
+            groups = self.summary_data.index.droplevel(-1)
+            rows = self.group_sizes.reindex(groups).to_numpy()
+        view(
+            _format_summary(
+                self.summary_data,
+                rows=rows,
+                as_percentage=as_percentage or self.as_percentage,
+                auto_float=auto_float or self.auto_float,
+            )
+        )
 
-        summary_data = self.summary_data
-        format_dict: Dict[str, Callable] = {}
+    def update(self, data):
+        """Update the summary with new rows.
 
-        as_percentage = as_percentage or self.as_percentage
-        if as_percentage:
-            for col in ["Zeros", "Nulls", "Top Frequency"]:
-                summary_data[col] = summary_data[col] / self.input_data.shape[0]
-                format_dict[col] = "{:.1%}".format
+        The new rows are folded into the mergeable statistics, in time proportional
+        to the size of the new data. If the summary was computed in memory, the
+        statistics are first accumulated from ``input_data``; afterwards, the
+        median, unique counts and top frequencies are estimated from sketches.
 
-        summary_data.fillna("", inplace=True)
-        auto_float = auto_float or self.auto_float
-        if auto_float:
-            for col in summary_data.columns:
-                if col not in format_dict.keys():
-                    format_dict[col] = _value_formatter
+        ``input_data`` (and ``memory_data``) is cleared, as it no longer contains
+        all summarized rows.
 
-        if len(format_dict) > 0:
-            view(summary_data.style.format(format_dict))
-        else:
-            view(summary_data)
+        Args:
+            data: The new rows, as a Pandas dataframe, series, or an iterator of
+                dataframe chunks
+        """
+        accumulator = _SummaryAccumulator()
+        _accumulate(
+            accumulator, [data] if _is_dataframe(data) or _is_series(data) else data
+        )
+        self._merge_accumulator(accumulator)
+
+    def merge(self, other: "SummaryWidget"):
+        """Combine with the summary of another partition of the data.
+
+        Args:
+            other: The other summary widget
+        """
+        self._merge_accumulator(other._get_accumulator())
+
+    def _get_accumulator(self):
+        if self.group_sizes is not None:
+            raise ValueError("Grouped summaries cannot be updated or merged.")
+        if self.accumulator is None:
+            if self.input_data is None:
+                raise ValueError("Could not find statistics or data to update.")
+            self.accumulator = _SummaryAccumulator()
+            self.accumulator.update(self.input_data)
+        return self.accumulator
+
+    def _merge_accumulator(self, accumulator):
+        self._get_accumulator().merge(accumulator)
+        self.info_data, self.summary_data, self.top_values = _accumulator_summary(
+            self.accumulator, self.top_k, self.percentiles
+        )
+        self.input_data = None
+        self.memory_data = None
 
 
 def data_summary(
-    data, as_percentage: bool = False, auto_float: bool = True, compute_backend=None
+    data,
+    as_percentage: bool = False,
+    auto_float: bool = True,
+    approximate: Optional[bool] = None,
+    top_k: int = 0,
+    percentiles: bool = False,
+    by=None,
+    n_jobs: Optional[int] = None,
+    compute_backend=None,
 ):
     """Summary statistics and data description.
 
+    Data that does not fit in memory may be summarized by passing an iterator of
+    data frame chunks (e.g. ``pd.read_csv(..., chunksize=...)``) or a file path.
+    Chunks are folded into mergeable accumulators, so the median and unique count
+    are approximated for large data.
+
     Args:
-        data: The dataframe
+        data: The dataframe, an iterator of dataframe chunks, or a file path
         as_percentage (bool): If True, display counts as percentage over total
         auto_float (bool): If True, apply formatting to float values
+        approximate (bool, optional): If True, use bounded-memory sketches per
+            column: unique counts are estimated with HyperLogLog (relative error
+            set by the ``summary.distinct_error`` option) and top frequencies with
+            Space-Saving (number of counters set by the
+            ``summary.heavy_hitters_capacity`` option). Defaults to the
+            ``summary.approximate`` option. The Modin backend always uses sketches,
+            unless the ``summary.modin_exact`` option is set.
+        top_k (int): If greater than zero, also find the ``top_k`` most frequent
+            values of each column, returned as ``top_values`` on the widget.
+        percentiles (bool): If True, add the 1st, 5th, 25th, 75th, 95th and 99th
+            percentiles of numeric columns to the summary, as columns ``p1`` to
+            ``p99``.
+        by: A column name, or list of column names, to group by. If given, the
+            statistics are computed for each group, and ``summary_data`` is indexed
+            by the group keys and the column name. Not supported for chunked data,
+            nor with ``top_k``.
+        n_jobs (int, optional): The number of threads used to summarize columns
+            in parallel. -1 uses all CPUs. Defaults to the ``compute.n_jobs``
+            option.
         compute_backend: The compute backend.
 
     Returns:
         The dataframe with metrics in rows
     """
+    if approximate is None:
+        approximate = get_option("summary.approximate")
+
     widget = _get_compute_backend(
         backend=compute_backend, df=data
-    ).compute_data_summary(data)
+    ).compute_data_summary(
+        data,
+        approximate=approximate,
+        top_k=top_k,
+        percentiles=percentiles,
+        by=by,
+        n_jobs=n_jobs,
+    )
     widget.as_percentage = as_percentage
     widget.auto_float = auto_float
     return widget
 
 
-def mode1(x):
-    """Mode (counts only) by Warren Weckesser.
-
-    https://stackoverflow.com/questions/46365859/what-is-the-fastest-way-to-get-the-mode-of-a-numpy-array
-
-    Args:
-        x: Input array
-    """
-    _, counts = np.unique(x, return_counts=True)
-    m = counts.argmax()
-    return counts[m]
-
-
-def _pandas_compute_data_summary(data):
+def _pandas_compute_data_summary(
+    data,
+    approximate: bool = False,
+    top_k: int = 0,
+    percentiles: bool = False,
+    by=None,
+    n_jobs: Optional[int] = None,
+):
     """Perform computation for summary statistics and data description.
 
+    Statistics are computed column by column on the native (typed) column
+    arrays, dispatching on the column dtype. The frame is never converted
+    to a single object array. Blocks of columns may be summarized in parallel
+    threads, which share the frame in memory.
+
     Args:
-        data: The dataframe
+        data: The dataframe, an iterator of dataframe chunks, or a file path
+        approximate (bool): If True, estimate unique counts and top frequencies
+            using sketches. Sketches are always used for chunked data.
+        top_k (int): Number of most frequent values to find for each column
+        percentiles (bool): If True, include percentiles of numeric columns
+        by: Column name(s) to group by
+        n_jobs (int, optional): The number of threads. Defaults to the
+            ``compute.n_jobs`` option.
 
     Raises:
         ValueError: Invalid input data type.
@@ -153,111 +303,864 @@ def _pandas_compute_data_summary(data):
     Returns:
         The Pandas dataframe with metrics in rows
     """
+    if isinstance(data, (str, os.PathLike)):
+        data = _read_file_chunks(data, chunksize=get_option("summary.chunksize"))
+
     if _is_series(data):
         data = pd.DataFrame(data, columns=[data.name])
+    elif not _is_dataframe(data) and isinstance(data, Iterable):
+        if by is not None:
+            raise ValueError("Grouped summaries are not supported for chunked data")
+        return _pandas_compute_chunked_data_summary(
+            data, top_k=top_k, percentiles=percentiles
+        )
 
     if not _is_dataframe(data):
         raise ValueError("Data must be a Pandas DataFrame")
 
+    if by is not None:
+        return _grouped_data_summary(data, by, top_k=top_k, percentiles=percentiles)
+
+    memory_data = _memory_summary(data)
+    memory = data.index.memory_usage() + memory_data["Memory"].sum()
+    error = np.sqrt(np.sum(memory_data["Error"] ** 2))
+    info_data = pd.DataFrame(
+        {"Info": [data.shape[0], data.shape[1], _memory_fmt(memory, error)]},
+        index=["Rows", "Columns", "Size in Memory"],
+    )
+
+    stats = _map_blocks(
+        lambda block: [
+            _column_summary(data.iloc[:, i], approximate, top_k) for i in block
+        ],
+        data.shape[1],
+        n_jobs=n_jobs,
+    )
+    summary_data = pd.DataFrame(
+        stats, columns=_summary_columns(percentiles), index=data.columns
+    )
+    top_values = _top_values_frame(data.columns, stats) if top_k > 0 else None
+
+    return SummaryWidget(
+        data,
+        info_data,
+        summary_data,
+        top_values,
+        top_k,
+        percentiles=percentiles,
+        memory_data=memory_data,
+    )
+
+
+def _grouped_data_summary(data, by, top_k: int = 0, percentiles: bool = False):
+    """Compute summary statistics for each group of rows.
+
+    Each statistic is a single grouped aggregation over all groups (and columns),
+    rather than a summary per group.
+
+    Args:
+        data: The dataframe
+        by: Column name(s) to group by
+        top_k (int): Must be 0; top values are not supported for groups
+        percentiles (bool): If True, include percentiles of numeric columns
+
+    Raises:
+        ValueError: Invalid grouping or options.
+
+    Returns:
+        SummaryWidget
+    """
+    if top_k > 0:
+        raise ValueError("top_k is not supported for grouped summaries")
+    keys = list(by) if isinstance(by, (list, tuple)) else [by]
+    missing = [key for key in keys if key not in data.columns]
+    if missing:
+        raise ValueError("Could not find group columns: {}".format(missing))
+
+    columns = [col for col in data.columns if col not in keys]
+    kinds = {col: _column_kind(data[col].dtype) for col in columns}
+    numeric = [col for col in columns if kinds[col] == "numeric"]
+    ordered = [col for col in columns if kinds[col] in ["numeric", "datetime"]]
+    countable = [col for col in columns if kinds[col] in ["numeric", "bool"]]
+
+    grouped = data.groupby(keys, sort=True, dropna=False, observed=True)
+    group_sizes = grouped.size()
+    groups = group_sizes.index
+
+    stats = {
+        "Nulls": grouped[columns].count().rsub(group_sizes, axis=0),
+        "Zeros": data[countable]
+        .eq(0)
+        .groupby([data[key] for key in keys], sort=True, dropna=False, observed=True)
+        .sum(),
+        "Min": grouped[ordered].min(),
+        "Median": grouped[numeric].median(),
+        "Max": grouped[ordered].max(),
+        "Mean": grouped[numeric].mean(),
+        "Standard Deviation": grouped[numeric].std(ddof=0),
+    }
+    stats["Unique"], stats["Top Frequency"] = _grouped_frequencies(
+        data, keys, columns, groups
+    )
+    if percentiles:
+        quantiles = grouped[numeric].quantile(np.array(_PERCENTILES) / 100)
+        for name, q in zip(_PERCENTILE_COLUMNS, np.array(_PERCENTILES) / 100):
+            stats[name] = quantiles.xs(q, level=-1)
+
+    n_groups, n_columns = len(groups), len(columns)
+    index = pd.MultiIndex.from_arrays(
+        [groups.get_level_values(i).repeat(n_columns) for i in range(groups.nlevels)]
+        + [np.tile(np.array(columns, dtype=object), n_groups)],
+        names=keys + [None],
+    )
+    summary_data = pd.DataFrame(
+        {
+            name: frame.reindex(index=groups, columns=pd.Index(columns))
+            .to_numpy()
+            .ravel()
+            for name, frame in stats.items()
+        },
+        index=index,
+    )
+    summary_data["Data Type"] = np.tile(
+        np.array([data[col].dtype for col in columns], dtype=object), n_groups
+    )
+    summary_data = summary_data.reindex(columns=_summary_columns(percentiles))
+    for col in ["Nulls", "Zeros", "Unique", "Top Frequency"]:
+        summary_data[col] = summary_data[col].fillna(0).astype(np.int64)
+
+    memory_data = _memory_summary(data)
+    memory = data.index.memory_usage() + memory_data["Memory"].sum()
+    error = np.sqrt(np.sum(memory_data["Error"] ** 2))
     info_data = pd.DataFrame(
         {
             "Info": [
                 data.shape[0],
                 data.shape[1],
-                _sizeof_fmt(data.memory_usage().sum()),
+                n_groups,
+                _memory_fmt(memory, error),
             ]
         },
-        index=["Rows", "Columns", "Size in Memory"],
-    )
-
-    columns = data.columns
-    val = data.values
-    num_columns = data.select_dtypes("number").columns
-    num_ind = np.nonzero([c in num_columns for c in columns])[0]
-    date_columns = data.select_dtypes(["datetime", "datetimetz"]).columns
-    date_ind = np.nonzero([c in date_columns for c in columns])[0]
-    other_columns = data.select_dtypes(
-        exclude=["number", "datetime", "datetimetz"]
-    ).columns
-    other_ind = np.nonzero([c in other_columns for c in columns])[0]
-    order = np.concatenate([num_ind, date_ind, other_ind], axis=0)
-
-    dtypes = data.dtypes[order]
-    s_mean = np.pad(
-        np.mean(val[:, num_ind], axis=0),
-        (0, len(data.columns) - num_ind.size),
-        constant_values=np.nan,
+        index=["Rows", "Columns", "Groups", "Size in Memory"],
     )
-    s_sd = np.pad(
-        np.std(val[:, num_ind].astype(np.float), axis=0),
-        (0, len(data.columns) - num_ind.size),
-        constant_values=np.nan,
+    return SummaryWidget(
+        data,
+        info_data,
+        summary_data,
+        percentiles=percentiles,
+        group_sizes=group_sizes,
+        memory_data=memory_data,
     )
-    s_med = np.pad(
-        np.median(val[:, num_ind], axis=0),
-        (0, len(data.columns) - num_ind.size),
-        constant_values=np.nan,
-    )
-    s_min = np.pad(
-        np.min(val[:, np.concatenate([num_ind, date_ind])], axis=0),
-        (0, len(data.columns) - num_ind.size - date_ind.size),
-        constant_values=np.nan,
+
+
+def _grouped_frequencies(data, keys: list, columns: list, groups):
+    """Count of unique values and the frequency of the most common value per group.
+
+    Both are derived from a single count of each (group, value) pair per column.
+
+    Args:
+        data: The dataframe
+        keys (list): The column names to group by
+        columns (list): The columns to count values of
+        groups: The index of all groups
+
+    Returns:
+        (unique, top) tuple of data frames, indexed by group
+    """
+    unique, top = {}, {}
+    levels = list(range(len(keys)))
+    for col in columns:
+        pairs = data.groupby(keys + [col], sort=False, dropna=False, observed=True)
+        counts = pairs.size()
+        counts = counts[counts.index.get_level_values(-1).notna()]
+        per_group = counts.groupby(level=levels, sort=False, dropna=False)
+        # Align on all groups first, as null group keys would not align when
+        # the columns are combined (e.g. groups where a column is only null)
+        unique[col] = per_group.size().reindex(groups)
+        top[col] = per_group.max().reindex(groups)
+    # Build frames of the same type (Pandas or Modin) as the data
+    return type(data)(unique), type(data)(top)
+
+
+def _summary_columns(percentiles: bool = False) -> list:
+    """The columns of the summary data.
+
+    Args:
+        percentiles (bool): If True, include the percentile columns
+
+    Returns:
+        List of column names
+    """
+    if percentiles:
+        return _SUMMARY_COLUMNS + _PERCENTILE_COLUMNS
+    return _SUMMARY_COLUMNS
+
+
+def _column_summary(series, approximate: bool = False, top_k: int = 0) -> dict:
+    """Compute the summary statistics for a single column.
+
+    Args:
+        series: The Pandas series
+        approximate (bool): If True, estimate unique counts and top frequencies
+            using sketches
+        top_k (int): Number of most frequent values to find
+
+    Returns:
+        Dictionary of statistics, keyed as in ``_SUMMARY_COLUMNS`` and
+        ``_PERCENTILE_COLUMNS``
+    """
+    kind = _column_kind(series.dtype)
+    if kind == "numeric":
+        valid, nulls = _numeric_values(series)
+        stats = _numeric_summary(valid, approximate, top_k)
+    elif kind == "categorical":
+        stats, nulls = _categorical_summary(series, top_k)
+    elif kind == "datetime":
+        valid, nulls = _datetime_values(series)
+        stats = _datetime_summary(valid)
+        stats.update(_frequency_summary(valid, approximate, top_k))
+    else:
+        valid = series.dropna()
+        nulls = series.size - valid.size
+        stats = {"Zeros": 0}
+        if kind == "bool":
+            stats["Zeros"] = valid.size - int(valid.sum())
+        stats.update(_frequency_summary(valid, approximate, top_k))
+
+    stats.update({"Data Type": series.dtype, "Nulls": nulls})
+    return stats
+
+
+def _column_kind(dtype) -> str:
+    """Classify a column dtype for the summary statistics.
+
+    Args:
+        dtype: The column dtype
+
+    Returns:
+        One of "categorical", "bool", "numeric", "datetime" or "other"
+    """
+    if isinstance(dtype, pd.CategoricalDtype):
+        return "categorical"
+    elif is_bool_dtype(dtype):
+        return "bool"
+    elif is_numeric_dtype(dtype):
+        return "numeric"
+    elif is_datetime64_any_dtype(dtype):
+        return "datetime"
+    else:
+        return "other"
+
+
+def _numeric_values(series):
+    """Get the non-null values of a numeric column as a numpy array.
+
+    Args:
+        series: The numeric Pandas series
+
+    Returns:
+        (values, nulls) tuple of the non-null values and the count of nulls
+    """
+    if isinstance(series.dtype, np.dtype):
+        values = series.to_numpy()
+    else:
+        # Nullable extension types (e.g. Int64) are converted to float
+        values = series.to_numpy(dtype=np.float64, na_value=np.nan)
+
+    if values.dtype.kind in "fc":
+        null_mask = np.isnan(values)
+        nulls = int(np.count_nonzero(null_mask))
+        if nulls > 0:
+            values = values[~null_mask]
+    else:
+        nulls = 0
+    return values, nulls
+
+
+def _numeric_summary(values, approximate: bool = False, top_k: int = 0) -> dict:
+    """Summary statistics for a numeric column.
+
+    The column is sorted once. The min, max, median and percentiles, the count
+    of zeros and (unless approximate) the unique count and top frequencies are
+    all read off the sorted values.
+
+    Args:
+        values: Numpy array of the non-null values
+        approximate (bool): If True, estimate unique counts and top frequencies
+            using sketches
+        top_k (int): Number of most frequent values to find
+
+    Returns:
+        Dictionary of statistics
+    """
+    if values.size == 0:
+        stats = {"Zeros": 0}
+        stats.update(_frequency_summary(values, approximate, top_k))
+        return stats
+
+    ordered = np.sort(values)
+    quantiles = _sorted_quantiles(ordered, [50] + _PERCENTILES)
+    stats = {
+        "Zeros": np.searchsorted(ordered, 0, side="right")
+        - np.searchsorted(ordered, 0, side="left"),
+        "Min": ordered[0],
+        "Median": quantiles[0],
+        "Max": ordered[-1],
+        "Mean": values.mean(),
+        "Standard Deviation": values.std(),
+    }
+    stats.update(zip(_PERCENTILE_COLUMNS, quantiles[1:]))
+    if approximate:
+        stats.update(_frequency_summary(values, approximate, top_k))
+    else:
+        stats.update(_sorted_frequency_summary(ordered, top_k))
+    return stats
+
+
+def _sorted_quantiles(ordered, percentiles) -> np.ndarray:
+    """Percentiles of sorted values, using linear interpolation.
+
+    Equivalent to ``np.percentile``, without partitioning the values again.
+
+    Args:
+        ordered: Sorted numpy array of (non-null) values
+        percentiles: List of percentiles, between 0 and 100
+
+    Returns:
+        Array of the percentile values
+    """
+    position = np.asarray(percentiles, dtype=np.float64) / 100 * (ordered.size - 1)
+    low = np.floor(position).astype(np.int64)
+    high = np.minimum(low + 1, ordered.size - 1)
+    fraction = position - low
+    if ordered.dtype.kind != "c":
+        ordered = ordered.astype(np.float64, copy=False)
+    return ordered[low] + (ordered[high] - ordered[low]) * fraction
+
+
+def _sorted_frequency_summary(ordered, top_k: int = 0) -> dict:
+    """Count of unique values and the most common values of sorted values.
+
+    Equal values are adjacent, so each run of equal values is a unique value
+    and the run length is its count. Ties are broken by the smaller value.
+
+    Args:
+        ordered: Sorted numpy array of (non-null) values
+        top_k (int): Number of most frequent values to find
+
+    Returns:
+        Dictionary with the "Unique" and "Top Frequency" statistics, and "Top
+        Values" if ``top_k`` is greater than zero
+    """
+    starts = np.flatnonzero(np.concatenate([[True], ordered[1:] != ordered[:-1]]))
+    counts = np.diff(np.append(starts, ordered.size))
+    order = np.argsort(-counts, kind="stable")[: max(top_k, 1)]
+    top = pd.Series(counts[order], index=pd.Index(ordered[starts[order]]))
+    return _top_frequency_stats(starts.size, top, top_k)
+
+
+def _categorical_summary(series, top_k: int = 0):
+    """Summary statistics for a categorical column.
+
+    Values are counted with ``bincount`` over the integer category codes, so the
+    values themselves are never hashed or compared. Counts are exact and memory is
+    bounded by the number of categories.
+
+    Args:
+        series: The categorical Pandas series
+        top_k (int): Number of most frequent values to find
+
+    Returns:
+        (stats, nulls) tuple of the dictionary of statistics and the count of nulls
+    """
+    codes = series.cat.codes.to_numpy()
+    categories = series.cat.categories
+    valid = codes[codes >= 0]
+    counts = np.bincount(valid, minlength=len(categories))
+    order = np.argsort(-counts, kind="stable")[: max(top_k, 1)]
+    order = order[counts[order] > 0]
+    top = pd.Series(counts[order], index=categories.take(order))
+    stats = {"Zeros": 0}
+    stats.update(_top_frequency_stats(np.count_nonzero(counts), top, top_k))
+    return stats, codes.size - valid.size
+
+
+def _datetime_values(series):
+    """Get the non-null values of a datetime (or datetimetz) column.
+
+    Nulls are found on the int64 view of the values, without boxing Timestamps.
+
+    Args:
+        series: The datetime Pandas series
+
+    Returns:
+        (values, nulls) tuple of a DatetimeIndex of the non-null values and the
+        count of nulls
+    """
+    values = pd.DatetimeIndex(series.array)
+    null_mask = values.asi8 == np.iinfo(np.int64).min
+    nulls = int(np.count_nonzero(null_mask))
+    if nulls > 0:
+        values = values[~null_mask]
+    return values, nulls
+
+
+def _datetime_summary(values) -> dict:
+    """Summary statistics for a datetime (or datetimetz) column.
+
+    The min and max are found on the int64 view of the values.
+
+    Args:
+        values: DatetimeIndex of the non-null values
+
+    Returns:
+        Dictionary of statistics
+    """
+    stats = {"Zeros": 0}
+    if values.size > 0:
+        ints = values.asi8
+        stats["Min"] = values[ints.argmin()]
+        stats["Max"] = values[ints.argmax()]
+    return stats
+
+
+def _frequency_summary(values, approximate: bool = False, top_k: int = 0) -> dict:
+    """Count of unique values and the frequency of the most common value.
+
+    Values are hashed on their native dtype, rather than converted to strings.
+
+    Args:
+        values: Array or series of non-null values
+        approximate (bool): If True, use HyperLogLog for the unique count and
+            Space-Saving for the most frequent values
+        top_k (int): Number of most frequent values to find
+
+    Returns:
+        Dictionary with the "Unique" and "Top Frequency" statistics, and "Top
+        Values" if ``top_k`` is greater than zero
+    """
+    if approximate:
+        top = _heavy_hitters_sketch(values).top(max(top_k, 1))
+        unique = _distinct_sketch(values).count()
+    else:
+        try:
+            codes, uniques = pd.factorize(values)
+        except TypeError:
+            # Unhashable values (e.g. lists) are compared by their string representation
+            codes, uniques = pd.factorize(pd.Series(values).astype(str))
+        counts = np.bincount(codes, minlength=len(uniques))
+        order = np.argsort(-counts, kind="stable")[: max(top_k, 1)]
+        top = pd.Series(counts[order], index=pd.Index(uniques).take(order))
+        unique = len(uniques)
+    return _top_frequency_stats(unique, top, top_k)
+
+
+def _top_frequency_stats(unique: int, top, top_k: int = 0) -> dict:
+    """Collect the frequency statistics.
+
+    Args:
+        unique (int): The count of unique values
+        top: Series of the counts of the most frequent values, in descending order
+        top_k (int): Number of most frequent values to report
+
+    Returns:
+        Dictionary with the "Unique" and "Top Frequency" statistics, and "Top
+        Values" if ``top_k`` is greater than zero
+    """
+    stats = {"Unique": unique, "Top Frequency": top.iloc[0] if top.size > 0 else 0}
+    if top_k > 0:
+        stats["Top Values"] = top.head(top_k)
+    return stats
+
+
+def _heavy_hitters_sketch(values) -> SpaceSaving:
+    """Build a Space-Saving sketch of the values.
+
+    Values are added in blocks of ``summary.chunksize`` rows, so memory is bounded
+    by the block size and the ``summary.heavy_hitters_capacity`` option.
+
+    Args:
+        values: Array or series of non-null values
+
+    Returns:
+        SpaceSaving
+    """
+    sketch = SpaceSaving(get_option("summary.heavy_hitters_capacity"))
+    chunksize = get_option("summary.chunksize")
+    for start in range(0, len(values), chunksize):
+        sketch.update(values[start : start + chunksize])
+    return sketch
+
+
+def _top_values_frame(columns, stats):
+    """Combine the most frequent values of each column into a data frame.
+
+    Args:
+        columns: The column names
+        stats: List of the statistics (with "Top Values") for each column
+
+    Returns:
+        Data frame of the values and counts, indexed by column and rank
+    """
+    rows = [
+        (name, rank, value, count)
+        for name, column_stats in zip(columns, stats)
+        for rank, (value, count) in enumerate(column_stats["Top Values"].items(), 1)
+    ]
+    top_values = pd.DataFrame(rows, columns=["Column", "Rank", "Value", "Count"])
+    return top_values.set_index(["Column", "Rank"])
+
+
+def _distinct_sketch(values) -> HyperLogLog:
+    """Build a HyperLogLog sketch of the values.
+
+    The sketch precision is determined by the ``summary.distinct_error`` option.
+
+    Args:
+        values: Array or series of non-null values
+
+    Returns:
+        HyperLogLog
+    """
+    sketch = HyperLogLog.from_error(get_option("summary.distinct_error"))
+    sketch.update(values)
+    return sketch
+
+
+def _pandas_compute_chunked_data_summary(
+    chunks, top_k: int = 0, percentiles: bool = False
+):
+    """Perform computation for summary statistics over chunks of data.
+
+    Args:
+        chunks: An iterator of Pandas dataframes
+        top_k (int): Number of most frequent values to find for each column
+        percentiles (bool): If True, include percentiles of numeric columns
+
+    Raises:
+        ValueError: Invalid input data type.
+
+    Returns:
+        SummaryWidget
+    """
+    accumulator = _SummaryAccumulator()
+    _accumulate(accumulator, chunks)
+    info_data, summary_data, top_values = _accumulator_summary(
+        accumulator, top_k, percentiles
     )
-    s_max = np.pad(
-        np.max(val[:, np.concatenate([num_ind, date_ind])], axis=0),
-        (0, len(data.columns) - num_ind.size - date_ind.size),
-        constant_values=np.nan,
+
+    return SummaryWidget(
+        info_data=info_data,
+        summary_data=summary_data,
+        top_values=top_values,
+        top_k=top_k,
+        percentiles=percentiles,
+        accumulator=accumulator,
     )
-    s_zero = (data == 0).sum()[order]
-    s_null = data.isnull().sum().astype(int)[order]
-    s_unique = data.nunique()[order]
-    s_freq = np.apply_along_axis(mode1, 0, val.astype("str"))[order]
 
+
+def _accumulate(accumulator, chunks):
+    """Accumulate chunks of data.
+
+    Args:
+        accumulator: The ``_SummaryAccumulator``
+        chunks: An iterator of Pandas dataframes (or series)
+
+    Raises:
+        ValueError: Invalid input data type.
+    """
+    for chunk in chunks:
+        if _is_series(chunk):
+            chunk = pd.DataFrame(chunk, columns=[chunk.name])
+        if not _is_dataframe(chunk):
+            raise ValueError("Chunks must be Pandas DataFrames")
+        accumulator.update(chunk)
+
+
+def _accumulator_summary(accumulator, top_k: int = 0, percentiles: bool = False):
+    """Build the summary data frames from accumulated statistics.
+
+    Args:
+        accumulator: The ``_SummaryAccumulator``
+        top_k (int): Number of most frequent values to find for each column
+        percentiles (bool): If True, include percentiles of numeric columns
+
+    Returns:
+        (info_data, summary_data, top_values) tuple of data frames
+    """
+    stats = accumulator.summary(top_k)
     summary_data = pd.DataFrame(
-        np.vstack(
-            [
-                dtypes,
-                s_null,
-                s_zero,
-                s_min,
-                s_med,
-                s_max,
-                s_mean,
-                s_sd,
-                s_unique,
-                s_freq,
-            ]
-        ).transpose()[np.argsort(order), :],
-        columns=[
-            "Data Type",
-            "Nulls",
-            "Zeros",
-            "Min",
-            "Median",
-            "Max",
-            "Mean",
-            "Standard Deviation",
-            "Unique",
-            "Top Frequency",
-        ],
-        index=data.columns,
+        stats,
+        columns=_summary_columns(percentiles),
+        index=pd.Index(accumulator.columns),
     )
+    top_values = _top_values_frame(accumulator.columns, stats) if top_k > 0 else None
+    return accumulator.info_data(), summary_data, top_values
 
-    return SummaryWidget(data, info_data, summary_data)
+
+class _SummaryAccumulator:
+    """Mergeable summary statistics for a data frame.
+
+    Attributes:
+        rows (int): Number of rows accumulated
+        memory (int): Memory usage (bytes) of the indexes of the accumulated data
+            frames. The memory usage of the columns is accumulated per column.
+        columns (dict): Mapping of column names to their ``_ColumnAccumulator``
+    """
+
+    def __init__(self):
+        self.rows = 0
+        self.memory = 0
+        self.columns: Dict = {}
+
+    def update(self, data):
+        """Accumulate a chunk of data.
+
+        Args:
+            data: The Pandas dataframe
+        """
+        for i, name in enumerate(data.columns):
+            if name not in self.columns:
+                self.columns[name] = _ColumnAccumulator()
+            self.columns[name].update(data.iloc[:, i])
+        self.rows += data.shape[0]
+        self.memory += data.index.memory_usage()
+
+    def merge(self, other: "_SummaryAccumulator"):
+        """Merge another accumulator into this accumulator.
+
+        Args:
+            other: The accumulator to merge
+        """
+        for name, column in other.columns.items():
+            if name not in self.columns:
+                self.columns[name] = _ColumnAccumulator()
+            self.columns[name].merge(column)
+        self.rows += other.rows
+        self.memory += other.memory
+
+    def info_data(self):
+        """Information about the data shape and size."""
+        return pd.DataFrame(
+            {"Info": [self.rows, len(self.columns), _memory_fmt(*self.memory_usage())]},
+            index=["Rows", "Columns", "Size in Memory"],
+        )
+
+    def memory_usage(self):
+        """The estimated memory usage of the accumulated data frames.
+
+        Returns:
+            (memory, error) tuple of the estimated bytes and its 95% confidence bound
+        """
+        memory = self.memory + sum(c.memory for c in self.columns.values())
+        error = np.sqrt(sum(c.memory_error ** 2 for c in self.columns.values()))
+        return memory, error
+
+    def summary(self, top_k: int = 0) -> list:
+        """The summary statistics for each column.
+
+        Args:
+            top_k (int): Number of most frequent values to find
+
+        Returns:
+            List of dictionaries of statistics, keyed as in ``_SUMMARY_COLUMNS``
+            and ``_PERCENTILE_COLUMNS``
+        """
+        return [column.summary(top_k) for column in self.columns.values()]
+
+
+class _ColumnAccumulator:
+    """Mergeable summary statistics for a single column.
+
+    Mean and variance are combined using the parallel form of Welford's
+    algorithm, so chunks may be accumulated (or merged) in any order.
+    The median and unique count are estimated with bounded-memory sketches.
+
+    Attributes:
+        dtype: The (common) dtype of the accumulated values
+        nulls (int): Count of null values
+        zeros (int): Count of zero values
+        count (int): Count of non-null numeric values
+        mean (float): Running mean of numeric values
+        m2 (float): Running sum of squared differences from the mean
+        min: Running minimum
+        max: Running maximum
+        quantiles (QuantileSketch): Sketch of numeric values
+        distinct (HyperLogLog): Sketch of distinct values
+        frequencies (SpaceSaving): Sketch of the most frequent values
+        memory (int): Estimated (deep) memory usage (bytes) of the accumulated values
+        memory_error (float): The 95% confidence bound of ``memory``
+    """
+
+    def __init__(self):
+        self.dtype = None
+        self.nulls = 0
+        self.zeros = 0
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = None
+        self.max = None
+        self.quantiles = QuantileSketch()
+        self.distinct = HyperLogLog.from_error(get_option("summary.distinct_error"))
+        self.frequencies = SpaceSaving(get_option("summary.heavy_hitters_capacity"))
+        self.memory = 0
+        self.memory_error = 0.0
+
+    def update(self, series):
+        """Accumulate a chunk of the column.
+
+        Args:
+            series: The Pandas series
+        """
+        self.dtype = _common_dtype(self.dtype, series.dtype)
+        kind = _column_kind(series.dtype)
+        if kind == "numeric":
+            valid, nulls = _numeric_values(series)
+            if valid.size > 0:
+                self.zeros += valid.size - np.count_nonzero(valid)
+                self._update_range(valid.min(), valid.max())
+                mean = valid.mean()
+                self._update_moments(valid.size, mean, np.sum((valid - mean) ** 2))
+                self.quantiles.update(valid)
+        else:
+            valid = series.dropna()
+            nulls = series.size - valid.size
+            if kind == "bool":
+                self.zeros += valid.size - int(valid.sum())
+            elif kind == "datetime" and valid.size > 0:
+                self._update_range(valid.min(), valid.max())
+
+        self.nulls += nulls
+        memory, error = _estimate_memory(series)
+        self.memory += memory
+        self.memory_error = np.sqrt(self.memory_error ** 2 + error ** 2)
+        self.distinct.update(valid)
+        self.frequencies.update(valid)
+
+    def merge(self, other: "_ColumnAccumulator"):
+        """Merge another accumulator into this accumulator.
+
+        Args:
+            other: The accumulator to merge
+        """
+        if other.dtype is None:
+            return
+        self.dtype = _common_dtype(self.dtype, other.dtype)
+        self.nulls += other.nulls
+        self.zeros += other.zeros
+        if other.min is not None:
+            self._update_range(other.min, other.max)
+        self._update_moments(other.count, other.mean, other.m2)
+        self.quantiles.merge(other.quantiles)
+        self.distinct.merge(other.distinct)
+        self.frequencies.merge(other.frequencies)
+        self.memory += other.memory
+        self.memory_error = np.sqrt(self.memory_error ** 2 + other.memory_error ** 2)
+
+    def summary(self, top_k: int = 0) -> dict:
+        """The summary statistics.
+
+        Args:
+            top_k (int): Number of most frequent values to find
+
+        Returns:
+            Dictionary of statistics, keyed as in ``_SUMMARY_COLUMNS`` and
+            ``_PERCENTILE_COLUMNS``
+        """
+        kind = _column_kind(self.dtype)
+        top = self.frequencies.top(max(top_k, 1))
+        stats = {
+            "Data Type": self.dtype,
+            "Nulls": self.nulls,
+            "Zeros": self.zeros,
+            "Unique": self.frequencies.counts.size
+            if self.frequencies.exact
+            else self.distinct.count(),
+            "Top Frequency": top.iloc[0] if top.size > 0 else 0,
+        }
+        if top_k > 0:
+            stats["Top Values"] = top
+        if kind in ["numeric", "datetime"] and self.min is not None:
+            stats["Min"] = self.min
+            stats["Max"] = self.max
+        if kind == "numeric" and self.count > 0:
+            quantiles = self.quantiles.quantiles(np.array([50] + _PERCENTILES) / 100)
+            stats["Median"] = quantiles[0]
+            stats.update(zip(_PERCENTILE_COLUMNS, quantiles[1:]))
+            stats["Mean"] = self.mean
+            stats["Standard Deviation"] = np.sqrt(self.m2 / self.count)
+        return stats
+
+    def _update_range(self, low, high):
+        self.min = low if self.min is None else min(self.min, low)
+        self.max = high if self.max is None else max(self.max, high)
+
+    def _update_moments(self, count: int, mean: float, m2: float):
+        if count == 0:
+            return
+        total = self.count + count
+        delta = mean - self.mean
+        self.mean += delta * count / total
+        self.m2 += m2 + delta ** 2 * self.count * count / total
+        self.count = total
+
+
+def _common_dtype(left, right):
+    """Find a dtype that can hold values of both dtypes.
+
+    Args:
+        left: The first dtype, or None
+        right: The second dtype
+
+    Returns:
+        The common dtype
+    """
+    if left is None or left == right:
+        return right
+    try:
+        return np.result_type(left, right)
+    except TypeError:
+        return np.dtype("O")
 
 
 @_requires("modin")
-def _modin_compute_data_summary(data):
+def _modin_compute_data_summary(
+    data,
+    approximate: bool = False,
+    top_k: int = 0,
+    percentiles: bool = False,
+    by=None,
+    n_jobs: Optional[int] = None,
+):
     """Perform computation for summary statistics and data description.
 
+    Statistics are computed in a single map-reduce job: each partition is
+    scanned once into per-column accumulators (moments, counters and sketches),
+    which are then merged. The accumulators are bounded in memory, so only small
+    sketches are sent to the driver.
+
+    The median, percentiles, unique counts and top frequencies are estimated
+    from the merged sketches. To compute them exactly instead, set the
+    ``summary.modin_exact`` option: this runs a second job, which scans the data
+    again and holds each (full) column in memory on a worker, so it roughly
+    doubles the cost of the summary.
+
     Args:
         data: The dataframe
+        approximate (bool): If True, never run the exact second job, even if the
+            ``summary.modin_exact`` option is set
+        top_k (int): Number of most frequent values to find for each column
+        percentiles (bool): If True, include percentiles of numeric columns
+        by: Column name(s) to group by
+        n_jobs (int, optional): Unused; Modin parallelizes over partitions using
+            its own engine.
 
     Raises:
         ValueError: Invalid input data type.
 
     Returns:
-        The Modin dataframe with metrics in rows
+        SummaryWidget
     """
     if _is_series(data):
         data = _compat["modin.pandas"].DataFrame(data)
@@ -265,107 +1168,341 @@ def _modin_compute_data_summary(data):
     if not _is_dataframe(data):
         raise ValueError("Data must be a Modin DataFrame")
 
-    info_data = pd.DataFrame(
-        {
-            "Info": [
-                data.shape[0],
-                data.shape[1],
-                _sizeof_fmt(data.memory_usage().sum(), ""),
-            ]
-        },
-        index=["Rows", "Columns", "Size in Memory"],
+    if by is not None:
+        return _grouped_data_summary(data, by, top_k=top_k, percentiles=percentiles)
+
+    # Options are read on the driver, as workers may not share its configuration
+    template = _ColumnAccumulator()
+
+    def _column_accumulator(series):
+        accumulator = copy.deepcopy(template)
+        accumulator.update(series)
+        return accumulator
+
+    accumulator = _SummaryAccumulator()
+    accumulator.columns = dict(_modin_reduce_partitions(data, _column_accumulator))
+    accumulator.rows = data.shape[0]
+    accumulator.memory = data.index.memory_usage()
+    info_data, summary_data, top_values = _accumulator_summary(
+        accumulator, top_k, percentiles
     )
+    if not approximate and get_option("summary.modin_exact"):
+        exact = _modin_exact_statistics(data, summary_data.columns, top_k)
+        for key in exact.index.drop("Top Values", errors="ignore"):
+            summary_data[key] = exact.loc[key].to_numpy()
+        if top_k > 0:
+            top_values = _top_values_frame(
+                data.columns, [{"Top Values": x} for x in exact.loc["Top Values"]]
+            )
 
-    # Save column order
-    columns = data.columns
-
-    dtypes = data.dtypes.to_numpy()
-    s_mean = data.mean(numeric_only=True).reindex().to_numpy()
-    s_sd = data.std(numeric_only=True).reindex(columns).to_numpy()
-    s_med = data.median(numeric_only=True).reindex(columns).to_numpy()
-    s_min = data.min(numeric_only=True).reindex(columns).to_numpy()
-    s_max = data.max(numeric_only=True).reindex(columns).to_numpy()
-    s_zero = data[data == 0].fillna(0).sum().astype(int).to_numpy()
-    s_null = data.isnull().sum().astype(int).to_numpy()
-    s_unique = data.nunique().to_numpy()
-    s_freq = (
-        data.apply(lambda x: mode1(x.astype("str")))
-        .iloc[
-            0,
-        ]
-        .to_numpy()
+    return SummaryWidget(
+        data,
+        info_data,
+        summary_data,
+        top_values,
+        top_k,
+        percentiles=percentiles,
+        accumulator=accumulator,
     )
 
-    summary_data = pd.DataFrame(
-        np.vstack(
-            [
-                dtypes,
-                s_null,
-                s_zero,
-                s_min,
-                s_med,
-                s_max,
-                s_mean,
-                s_sd,
-                s_unique,
-                s_freq,
-            ]
-        ).transpose(),
-        columns=[
-            "Data Type",
-            "Nulls",
-            "Zeros",
-            "Min",
-            "Median",
-            "Max",
-            "Mean",
-            "Standard Deviation",
-            "Unique",
-            "Top Frequency",
-        ],
-        index=columns,
+
+@_requires("modin")
+def _modin_exact_statistics(data, columns, top_k: int = 0):
+    """Compute the order and frequency statistics of each column exactly.
+
+    Each column is summarized on a worker, using the same kernels as the Pandas
+    backend. Only the statistics are returned to the driver.
+
+    Args:
+        data: The Modin dataframe
+        columns: The summary columns
+        top_k (int): Number of most frequent values to find
+
+    Returns:
+        Pandas dataframe of the statistics (in rows) of each column
+    """
+    keys = [
+        key
+        for key in ["Median", "Unique", "Top Frequency"] + _PERCENTILE_COLUMNS
+        if key in columns
+    ]
+    if top_k > 0:
+        keys.append("Top Values")
+
+    def _exact(series):
+        stats = _column_summary(series, top_k=top_k)
+        return pd.Series([stats.get(key, np.nan) for key in keys], index=keys)
+
+    return _compat["modin.utils"].to_pandas(data.apply(_exact))
+
+
+@_requires("modin")
+def _modin_reduce_partitions(data, map_func):
+    """Map each partition of a Modin dataframe to mergeable objects, then merge.
+
+    The map and reduce steps run as a single job on the Modin engine. Only the
+    merged results are gathered on the driver.
+
+    Args:
+        data: The Modin dataframe
+        map_func: Function that takes a Pandas series (the partition of a
+            column) and returns an object with a ``merge`` method
+
+    Returns:
+        Pandas series of the merged objects, indexed by column
+    """
+    TreeReduce = _compat["modin.core.dataframe.algebra"].TreeReduce
+
+    def _map(partition):
+        return pd.DataFrame(
+            [[map_func(partition.iloc[:, i]) for i in range(partition.shape[1])]],
+            columns=partition.columns,
+            index=["__reduced__"],
+        )
+
+    def _reduce(partials):
+        merged = []
+        for i in range(partials.shape[1]):
+            result, *others = partials.iloc[:, i]
+            for other in others:
+                result.merge(other)
+            merged.append(result)
+        return pd.DataFrame([merged], columns=partials.columns, index=["__reduced__"])
+
+    reduced = TreeReduce.register(_map, _reduce)(data._query_compiler)
+    return (
+        _compat["modin.utils"]
+        .to_pandas(_compat["modin.pandas"].DataFrame(query_compiler=reduced))
+        .iloc[0]
     )
 
-    return SummaryWidget(data, info_data, summary_data)
+
+def _format_summary(
+    summary_data, rows: int, as_percentage: bool = False, auto_float: bool = True
+):
+    """Format the summary data for display.
+
+    Args:
+        summary_data: The summary statistics
+        rows (int): The number of rows, used for percentages
+        as_percentage (bool): If True, display counts as percentage over total
+        auto_float (bool): If True, apply formatting to float values
+
+    Returns:
+        Data frame of formatted values, with nulls as empty strings
+    """
+    formatted = summary_data.astype(object)
+    counts = ["Zeros", "Nulls", "Top Frequency"] if as_percentage else []
+    for col in summary_data.columns:
+        values = summary_data[col].to_numpy()
+        if col in counts:
+            percentage = pd.to_numeric(summary_data[col], errors="coerce") / rows
+            formatted[col] = np.char.mod("%.1f%%", percentage.to_numpy() * 100)
+        elif auto_float:
+            if is_float_dtype(values.dtype):
+                floats = np.ones(values.size, dtype=bool)
+            else:
+                floats = np.fromiter(map(is_float, values), bool, values.size)
+            if floats.any():
+                values = values.astype(object)
+                values[floats] = _format_floats(values[floats])
+                formatted[col] = values
+    return formatted.where(summary_data.notnull(), "")
 
 
-def _get_precision(x, margin: int = 1) -> int:
+def _format_floats(values) -> np.ndarray:
+    """Format floats with the minimum precision of each value.
+
+    Values are grouped by precision, so each group is formatted in one call.
+
+    Args:
+        values: Array of floats
+
+    Returns:
+        Array of formatted strings
+    """
+    values = values.astype(np.float64)
+    precision = _get_precision(values)
+    formatted = np.empty(values.size, dtype=object)
+    for p in np.unique(precision):
+        group = precision == p
+        formatted[group] = np.char.mod("%.{}f".format(p), values[group])
+    return formatted
+
+
+def _get_precision(x, margin: int = 1):
     """Get the minimum precision for a value.
 
     Used to determine how to display and format floats.
 
     Args:
-        x: Input value
+        x: Input value, or array of values
         margin (int): Added to the calculated precision
 
     Returns:
-        int: Number of decimal places
+        Number of decimal places (an array, for array input)
     """
-    with warnings.catch_warnings():
-        warnings.filterwarnings("ignore", category=RuntimeWarning)
-        try:
-            x = (x - np.trunc(x)).astype(np.float)
-            magnitude = np.log10(x[x != 0])
-            return int(np.ceil(np.abs(magnitude))) + margin
-        except (TypeError, ValueError):
-            return 0
+    try:
+        x = np.asarray(x, dtype=np.float64)
+    except (TypeError, ValueError):
+        return 0
+    fraction = np.abs(x - np.trunc(x))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        magnitude = np.ceil(np.abs(np.log10(fraction)))
+    precision = np.where(
+        np.isfinite(magnitude) & (fraction != 0), magnitude + margin, 0
+    ).astype(int)
+    return int(precision) if precision.ndim == 0 else precision
 
 
-def _value_formatter(x, precision=None):
-    """Formatter for displaying values of mixed type and precision.
+def _memory_summary(data):
+    """Estimate the deep memory usage of each column, and suggest smaller dtypes.
 
     Args:
-        x: Input value
-        precision (int, optional): Precision for floats.
+        data: The Pandas dataframe
+
+    Returns:
+        Data frame indexed by column, with the estimated "Memory" (bytes), its
+        "Error" (95% confidence bound), the "Suggested Type" (if any) and the
+        estimated "Savings" (bytes) of converting to the suggested type
     """
-    if is_float(x):
-        precision = precision or _get_precision(x)
-        try:
-            return f"{{:.{precision}f}}".format(x)
-        except ValueError:
-            pass
-    else:
-        return x
+    rows = []
+    for i in range(data.shape[1]):
+        series = data.iloc[:, i]
+        sample = _memory_sample(series)
+        memory, error = _estimate_memory(series, sample)
+        suggested, suggested_memory = _suggest_dtype(series, sample)
+        savings = max(memory - suggested_memory, 0) if suggested is not None else 0
+        rows.append([memory, error, suggested, savings])
+    return pd.DataFrame(
+        rows,
+        columns=["Memory", "Error", "Suggested Type", "Savings"],
+        index=data.columns,
+    )
+
+
+def _is_object_storage(dtype) -> bool:
+    """Whether values are stored as Python objects, which deep memory usage counts."""
+    return dtype == np.dtype("O") or (
+        isinstance(dtype, pd.StringDtype) and dtype.storage == "python"
+    )
+
+
+def _memory_sample(series):
+    """Sample the values of an object column.
+
+    The sample size is set by the ``summary.memory_sample_size`` option. Values
+    are sampled uniformly with replacement (with a fixed seed, so estimates are
+    reproducible). Columns no longer than the sample size are not sampled.
+
+    Args:
+        series: The Pandas series
+
+    Returns:
+        Numpy array of sampled values, or None if values are not Python objects
+    """
+    if not _is_object_storage(series.dtype):
+        return None
+    values = np.asarray(series.array, dtype=object)
+    sample_size = get_option("summary.memory_sample_size")
+    if values.size <= sample_size:
+        return values
+    rng = np.random.default_rng(0)
+    return values[rng.integers(0, values.size, sample_size)]
+
+
+def _estimate_memory(series, sample=None):
+    """Estimate the deep memory usage of a column.
+
+    Unlike ``memory_usage(deep=True)``, the size of Python objects (e.g. strings)
+    is estimated from a sample, with a 95% confidence bound. The memory usage of
+    other columns is exact.
+
+    Args:
+        series: The Pandas series
+        sample: The sampled values from ``_memory_sample``
+
+    Returns:
+        (memory, error) tuple of the estimated bytes and its confidence bound
+    """
+    # Categories are usually few, so their deep memory usage is counted exactly
+    deep = isinstance(series.dtype, pd.CategoricalDtype)
+    memory = series.memory_usage(index=False, deep=deep)
+    if sample is None:
+        sample = _memory_sample(series)
+    if sample is None or sample.size == 0:
+        return memory, 0.0
+
+    sizes = np.fromiter(map(sys.getsizeof, sample), dtype=np.int64, count=sample.size)
+    memory += int(round(series.size * sizes.mean()))
+    if sample.size == series.size:
+        return memory, 0.0
+    error = 1.96 * series.size * sizes.std(ddof=1) / np.sqrt(sizes.size)
+    return memory, error
+
+
+def _suggest_dtype(series, sample=None):
+    """Suggest a dtype that holds the same values in less memory.
+
+    Integers are downcast to the smallest integer dtype holding their range,
+    unsigned if no value is negative, floats to float32 if no precision is lost,
+    and Python objects with few distinct values (as estimated from the sample) to
+    ``category``.
+
+    Args:
+        series: The Pandas series
+        sample: The sampled values from ``_memory_sample``
+
+    Returns:
+        (dtype, memory) tuple of the suggested dtype (or None) and the estimated
+        memory usage (bytes) after conversion
+    """
+    dtype = series.dtype
+    if isinstance(dtype, np.dtype) and dtype.kind in "iu" and series.size > 0:
+        values = series.to_numpy()
+        low, high = values.min(), values.max()
+        kinds = "ui" if low >= 0 else "i"
+        for candidate in [np.dtype(f"{k}{size}") for size in [1, 2, 4] for k in kinds]:
+            info = np.iinfo(candidate)
+            if (
+                candidate.itemsize < dtype.itemsize
+                and info.min <= low
+                and high <= info.max
+            ):
+                return candidate, series.size * candidate.itemsize
+    elif isinstance(dtype, np.dtype) and dtype == np.float64:
+        values = series.to_numpy()
+        with np.errstate(over="ignore"):
+            downcast = values.astype(np.float32)
+        if np.array_equal(downcast, values, equal_nan=True):
+            return np.dtype(np.float32), series.size * 4
+    elif _is_object_storage(dtype):
+        if sample is None:
+            sample = _memory_sample(series)
+        distinct = pd.unique(pd.Series(sample).dropna().astype(str))
+        if 0 < distinct.size <= sample.size // 2:
+            codes = np.min_scalar_type(-distinct.size).itemsize
+            sizes = np.fromiter(map(sys.getsizeof, distinct), np.int64, distinct.size)
+            return (
+                "category",
+                series.size * codes + int(sizes.sum()) + 8 * distinct.size,
+            )
+    return None, 0
+
+
+def _memory_fmt(memory, error: float = 0) -> str:
+    """Format an estimated memory usage with its confidence bound.
+
+    Args:
+        memory: The estimated number of bytes
+        error (float): The confidence bound
+
+    Returns:
+        The human-readable memory usage
+    """
+    if error > 0:
+        return "{} \u00b1 {}".format(_sizeof_fmt(memory), _sizeof_fmt(error))
+    return _sizeof_fmt(memory)
 
 
 def _sizeof_fmt(num):
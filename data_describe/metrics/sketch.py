@@ -0,0 +1,359 @@
+import numpy as np
+import pandas as pd
+from pandas.api.types import is_bool_dtype, is_numeric_dtype
+
+
+def _hash_values(values) -> np.ndarray:
+    """Hash values to unsigned 64-bit integers.
+
+    Numeric values are hashed as floats, so that the same value hashes
+    identically whether it was read as an integer or a float.
+
+    Args:
+        values: Array or series of values
+
+    Returns:
+        Array of uint64 hashes
+    """
+    values = pd.Series(values, copy=False)
+    if is_numeric_dtype(values.dtype) and not is_bool_dtype(values.dtype):
+        values = values.astype(np.float64)
+    try:
+        return pd.util.hash_pandas_object(values, index=False).to_numpy()
+    except TypeError:
+        # Unhashable values (e.g. lists) are hashed by their string representation
+        return pd.util.hash_pandas_object(values.astype(str), index=False).to_numpy()
+
+
+def _bit_length(x: np.ndarray) -> np.ndarray:
+    """Number of bits required to represent each (unsigned) integer.
+
+    Args:
+        x: Array of uint64 values
+
+    Returns:
+        Array of bit lengths
+    """
+    x = x.copy()
+    length = np.zeros(x.shape, dtype=np.uint8)
+    for shift in (32, 16, 8, 4, 2, 1):
+        mask = x >= (np.uint64(1) << np.uint64(shift))
+        length[mask] += shift
+        x[mask] >>= np.uint64(shift)
+    length += (x > 0).astype(np.uint8)
+    return length
+
+
+class HyperLogLog:
+    """HyperLogLog sketch for approximate distinct counts.
+
+    The sketch keeps the exact set of hashes until it grows past the number of
+    registers, so low-cardinality columns are counted exactly. Memory is bounded
+    by ``2 ** precision`` registers per sketch. Sketches with the same precision
+    can be merged, e.g. across chunks or partitions.
+
+    Attributes:
+        precision (int): Number of bits used to index registers. The relative
+            standard error is approximately ``1.04 / sqrt(2 ** precision)``.
+    """
+
+    def __init__(self, precision: int = 14):
+        """Approximate distinct counter.
+
+        Args:
+            precision (int): Number of bits used to index registers, between 4 and 18
+        """
+        if not 4 <= precision <= 18:
+            raise ValueError("HyperLogLog precision must be between 4 and 18")
+        self.precision = precision
+        self._hashes = np.empty(0, dtype=np.uint64)
+        self._registers = None
+
+    @classmethod
+    def from_error(cls, error: float) -> "HyperLogLog":
+        """Create a sketch with a given relative standard error.
+
+        Args:
+            error (float): The target relative standard error, e.g. 0.01 for 1%
+
+        Returns:
+            HyperLogLog
+        """
+        precision = int(np.ceil(2 * np.log2(1.04 / error)))
+        return cls(precision=min(max(precision, 4), 18))
+
+    @property
+    def m(self) -> int:
+        """Number of registers."""
+        return 1 << self.precision
+
+    def update(self, values):
+        """Add values to the sketch.
+
+        Args:
+            values: Array or series of (non-null) values
+        """
+        self._add_hashes(_hash_values(values))
+
+    def merge(self, other: "HyperLogLog"):
+        """Merge another sketch into this sketch.
+
+        Args:
+            other: The sketch to merge
+
+        Raises:
+            ValueError: Sketches have different precision.
+        """
+        if other.precision != self.precision:
+            raise ValueError("Cannot merge HyperLogLog sketches of different precision")
+        if other._registers is None:
+            self._add_hashes(other._hashes)
+        else:
+            self._densify()
+            np.maximum(self._registers, other._registers, out=self._registers)
+
+    def count(self) -> int:
+        """Estimate the number of distinct values.
+
+        Returns:
+            The (approximate) distinct count
+        """
+        if self._registers is None:
+            return int(self._hashes.size)
+
+        m = self.m
+        alpha = 0.7213 / (1 + 1.079 / m)
+        harmonic = np.sum(np.power(2.0, -self._registers.astype(np.float64)))
+        estimate = alpha * m * m / harmonic
+        zeros = np.count_nonzero(self._registers == 0)
+        if estimate <= 2.5 * m and zeros > 0:
+            # Small range correction (linear counting)
+            estimate = m * np.log(m / zeros)
+        return int(round(estimate))
+
+    def _add_hashes(self, hashes: np.ndarray):
+        if self._registers is None:
+            self._hashes = np.union1d(self._hashes, hashes)
+            if self._hashes.size > self.m:
+                self._densify()
+        else:
+            self._update_registers(hashes)
+
+    def _densify(self):
+        if self._registers is None:
+            self._registers = np.zeros(self.m, dtype=np.uint8)
+            self._update_registers(self._hashes)
+            self._hashes = np.empty(0, dtype=np.uint64)
+
+    def _update_registers(self, hashes: np.ndarray):
+        if hashes.size == 0:
+            return
+        p = np.uint64(self.precision)
+        index = (hashes >> (np.uint64(64) - p)).astype(np.int64)
+        remainder = hashes & ((np.uint64(1) << (np.uint64(64) - p)) - np.uint64(1))
+        rank = (64 - self.precision + 1) - _bit_length(remainder).astype(np.int64)
+
+        # Keep the maximum rank per register: after sorting, the last entry wins
+        keys = np.unique(index * 64 + rank)
+        index, rank = keys // 64, keys % 64
+        self._registers[index] = np.maximum(self._registers[index], rank)
+
+
+class QuantileSketch:
+    """Mergeable quantile sketch.
+
+    A simplified KLL sketch: values are buffered in a hierarchy of compactors,
+    where an item at level ``i`` represents ``2 ** i`` original values. When a
+    level exceeds its capacity it is sorted and every other item is promoted to
+    the next level. Quantiles are exact until the first compaction.
+
+    Attributes:
+        k (int): The capacity of each compactor. Larger values give more
+            accurate quantiles at the cost of memory.
+        n (int): The number of values added to the sketch.
+    """
+
+    def __init__(self, k: int = 2048):
+        """Mergeable quantile sketch.
+
+        Args:
+            k (int): The capacity of each compactor
+        """
+        self.k = k
+        self.n = 0
+        self._compactors = [np.empty(0, dtype=np.float64)]
+        self._offset = 0
+
+    def update(self, values):
+        """Add values to the sketch.
+
+        Args:
+            values: Array of (non-null) numeric values
+        """
+        values = np.asarray(values, dtype=np.float64)
+        self.n += values.size
+        self._compactors[0] = np.concatenate([self._compactors[0], values])
+        self._compress()
+
+    def merge(self, other: "QuantileSketch"):
+        """Merge another sketch into this sketch.
+
+        Args:
+            other: The sketch to merge
+        """
+        self.n += other.n
+        for level, items in enumerate(other._compactors):
+            if level < len(self._compactors):
+                self._compactors[level] = np.concatenate(
+                    [self._compactors[level], items]
+                )
+            else:
+                self._compactors.append(items.copy())
+        self._compress()
+
+    def quantile(self, q: float) -> float:
+        """Estimate a quantile.
+
+        Args:
+            q (float): The quantile, between 0 and 1
+
+        Returns:
+            The (approximate) quantile value
+        """
+        return self.quantiles([q])[0]
+
+    def quantiles(self, q) -> np.ndarray:
+        """Estimate several quantiles, sorting the sketch once.
+
+        Args:
+            q: List of quantiles, between 0 and 1
+
+        Returns:
+            Array of the (approximate) quantile values
+        """
+        q = np.asarray(q, dtype=np.float64)
+        if self.n == 0:
+            return np.full(q.shape, np.nan)
+        if len(self._compactors) == 1:
+            return np.quantile(self._compactors[0], q)
+
+        items = np.concatenate(self._compactors)
+        weights = np.concatenate(
+            [np.full(c.size, 2 ** level) for level, c in enumerate(self._compactors)]
+        )
+        order = np.argsort(items, kind="mergesort")
+        cumulative = np.cumsum(weights[order])
+        position = np.searchsorted(cumulative, q * cumulative[-1], side="left")
+        return items[order][np.minimum(position, items.size - 1)]
+
+    def _compress(self):
+        level = 0
+        while level < len(self._compactors):
+            items = self._compactors[level]
+            if items.size > self.k:
+                items = np.sort(items)
+                keep = items[-1:] if items.size % 2 else items[:0]
+                pairs = items[: items.size - keep.size]
+                promoted = pairs[self._offset :: 2]
+                self._offset ^= 1
+                self._compactors[level] = keep
+                if level + 1 == len(self._compactors):
+                    self._compactors.append(promoted)
+                else:
+                    self._compactors[level + 1] = np.concatenate(
+                        [self._compactors[level + 1], promoted]
+                    )
+            level += 1
+
+
+class SpaceSaving:
+    """Space-Saving sketch for the most frequent values (heavy hitters).
+
+    At most ``capacity`` counters are kept. Counts are exact while there are no
+    more distinct values than counters; otherwise each counter overestimates the
+    true count by at most its tracked error, which is bounded by ``n / capacity``.
+    Sketches are merged following the mergeable Space-Saving summary of
+    Cafaro et al.
+
+    Attributes:
+        capacity (int): The maximum number of counters
+        counts (Series): The (over)estimated counts, indexed by value
+        errors (Series): The maximum overestimate of each count
+        exact (bool): True if no counter was ever evicted, i.e. the counts are
+            exact and include every distinct value
+    """
+
+    def __init__(self, capacity: int = 1000):
+        """Heavy hitters sketch.
+
+        Args:
+            capacity (int): The maximum number of counters
+        """
+        self.capacity = capacity
+        self.counts = pd.Series(dtype=np.int64)
+        self.errors = pd.Series(dtype=np.int64)
+        self.exact = True
+
+    @property
+    def min_count(self) -> int:
+        """The largest possible count of a value without a counter."""
+        if self.counts.size < self.capacity:
+            return 0
+        return int(self.counts.min())
+
+    def update(self, values):
+        """Add values to the sketch.
+
+        Args:
+            values: Array or series of (non-null) values
+        """
+        values = pd.Series(values, copy=False)
+        try:
+            codes, uniques = pd.factorize(values)
+        except TypeError:
+            # Unhashable values (e.g. lists) are counted by their string representation
+            codes, uniques = pd.factorize(values.astype(str))
+        counts = pd.Series(np.bincount(codes, minlength=len(uniques)), index=uniques)
+        self._combine(counts, pd.Series(0, index=uniques), 0)
+
+    def merge(self, other: "SpaceSaving"):
+        """Merge another sketch into this sketch.
+
+        Args:
+            other: The sketch to merge
+        """
+        self._combine(other.counts, other.errors, other.min_count)
+        self.exact = self.exact and other.exact
+
+    def top(self, k: int = 1):
+        """The most frequent values.
+
+        Values are ranked by their estimated counts. The returned counts are
+        guaranteed lower bounds (the estimate minus its error), so they are exact
+        whenever the sketch has not overflowed.
+
+        Args:
+            k (int): Number of values to return
+
+        Returns:
+            Series of counts, indexed by value
+        """
+        top = self.counts.nlargest(k)
+        return top - self.errors.reindex(top.index)
+
+    def _combine(self, counts, errors, other_min: int):
+        own_min = self.min_count
+        index = self.counts.index.union(counts.index)
+        combined = self.counts.reindex(index, fill_value=own_min) + counts.reindex(
+            index, fill_value=other_min
+        )
+        combined_errors = self.errors.reindex(index, fill_value=own_min) + (
+            errors.reindex(index, fill_value=other_min)
+        )
+        if combined.size > self.capacity:
+            # Align by label with reindex: a boolean index would act as a mask
+            combined = combined.nlargest(self.capacity)
+            combined_errors = combined_errors.reindex(combined.index)
+            self.exact = False
+        self.counts = combined.astype(np.int64)
+        self.errors = combined_errors.astype(np.int64)
@@ -81,6 +81,31 @@ def _read_file_type(filepath, **kwargs):
         return pd.read_csv(filepath, sep=sep, **kwargs)
 
 
+def _read_file_chunks(filepath, chunksize, **kwargs):
+    """Read the file in chunks, based on file extension.
+
+    Currently supports the following filetypes:
+        csv, json (lines), txt
+
+    Args:
+        filepath: The filepath to open
+        chunksize (int): Number of rows per chunk
+        **kwargs: Keyword arguments to pass to the reader
+
+    Returns:
+        An iterator of Pandas data frames
+    """
+    extension = os.path.splitext(filepath)[1]
+    if is_filetype(_FileExtensionTypes.CSV.value, extension):
+        return pd.read_csv(filepath, chunksize=chunksize, **kwargs)
+    elif is_filetype(_FileExtensionTypes.JSON.value, extension):
+        lines = kwargs.pop("lines", True)
+        return pd.read_json(filepath, lines=lines, chunksize=chunksize, **kwargs)
+    else:
+        sep = kwargs.pop("sep", "\n")
+        return pd.read_csv(filepath, sep=sep, chunksize=chunksize, **kwargs)
+
+
 @_requires("google.cloud.storage")
 def download_gcs_file(filepath, bucket=None, prefix=None, **kwargs):
     """Downloads files from Google Cloud Storage.
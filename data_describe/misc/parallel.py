@@ -0,0 +1,65 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Optional
+
+import numpy as np
+
+from data_describe.config._config import get_option
+
+
+def _get_n_jobs(n_jobs: Optional[int] = None) -> int:
+    """Resolve the number of parallel workers.
+
+    Args:
+        n_jobs (int, optional): The number of workers. Negative values count back
+            from the number of CPUs, i.e. -1 uses all CPUs. Defaults to the
+            ``compute.n_jobs`` option.
+
+    Raises:
+        ValueError: n_jobs is zero.
+
+    Returns:
+        The number of workers
+    """
+    if n_jobs is None:
+        n_jobs = get_option("compute.n_jobs")
+    if n_jobs == 0:
+        raise ValueError("n_jobs must be a positive or negative integer, not 0")
+    if n_jobs < 0:
+        n_jobs = max((os.cpu_count() or 1) + 1 + n_jobs, 1)
+    return n_jobs
+
+
+def _map_blocks(
+    func: Callable, n_items: int, n_jobs: Optional[int] = None, blocks_per_job: int = 4
+) -> List:
+    """Apply a function to contiguous blocks of items using a thread pool.
+
+    Threads share the caller's memory, so data (e.g. a data frame) is never
+    copied or pickled to the workers; the numpy and pandas kernels doing the
+    heavy lifting release the GIL. Each worker receives several blocks so that
+    uneven blocks are balanced across workers.
+
+    Args:
+        func: Function taking a range of item positions and returning a list of
+            results, one per item
+        n_items (int): The number of items
+        n_jobs (int, optional): The number of workers. Defaults to the
+            ``compute.n_jobs`` option.
+        blocks_per_job (int): The number of blocks per worker
+
+    Returns:
+        The list of results, in the original item order
+    """
+    n_jobs = min(_get_n_jobs(n_jobs), n_items)
+    if n_jobs <= 1:
+        return list(func(range(n_items)))
+
+    bounds = np.linspace(0, n_items, min(n_jobs * blocks_per_job, n_items) + 1)
+    blocks = [
+        range(start, stop)
+        for start, stop in zip(bounds[:-1].astype(int), bounds[1:].astype(int))
+    ]
+    with ThreadPoolExecutor(max_workers=n_jobs) as executor:
+        results = executor.map(func, blocks)
+        return [result for block in results for result in block]
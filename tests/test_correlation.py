@@ -1,12 +1,20 @@
 import plotly
 import pytest
 import matplotlib
+import numpy as np
+import pandas as pd
 from matplotlib.axes import Axes as mpl_plot
 from pandas.testing import assert_frame_equal
+from scipy.stats import chi2_contingency
 
 import data_describe as dd
 from data_describe.compat import _is_dataframe
-from data_describe.core.correlation import CorrelationWidget
+from data_describe.core.correlation import (
+    CorrelationWidget,
+    _correlation_ratio_matrix,
+    _cramers_v_matrix,
+    _reorder_by_original,
+)
 
 matplotlib.use("Agg")
 
@@ -34,6 +42,7 @@ def test_cluster_widget():
 def test_figure_default(data):
     cr = dd.correlation_matrix(data)
     assert isinstance(cr.show(viz_backend="plotly"), plotly.graph_objs.Figure)
+    assert cr.association_matrix.notnull().all(axis=None)
     assert isinstance(cr.show(), mpl_plot)
     assert _is_dataframe(cr.association_matrix)
     assert _is_dataframe(cr.viz_data)
@@ -121,3 +130,319 @@ def test_numeric_data_only_but_specified_categorical(data):
     num_data = data.select_dtypes(["number"])
     with pytest.warns(UserWarning):
         dd.correlation_matrix(num_data, categorical=True)
+
+
+@pytest.mark.base
+def test_cramers_v_matrix():
+    df = pd.DataFrame(
+        {
+            "a": list("xyzxyzxyzx"),
+            "b": list("pqpqpqpqpq"),
+            "c": list("qpqpqpqpqp"),
+            "d": ["u", "v", None, "u", "v", "u", "v", "u", "v", "v"],
+        }
+    )
+    cramers = _cramers_v_matrix(df)
+    assert (cramers.index == df.columns).all()
+    assert_frame_equal(cramers, cramers.T)
+    assert np.allclose(np.diag(cramers), 1)
+    # 2x2 tables give the signed phi coefficient
+    assert cramers.loc["b", "c"] == pytest.approx(-1)
+    assert cramers.loc["b", "d"] == pytest.approx(
+        np.corrcoef(df["b"][df["d"].notnull()] == "q", df["d"].dropna() == "v")[0, 1]
+    )
+    # Bias-corrected Cramer's V from the (pairwise complete) contingency table
+    table = pd.crosstab(df["a"], df["d"])
+    n = table.values.sum()
+    chi2 = chi2_contingency(table, correction=False)[0]
+    r, k = table.shape
+    phi2corr = max(0, chi2 / n - (k - 1) * (r - 1) / (n - 1))
+    rcorr, kcorr = r - (r - 1) ** 2 / (n - 1), k - (k - 1) ** 2 / (n - 1)
+    assert cramers.loc["a", "d"] == pytest.approx(
+        np.sqrt(phi2corr / min(kcorr - 1, rcorr - 1))
+    )
+
+
+@pytest.mark.base
+def test_correlation_ratio_matrix():
+    num = pd.DataFrame({"a": [1.0, 2, 3, 4, np.nan, 6], "b": [1, 1, 2, 2, 3, 3]})
+    cat = pd.DataFrame({"x": list("ppqqrr"), "y": ["u", "v", None, "v", "u", "v"]})
+    eta = _correlation_ratio_matrix(num, cat)
+    assert list(eta.index) == ["a", "b"]
+    assert list(eta.columns) == ["x", "y"]
+    assert eta.loc["b", "x"] == pytest.approx(1)
+    # Eta from the category means, over all non-null numeric values
+    y = num["a"]
+    means = y.groupby(cat["y"]).agg(["count", "mean"])
+    expected = np.sqrt(
+        np.sum(means["count"] * (means["mean"] - y.mean()) ** 2)
+        / np.sum((y - y.mean()) ** 2)
+    )
+    assert eta.loc["a", "y"] == pytest.approx(expected)
+
+
+@pytest.mark.base
+def test_chunked_correlation(data, tmp_path):
+    data = data.copy()
+    data.loc[::7, "a"] = np.nan
+    expected = data.select_dtypes("number").corr()
+    chunks = [data.iloc[i : i + 60] for i in range(0, data.shape[0], 60)]
+    cr = dd.correlation_matrix(iter(chunks))
+    assert isinstance(cr, CorrelationWidget)
+    assert_frame_equal(cr.association_matrix, expected)
+    assert_frame_equal(cr.viz_data, cr.association_matrix)
+
+    path = tmp_path / "data.csv"
+    data.drop(columns="f").to_csv(path, index=False)
+    with dd.config.update_context({"correlation.chunksize": 100}):
+        cr = dd.correlation_matrix(str(path), cluster=True)
+    assert_frame_equal(cr.association_matrix, expected)
+    assert cr.cluster_matrix.shape == expected.shape
+
+    with pytest.raises(ValueError):
+        dd.correlation_matrix(iter(chunks), categorical=True)
+
+
+@pytest.mark.base
+def test_correlation_update_merge(data):
+    expected = data.select_dtypes("number").corr()
+    cr = dd.correlation_matrix(data.iloc[:100])
+    cr.update(data.iloc[100:200])
+    cr.merge(dd.correlation_matrix(data.iloc[200:]))
+    assert_frame_equal(cr.association_matrix, expected)
+    assert_frame_equal(cr.viz_data, cr.association_matrix)
+    assert cr.input_data is None
+
+    cr = dd.correlation_matrix(data)
+    assert cr.input_data is data, "The input should be kept without a copy"
+    cr = dd.correlation_matrix(data, keep_input=False)
+    assert cr.input_data is None
+    with pytest.raises(ValueError):
+        cr.update(data)
+
+    cr = dd.correlation_matrix(data, categorical=True)
+    with pytest.raises(ValueError):
+        cr.update(data)
+
+
+@pytest.mark.base
+def test_blocked_correlation(numeric_data, tmp_path):
+    numeric_data = numeric_data.drop(columns="f", errors="ignore")
+    expected = numeric_data.corr()
+    with dd.config.update_context({"correlation.block_size": 2}):
+        cr = dd.correlation_matrix(numeric_data, n_jobs=2)
+        assert np.allclose(cr.association_matrix, expected)
+
+        path = str(tmp_path / "corr.f32")
+        cr = dd.correlation_matrix(numeric_data, n_jobs=2, out=path)
+    assert cr.input_data is None
+    assert (cr.association_matrix.dtypes == np.float32).all()
+    assert np.allclose(cr.association_matrix, expected, atol=1e-6)
+    assert isinstance(cr.show(viz_backend="plotly"), plotly.graph_objs.Figure)
+
+    cr = CorrelationWidget.from_file(path, numeric_data.columns)
+    assert np.allclose(cr.association_matrix, expected, atol=1e-6)
+    assert_frame_equal(cr.viz_data, cr.association_matrix)
+    assert isinstance(cr.show(viz_backend="plotly"), plotly.graph_objs.Figure)
+
+
+@pytest.mark.base
+def test_correlated_pairs(numeric_data):
+    numeric_data = numeric_data.assign(d=-numeric_data["a"], e=numeric_data["b"])
+    full = numeric_data.corr()
+    with dd.config.update_context({"correlation.block_size": 2}):
+        pairs = dd.correlated_pairs(numeric_data, threshold=0.99)
+        assert list(pairs.columns) == ["Column 1", "Column 2", "Correlation"]
+        assert set(zip(pairs["Column 1"], pairs["Column 2"])) == {
+            ("a", "d"),
+            ("b", "e"),
+        }
+        assert np.allclose(pairs["Correlation"], [-1, 1])
+
+        pairs = dd.correlated_pairs(numeric_data, top_k=2)
+    assert pairs.shape[0] == 2 * full.shape[0]
+    for column, partners in pairs.groupby("Column 1"):
+        expected = full[column].drop(column).abs().nlargest(2)
+        assert np.allclose(partners["Correlation"].abs(), expected)
+
+    numeric_data.loc[::5, "a"] = np.nan
+    full = dd.correlation_matrix(numeric_data, method="spearman").association_matrix
+    with dd.config.update_context({"correlation.block_size": 2}):
+        pairs = dd.correlated_pairs(numeric_data, top_k=1, method="spearman")
+    for column, partners in pairs.groupby("Column 1"):
+        expected = full[column].drop(column).abs().max()
+        assert partners["Correlation"].abs().iloc[0] == pytest.approx(expected)
+
+    with pytest.raises(ValueError):
+        dd.correlated_pairs(numeric_data)
+
+
+@pytest.mark.base
+@pytest.mark.parametrize("method", ["spearman", "kendall"])
+def test_rank_correlation(numeric_data, method):
+    numeric_data = numeric_data.assign(d=numeric_data["a"] ** 3, e=1)
+    numeric_data.loc[::9, "b"] = np.nan
+    cr = dd.correlation_matrix(numeric_data, method=method, n_jobs=2)
+    expected = numeric_data.corr(method).fillna(0)
+    # With nulls, Spearman ranks are computed per column rather than per pair
+    assert np.allclose(cr.association_matrix, expected, atol=1e-2)
+    assert cr.association_matrix.loc["a", "d"] == pytest.approx(1)
+
+    pairs = dd.correlated_pairs(numeric_data, threshold=0.99, method=method)
+    assert set(zip(pairs["Column 1"], pairs["Column 2"])) == {("a", "d")}
+
+
+@pytest.mark.base
+def test_correlation_method_errors(data):
+    with pytest.raises(ValueError):
+        dd.correlation_matrix(data, method="unknown")
+    with pytest.raises(ValueError):
+        dd.correlation_matrix(iter([data]), method="spearman")
+
+
+@pytest.mark.base
+def test_pairwise_complete_correlation(numeric_data, tmp_path):
+    numeric_data = numeric_data.copy()
+    numeric_data.loc[::3, "a"] = np.nan
+    numeric_data.loc[::4, "b"] = np.nan
+    with dd.config.update_context({"correlation.block_size": 2}):
+        cr = dd.correlation_matrix(numeric_data)
+        assert np.allclose(cr.association_matrix, numeric_data.corr())
+        path = str(tmp_path / "corr.f32")
+        written = dd.correlation_matrix(numeric_data, n_jobs=2, out=path)
+
+    observed = numeric_data.notnull().astype(int)
+    assert_frame_equal(cr.pair_counts, observed.T.dot(observed))
+    assert cr.pair_counts.loc["a", "b"] == 124
+    assert (written.pair_counts.dtypes == np.float32).all()
+    assert_frame_equal(written.pair_counts, observed.T.dot(observed), check_dtype=False)
+
+    cr = dd.correlation_matrix(iter([numeric_data.iloc[:100], numeric_data.iloc[100:]]))
+    assert_frame_equal(cr.pair_counts, observed.T.dot(observed))
+
+
+@pytest.mark.base
+@pytest.mark.parametrize(
+    "linkage, optimal_ordering",
+    [("single", False), ("average", True), ("spectral", False)],
+)
+def test_cluster_linkage(numeric_data, linkage, optimal_ordering):
+    numeric_data = numeric_data.assign(d=numeric_data["a"], e=-numeric_data["c"])
+    cr = dd.correlation_matrix(
+        numeric_data, cluster=True, linkage=linkage, optimal_ordering=optimal_ordering
+    )
+    order = list(cr.cluster_matrix.columns)
+    assert sorted(order) == sorted(numeric_data.columns)
+    assert abs(order.index("a") - order.index("d")) == 1
+    assert_frame_equal(
+        cr.cluster_matrix, cr.association_matrix.loc[order, order], check_names=False
+    )
+    assert cr.linkage == linkage
+
+
+@pytest.mark.base
+def test_reorder_by_original(data):
+    shuffled = dd.correlation_matrix(data, categorical=True).association_matrix
+    shuffled = shuffled.iloc[::-1, ::-1]
+    reordered = _reorder_by_original(shuffled, data)
+    assert list(reordered.columns) == list(data.columns)
+    assert_frame_equal(reordered, shuffled.loc[data.columns, data.columns])
+
+
+@pytest.mark.base
+def test_mutual_info(numeric_data):
+    data = numeric_data.assign(
+        d=numeric_data["a"] ** 3, e=np.where(numeric_data["b"] > 3, "x", "y"), f=1
+    )
+    data.loc[::7, "e"] = None
+    with dd.config.update_context({"correlation.bins": 4}):
+        cr = dd.correlation_matrix(data, categorical=True, method="mutual_info")
+    mi = cr.association_matrix
+    assert mi.loc["a", "d"] == pytest.approx(1)
+    assert mi.loc["b", "e"] > 0.4
+    assert (mi["f"] == 0).all()
+    assert ((mi >= 0) & (mi <= 1)).all(axis=None)
+    assert np.allclose(mi, mi.T)
+
+
+@pytest.mark.base
+def test_sampled_correlation(data):
+    cr = dd.correlation_matrix(data, sample=100)
+    assert cr.input_data.shape[0] == 100
+    assert_frame_equal(
+        cr.association_matrix, cr.input_data.select_dtypes("number").corr()
+    )
+    lower, upper = cr.confidence_interval
+    observed = cr.association_matrix.notnull() & lower.notnull()
+    assert (lower <= cr.association_matrix + 1e-9)[observed].all(axis=None)
+    assert (upper >= cr.association_matrix - 1e-9)[observed].all(axis=None)
+    assert (upper - lower).loc["a", "b"] > 0
+    with pytest.raises(ValueError):
+        cr.update(data)
+    with pytest.raises(ValueError):
+        dd.correlation_matrix(data).merge(cr)
+
+    with dd.config.update_context("correlation.bootstrap", True):
+        bootstrap = dd.correlation_matrix(data, sample=100).confidence_interval
+    width = (bootstrap[1] - bootstrap[0]).loc["a", "b"]
+    assert width == pytest.approx((upper - lower).loc["a", "b"], rel=0.5)
+
+    cr = dd.correlation_matrix(data, sample=0.5, stratify="d", method="spearman")
+    assert cr.pair_counts.loc["a", "a"] == pytest.approx(125, abs=2)
+    assert cr.confidence_interval is not None
+
+    cr = dd.correlation_matrix(iter([data.iloc[:100], data.iloc[100:]]), sample=0.5)
+    assert cr.input_data.shape[0] == pytest.approx(125, abs=2)
+    with pytest.raises(ValueError):
+        dd.correlation_matrix(iter([data]), sample=10)
+    with pytest.raises(ValueError):
+        dd.correlation_matrix(data, sample=1.5)
+
+
+@pytest.mark.base
+def test_sampled_correlation_rows():
+    data = pd.DataFrame(np.random.normal(size=(2000, 30)))
+    cr = dd.correlation_matrix(data, sample=0.02)
+    n = round(0.02 * data.shape[0])
+    assert cr.input_data.shape == (n, 30)
+    assert (cr.pair_counts.to_numpy() == n).all()
+    assert_frame_equal(cr.association_matrix, cr.input_data.corr(), check_exact=False)
+    lower, upper = cr.confidence_interval
+    assert lower.shape == upper.shape == (30, 30)
+    assert (lower.to_numpy() <= cr.association_matrix.to_numpy() + 1e-12).all()
+    assert (cr.association_matrix.to_numpy() <= upper.to_numpy() + 1e-12).all()
+
+
+@pytest.mark.base
+@pytest.mark.parametrize("categorical", [False, True])
+def test_correlation_compute_backends(compute_backend_df, categorical):
+    df = compute_backend_df.copy()
+    df.loc[::5, "a"] = np.nan
+    df.loc[::7, "d"] = None
+    cr = dd.correlation_matrix(df, categorical=categorical)
+    sampled = dd.correlation_matrix(df, sample=0.5, stratify="d")
+    if not isinstance(df, pd.DataFrame):
+        df = df._to_pandas()
+    expected = dd.correlation_matrix(df, categorical=categorical)
+    assert_frame_equal(cr.association_matrix, expected.association_matrix)
+    assert cr.categorical == categorical
+
+    cr, expected = sampled, dd.correlation_matrix(df, sample=0.5, stratify="d")
+    assert_frame_equal(cr.association_matrix, expected.association_matrix)
+    assert cr.pair_counts.loc["a", "a"] == expected.pair_counts.loc["a", "a"]
+
+
+@pytest.mark.base
+def test_float32_correlation(data):
+    cr = dd.correlation_matrix(data, cluster=True, dtype="float32")
+    expected = dd.correlation_matrix(data, cluster=True)
+    assert (cr.association_matrix.dtypes == np.float32).all()
+    assert (cr.cluster_matrix.dtypes == np.float32).all()
+    assert cr.viz_data is cr.cluster_matrix
+    assert np.allclose(cr.association_matrix, expected.association_matrix, atol=1e-6)
+
+    cr = dd.correlation_matrix(data, categorical=True, dtype="float32")
+    assert (cr.association_matrix.dtypes == np.float32).all()
+    assert cr.viz_data is cr.association_matrix
+    with pytest.raises(ValueError):
+        dd.correlation_matrix(data, dtype="int64")
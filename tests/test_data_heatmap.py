@@ -1,4 +1,6 @@
 import matplotlib
+import numpy as np
+import pandas as pd
 import pytest
 import plotly
 
@@ -34,3 +36,32 @@ def test_heatmap_invalid(compute_backend_df):
     data = [1, 2, 3, 4]
     with pytest.raises((ValueError, ModuleNotFoundError)):
         dd.data_heatmap(data)
+
+
+@pytest.mark.base
+@pytest.mark.parametrize("aggregate", ["mean", "minmax", "maxabs"])
+def test_heatmap_bins(aggregate):
+    data = pd.DataFrame(np.random.normal(size=(1003, 2)), columns=["a", "b"])
+    data.iloc[::3, 0] = np.nan
+    data.iloc[500, 1] = 100
+    w = dd.data_heatmap(data, bins=100, aggregate=aggregate)
+    assert w.std_data.shape == (2, 100)
+    assert w.records[0] == 0 and w.records[-1] < 1003
+    assert (np.diff(w.records) > 0).all(), "Heatmap columns must have distinct x"
+    assert not w.std_data.isna().any().any()
+    if aggregate != "mean":
+        assert w.std_data.loc["b"].max() > 30, "Outlier was averaged away"
+    fig = w.show(viz_backend="plotly")
+    assert isinstance(fig, plotly.graph_objs.Figure)
+    assert list(fig.data[0].x) == list(w.records)
+
+    w = dd.data_heatmap(data, missing=True, bins=100)
+    assert w.missing_data.shape == (2, 100)
+    assert np.allclose(w.missing_data.loc["a"].mean(), 1 / 3, atol=0.01)
+    assert w.missing_data.loc["b"].sum() == 0
+
+    w = dd.data_heatmap(data, bins=2000)
+    assert w.records is None and w.std_data.shape == (2, 1003)
+
+    with pytest.raises(ValueError):
+        dd.data_heatmap(data, aggregate="median")
@@ -0,0 +1,91 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from data_describe.metrics.sketch import HyperLogLog, QuantileSketch, SpaceSaving
+
+
+@pytest.mark.base
+def test_hyperloglog_exact_when_small():
+    hll = HyperLogLog(precision=10)
+    hll.update(np.array([1, 2, 2, 3]))
+    hll.update(np.array([3.0, 4.0]))
+    assert hll.count() == 4
+
+
+@pytest.mark.base
+def test_hyperloglog_merge():
+    np.random.seed(22)
+    values = np.random.randint(0, 50000, size=100000)
+    left, right = HyperLogLog(precision=12), HyperLogLog(precision=12)
+    left.update(values[:50000])
+    right.update(values[50000:])
+    left.merge(right)
+    expected = np.unique(values).size
+    assert abs(left.count() - expected) / expected < 0.05
+
+
+@pytest.mark.base
+def test_hyperloglog_invalid_merge():
+    with pytest.raises(ValueError):
+        HyperLogLog(precision=10).merge(HyperLogLog(precision=12))
+
+
+@pytest.mark.base
+def test_quantile_sketch():
+    np.random.seed(22)
+    values = np.random.normal(size=100000)
+    left, right = QuantileSketch(k=256), QuantileSketch(k=256)
+    left.update(values[:50000])
+    right.update(values[50000:])
+    left.merge(right)
+    assert left.n == values.size
+    for q in [0.1, 0.5, 0.9]:
+        rank = np.mean(values <= left.quantile(q))
+        assert rank == pytest.approx(q, abs=0.02)
+
+
+@pytest.mark.base
+def test_quantile_sketch_exact_when_small():
+    sketch = QuantileSketch()
+    sketch.update(np.arange(11))
+    assert sketch.quantile(0.5) == 5
+
+
+@pytest.mark.base
+def test_hyperloglog_from_error():
+    assert HyperLogLog.from_error(0.01).precision == 14
+    assert HyperLogLog.from_error(0.5).precision == 4
+
+
+@pytest.mark.base
+def test_space_saving():
+    np.random.seed(22)
+    values = np.random.zipf(1.5, size=100000)
+    left, right = SpaceSaving(capacity=100), SpaceSaving(capacity=100)
+    left.update(values[:50000])
+    right.update(values[50000:])
+    left.merge(right)
+    top = left.top(3)
+    assert list(top.index) == [1, 2, 3]
+    exact = pd.Series(values).value_counts().loc[[1, 2, 3]].to_numpy()
+    assert (top.to_numpy() <= exact).all()
+    assert (exact - top.to_numpy() <= values.size / 100).all()
+    assert not left.exact
+
+
+@pytest.mark.base
+def test_space_saving_exact_when_small():
+    sketch = SpaceSaving(capacity=10)
+    sketch.update(["a", "b", "a"])
+    sketch.update(["c", "a"])
+    assert sketch.top(2).to_dict() == {"a": 3, "b": 1}
+    assert sketch.exact
+
+
+@pytest.mark.base
+def test_space_saving_bool_values():
+    sketch = SpaceSaving(capacity=1)
+    sketch.update(np.array([True, True, False]))
+    sketch.update(np.array([False, False, False]))
+    assert sketch.top(1).to_dict() == {False: 3}
@@ -1,11 +1,15 @@
 import sys
 
 import pytest
+import numpy as np
+import pandas as pd
 
+import data_describe as dd
 from data_describe.compat import _is_dataframe
 from data_describe.core.summary import (
     data_summary,
     SummaryWidget,
+    _format_summary,
 )
 
 
@@ -20,11 +24,6 @@ def load_series_summary(compute_backend_df):
 
 
 @pytest.mark.base
-@pytest.mark.parametrize(
-    "compute_backend_df",
-    ["pandas", pytest.param("modin.pandas", marks=pytest.mark.xfail)],
-    indirect=True,
-)  # xfail: modin #2376
 def test_dataframe_attributes(load_summary, compute_backend_df):
     assert isinstance(load_summary, SummaryWidget)
     assert str(load_summary) == "data-describe Summary Widget"
@@ -47,11 +46,6 @@ def test_no_ipython(load_summary, compute_backend_df, monkeypatch, capsys):
 
 
 @pytest.mark.base
-@pytest.mark.parametrize(
-    "compute_backend_df",
-    ["pandas", pytest.param("modin.pandas", marks=pytest.mark.xfail)],
-    indirect=True,
-)  # xfail: modin #2376
 def test_series_attributes(load_series_summary, compute_backend_df):
     assert isinstance(load_series_summary, SummaryWidget)
     assert str(load_series_summary) == "data-describe Summary Widget"
@@ -63,21 +57,325 @@ def test_series_attributes(load_series_summary, compute_backend_df):
 
 
 @pytest.mark.base
-@pytest.mark.parametrize(
-    "compute_backend_df",
-    ["pandas", pytest.param("modin.pandas", marks=pytest.mark.xfail)],
-    indirect=True,
-)  # xfail: modin #2376
 def test_shape(load_summary, compute_backend_df):
     assert load_summary.summary_data.shape == (compute_backend_df.shape[1], 10)
     assert load_summary.info_data.shape == (3, 1)
 
 
 @pytest.mark.base
-@pytest.mark.parametrize(
-    "compute_backend_df",
-    ["pandas", pytest.param("modin.pandas", marks=pytest.mark.xfail)],
-    indirect=True,
-)  # xfail: modin #2376
 def test_zeros(load_summary, compute_backend_df):
     assert load_summary.summary_data["Zeros"]["z"] == compute_backend_df.shape[0]
+
+
+@pytest.mark.base
+def test_summary_values(data):
+    data = data.copy()
+    data.loc[0, "a"] = np.nan
+    summary = data_summary(data).summary_data
+    assert summary.loc["a", "Nulls"] == 1
+    assert summary.loc["a", "Mean"] == pytest.approx(data["a"].mean())
+    assert summary.loc["a", "Median"] == pytest.approx(data["a"].median())
+    assert summary.loc["a", "Standard Deviation"] == pytest.approx(
+        data["a"].std(ddof=0)
+    )
+    assert summary.loc["a", "Min"] == data["a"].min()
+    assert summary.loc["d", "Unique"] == 2
+    assert summary.loc["d", "Top Frequency"] == data["d"].value_counts().max()
+    assert summary.loc["f", "Nulls"] == data.shape[0]
+
+
+@pytest.mark.base
+def test_chunked_summary(data):
+    chunks = [data.iloc[i : i + 50] for i in range(0, data.shape[0], 50)]
+    expected = data_summary(data).summary_data
+    summary = data_summary(iter(chunks))
+    assert isinstance(summary, SummaryWidget)
+    assert summary.info_data.loc["Rows", "Info"] == data.shape[0]
+    assert summary.summary_data.shape == expected.shape
+    for col in ["Nulls", "Zeros", "Unique", "Top Frequency"]:
+        assert (summary.summary_data[col] == expected[col]).all()
+    assert summary.summary_data.loc["a", "Mean"] == pytest.approx(
+        expected.loc["a", "Mean"]
+    )
+    assert summary.summary_data.loc["a", "Standard Deviation"] == pytest.approx(
+        expected.loc["a", "Standard Deviation"]
+    )
+    assert summary.summary_data.loc["a", "Median"] == pytest.approx(
+        expected.loc["a", "Median"]
+    )
+
+
+@pytest.mark.base
+def test_file_summary(data, tmp_path):
+    filepath = tmp_path / "data.csv"
+    data.to_csv(filepath, index=False)
+    with dd.config.update_context("summary.chunksize", 100):
+        summary = data_summary(str(filepath))
+    assert summary.info_data.loc["Rows", "Info"] == data.shape[0]
+    assert summary.summary_data.loc["d", "Unique"] == 2
+
+
+@pytest.mark.base
+def test_approximate_unique(data):
+    data = data.assign(g=np.arange(data.shape[0]) % 7)
+    summary = data_summary(data, approximate=True).summary_data
+    assert summary.loc["g", "Unique"] == 7
+    assert summary.loc["a", "Unique"] == data["a"].nunique()
+
+    with dd.config.update_context(
+        {"summary.approximate": True, "summary.distinct_error": 0.2}
+    ):
+        large = pd.DataFrame({"x": np.arange(5000)})
+        estimate = data_summary(large).summary_data.loc["x", "Unique"]
+    assert estimate != 5000
+    assert estimate == pytest.approx(5000, rel=0.5)
+
+
+@pytest.mark.base
+@pytest.mark.parametrize("approximate", [False, True])
+def test_top_values(data, approximate):
+    summary = data_summary(data, approximate=approximate, top_k=2)
+    expected = data["e"].value_counts()
+    top = summary.top_values.loc["e"]
+    assert list(top["Value"]) == list(expected.index)
+    assert list(top["Count"]) == list(expected)
+    assert summary.summary_data.loc["e", "Top Frequency"] == expected.max()
+    assert data_summary(data).top_values is None
+
+
+@pytest.mark.base
+def test_update_summary(data):
+    expected = data_summary(data).summary_data
+    summary = data_summary(data.iloc[:60])
+    summary.update(data.iloc[60:])
+    assert summary.input_data is None
+    assert summary.info_data.loc["Rows", "Info"] == data.shape[0]
+    for col in ["Nulls", "Zeros", "Unique", "Top Frequency"]:
+        assert (summary.summary_data[col] == expected[col]).all()
+    assert summary.summary_data.loc["a", "Mean"] == pytest.approx(
+        expected.loc["a", "Mean"]
+    )
+    assert summary.summary_data.loc["a", "Standard Deviation"] == pytest.approx(
+        expected.loc["a", "Standard Deviation"]
+    )
+
+    summary = data_summary(data["a"].iloc[:60])
+    summary.update(data["a"].iloc[60:])
+    assert summary.summary_data.loc["a", "Mean"] == pytest.approx(
+        expected.loc["a", "Mean"]
+    )
+
+
+@pytest.mark.base
+def test_bool_summary(data):
+    data = data.assign(g=np.arange(data.shape[0]) % 3 == 0)
+    expected = data["g"].value_counts().max()
+    chunks = [data.iloc[i : i + 50] for i in range(0, data.shape[0], 50)]
+    summary = data_summary(iter(chunks))
+    assert summary.summary_data.loc["g", "Top Frequency"] == expected
+
+    summary = data_summary(data.iloc[:60])
+    summary.update(data.iloc[60:])
+    assert summary.summary_data.loc["g", "Top Frequency"] == expected
+
+    summary = data_summary(data, approximate=True, top_k=2)
+    assert summary.summary_data.loc["g", "Top Frequency"] == expected
+    assert list(summary.top_values.loc["g", "Count"]) == list(
+        data["g"].value_counts()
+    )
+
+
+@pytest.mark.base
+def test_merge_summary(data):
+    expected = data_summary(data).summary_data
+    summary = data_summary(data.iloc[:30])
+    summary.merge(data_summary(data.iloc[30:]))
+    assert summary.info_data.loc["Rows", "Info"] == data.shape[0]
+    for col in ["Nulls", "Zeros", "Unique", "Top Frequency"]:
+        assert (summary.summary_data[col] == expected[col]).all()
+
+    summary.input_data = summary.accumulator = None
+    with pytest.raises(ValueError):
+        summary.update(data)
+
+
+@pytest.mark.base
+def test_parallel_summary(data):
+    expected = data_summary(data, top_k=2)
+    summary = data_summary(data, top_k=2, n_jobs=3)
+    pd.testing.assert_frame_equal(summary.summary_data, expected.summary_data)
+    pd.testing.assert_frame_equal(
+        summary.top_values.loc[["d", "e"]], expected.top_values.loc[["d", "e"]]
+    )
+    with dd.config.update_context("compute.n_jobs", -1):
+        summary = data_summary(data)
+    pd.testing.assert_frame_equal(summary.summary_data, expected.summary_data)
+    with pytest.raises(ValueError):
+        data_summary(data, n_jobs=0)
+
+
+@pytest.mark.base
+def test_percentiles(compute_backend_df):
+    summary = data_summary(compute_backend_df, percentiles=True).summary_data
+    expected = np.percentile(compute_backend_df["a"], [1, 5, 25, 75, 95, 99])
+    assert list(summary.columns[-6:]) == ["p1", "p5", "p25", "p75", "p95", "p99"]
+    assert summary.loc["a", "p1":"p99"].astype(float).to_numpy() == pytest.approx(
+        expected
+    )
+    assert summary.loc["d", "p1":"p99"].isnull().all()
+    assert "p1" not in data_summary(compute_backend_df).summary_data.columns
+
+
+@pytest.mark.base
+def test_chunked_percentiles(data):
+    chunks = [data.iloc[i : i + 50] for i in range(0, data.shape[0], 50)]
+    summary = data_summary(iter(chunks), percentiles=True).summary_data
+    expected = np.percentile(data["a"], [1, 5, 25, 75, 95, 99])
+    assert summary.loc["a", "p1":"p99"].astype(float).to_numpy() == pytest.approx(
+        expected, rel=0.05
+    )
+
+
+@pytest.mark.base
+def test_categorical_datetime_summary():
+    dates = pd.to_datetime(["2020-01-01", None, "2020-01-03", "2020-01-03"])
+    data = pd.DataFrame(
+        {
+            "c": pd.Categorical(["a", None, "b", "b"], categories=["z", "a", "b"]),
+            "d": dates,
+            "t": dates.tz_localize("US/Eastern"),
+        }
+    )
+    summary = data_summary(data, top_k=1)
+    stats = summary.summary_data
+    assert list(stats["Nulls"]) == [1, 1, 1]
+    assert list(stats["Unique"]) == [2, 2, 2]
+    assert list(stats["Top Frequency"]) == [2, 2, 2]
+    assert stats.loc["d", "Min"] == pd.Timestamp("2020-01-01")
+    assert stats.loc["t", "Max"] == pd.Timestamp("2020-01-03", tz="US/Eastern")
+    assert summary.top_values.loc[("c", 1), "Value"] == "b"
+
+
+@pytest.mark.base
+def test_format_summary(data):
+    data = data.assign(g=[-2.345, 0.0012] * 125)
+    summary_data = data_summary(data).summary_data
+    expected = summary_data.copy()
+    formatted = _format_summary(summary_data, rows=250, as_percentage=True)
+    pd.testing.assert_frame_equal(summary_data, expected)
+    assert formatted.loc["f", "Nulls"] == "100.0%"
+    assert formatted.loc["g", "Min"] == "-2.35"
+    assert formatted.loc["g", "Max"] == "0.0012"
+    assert formatted.loc["d", "Mean"] == ""
+    assert formatted.loc["d", "Unique"] == 2
+
+
+@pytest.mark.base
+def test_grouped_summary(compute_backend_df):
+    summary = data_summary(compute_backend_df, by="d", percentiles=True)
+    assert summary.summary_data.index.names == ["d", None]
+    assert summary.info_data.loc["Groups", "Info"] == 2
+    data = compute_backend_df
+    group = data[data["d"] == "x"].drop(columns="d")
+    expected = data_summary(group, percentiles=True).summary_data
+    stats = summary.summary_data.loc["x"]
+    for col in ["Nulls", "Zeros", "Unique", "Top Frequency"]:
+        assert list(stats[col]) == list(expected[col])
+    for col in ["Mean", "Standard Deviation", "Median", "p5"]:
+        assert stats.loc["a", col] == pytest.approx(expected.loc["a", col])
+    with pytest.raises(ValueError):
+        summary.update(data)
+
+
+@pytest.mark.base
+def test_grouped_summary_null_key():
+    data = pd.DataFrame(
+        {
+            "g": ["x", None, "x"],
+            "a": [1.0, 2, np.nan],
+            "t": pd.to_datetime(["2020", None, "2021"]),
+            "b": [True, False, True],
+        }
+    )
+    summary = data_summary(data, by="g").summary_data
+    assert summary.shape[0] == 6
+    assert summary.loc[("x", "a"), "Nulls"] == 1
+    assert summary.loc[("x", "t"), "Unique"] == 2
+    assert summary.loc[("x", "b"), "Top Frequency"] == 2
+    null_group = summary.xs(np.nan, level=0)
+    assert list(null_group["Unique"]) == [1, 0, 1]
+
+
+@pytest.mark.base
+def test_grouped_summary_errors(data):
+    with pytest.raises(ValueError):
+        data_summary(data, by="missing")
+    with pytest.raises(ValueError):
+        data_summary(data, by="d", top_k=1)
+    with pytest.raises(ValueError):
+        data_summary(iter([data]), by="d")
+
+
+@pytest.mark.base
+def test_memory_estimate():
+    np.random.seed(22)
+    data = pd.DataFrame(
+        {
+            "s": np.random.choice(["alpha", "beta", "gamma"], 5000),
+            "u": [str(i) * np.random.randint(1, 5) for i in range(5000)],
+            "i": np.random.randint(0, 100, 5000),
+            "j": np.random.randint(0, 200, 5000),
+            "k": np.random.randint(-1, 200, 5000),
+            "f": np.random.normal(size=5000),
+        }
+    )
+    summary = data_summary(data)
+    memory_data = summary.memory_data
+    deep = data.memory_usage(deep=True, index=False)
+    error = (memory_data["Memory"] - deep).abs()
+    assert (error <= memory_data["Error"]).all()
+    assert memory_data.loc["i", "Error"] == 0
+    assert memory_data.loc["s", "Suggested Type"] == "category"
+    assert memory_data.loc["u", "Suggested Type"] is None
+    assert memory_data.loc["i", "Suggested Type"] == np.uint8
+    assert memory_data.loc["i", "Savings"] == 5000 * 7
+    assert memory_data.loc["j", "Suggested Type"] == np.uint8
+    assert memory_data.loc["k", "Suggested Type"] == np.int16
+    assert memory_data.loc["f", "Suggested Type"] is None
+    assert "\u00b1" in summary.info_data.loc["Size in Memory", "Info"]
+
+
+@pytest.mark.base
+def test_modin_exact_summary(data):
+    mpd = pytest.importorskip("modin.pandas")
+    data = data.assign(g=np.arange(data.shape[0]) % 7)
+    expected = data_summary(data, top_k=2, percentiles=True)
+    with dd.config.update_context(
+        {"summary.heavy_hitters_capacity": 3, "summary.modin_exact": True}
+    ):
+        summary = data_summary(mpd.DataFrame(data), top_k=2, percentiles=True)
+    columns = ["Nulls", "Zeros", "Median", "Unique", "Top Frequency", "p5", "p95"]
+    pd.testing.assert_frame_equal(
+        summary.summary_data[columns].astype(float),
+        expected.summary_data[columns].astype(float),
+    )
+    pd.testing.assert_frame_equal(summary.top_values, expected.top_values)
+    assert summary.accumulator.columns["a"].frequencies.counts.size <= 3
+
+
+@pytest.mark.base
+def test_modin_summary_single_job(data, monkeypatch):
+    mpd = pytest.importorskip("modin.pandas")
+
+    def _second_job(*args, **kwargs):
+        raise AssertionError("Exact statistics need the summary.modin_exact option")
+
+    monkeypatch.setattr(
+        "data_describe.core.summary._modin_exact_statistics", _second_job
+    )
+    summary = data_summary(mpd.DataFrame(data), top_k=2, percentiles=True)
+    expected = data_summary(data, top_k=2, percentiles=True)
+    assert summary.summary_data.loc["a", "Unique"] == data["a"].nunique()
+    pd.testing.assert_frame_equal(
+        summary.top_values.loc[["d", "e"]], expected.top_values.loc[["d", "e"]]
+    )